@@ -15,7 +15,7 @@ sys.path.insert(0, project_root)
 
 # Import your models
 from src.database import Base
-from src.models import User, Memo, Alarm, AlarmHistory, TelegramLinkingCode
+from src.models import User, Memo, Alarm, AlarmHistory, AlarmHistoryDaily, TelegramLinkingCode, ImportJob
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,132 @@
+"""Partition alarm_history by month and add daily summaries
+
+Revision ID: 5b2e9c1d7a40
+Revises: 39ff3f059969
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2e9c1d7a40'
+down_revision = '39ff3f059969'
+branch_labels = None
+depends_on = None
+
+# Months of partitions to create past the current month
+PARTITIONS_AHEAD = 2
+
+
+def _add_months(month_start: date, months: int) -> date:
+    year, month = divmod(month_start.month - 1 + months, 12)
+    return date(month_start.year + year, month + 1, 1)
+
+
+def _partition_alarm_history() -> None:
+    """Rebuild alarm_history as a monthly range-partitioned table (PostgreSQL)."""
+    bind = op.get_bind()
+
+    op.execute("ALTER TABLE alarm_history RENAME TO alarm_history_legacy")
+    op.execute("""
+        CREATE TABLE alarm_history (
+            id INTEGER NOT NULL DEFAULT nextval('alarm_history_id_seq'),
+            alarm_id INTEGER NOT NULL REFERENCES alarms (id) ON DELETE CASCADE,
+            triggered_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            delivery_status VARCHAR(20) NOT NULL,
+            error_message VARCHAR(500),
+            retry_count INTEGER NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, triggered_at)
+        ) PARTITION BY RANGE (triggered_at)
+    """)
+    op.execute("ALTER SEQUENCE alarm_history_id_seq OWNED BY alarm_history.id")
+
+    # Catch-all for rows outside the pre-created months
+    op.execute("CREATE TABLE alarm_history_default PARTITION OF alarm_history DEFAULT")
+
+    oldest = bind.execute(sa.text("SELECT min(triggered_at) FROM alarm_history_legacy")).scalar()
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    start = oldest.date().replace(day=1) if oldest else current
+    last = _add_months(current, PARTITIONS_AHEAD)
+    while start <= last:
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE alarm_history_p{start:%Y%m} PARTITION OF alarm_history "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+    op.execute("""
+        INSERT INTO alarm_history (id, alarm_id, triggered_at, delivery_status, error_message, retry_count, created_at)
+        SELECT id, alarm_id, triggered_at, delivery_status, error_message, retry_count, created_at
+        FROM alarm_history_legacy
+    """)
+    op.execute("DROP TABLE alarm_history_legacy")
+
+    op.create_index('idx_alarm_history_alarm_id', 'alarm_history', ['alarm_id'], unique=False)
+    op.create_index('idx_alarm_history_triggered_at', 'alarm_history', ['triggered_at'], unique=False)
+
+
+def _unpartition_alarm_history() -> None:
+    """Rebuild alarm_history as a plain table (PostgreSQL)."""
+    op.execute("ALTER TABLE alarm_history RENAME TO alarm_history_partitioned")
+    op.execute("""
+        CREATE TABLE alarm_history (
+            id INTEGER NOT NULL DEFAULT nextval('alarm_history_id_seq') PRIMARY KEY,
+            alarm_id INTEGER NOT NULL REFERENCES alarms (id) ON DELETE CASCADE,
+            triggered_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            delivery_status VARCHAR(20) NOT NULL,
+            error_message VARCHAR(500),
+            retry_count INTEGER NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+        )
+    """)
+    op.execute("ALTER SEQUENCE alarm_history_id_seq OWNED BY alarm_history.id")
+    op.execute("""
+        INSERT INTO alarm_history (id, alarm_id, triggered_at, delivery_status, error_message, retry_count, created_at)
+        SELECT id, alarm_id, triggered_at, delivery_status, error_message, retry_count, created_at
+        FROM alarm_history_partitioned
+    """)
+    op.execute("DROP TABLE alarm_history_partitioned")
+
+    op.create_index('idx_alarm_history_alarm_id', 'alarm_history', ['alarm_id'], unique=False)
+    op.create_index(op.f('ix_alarm_history_alarm_id'), 'alarm_history', ['alarm_id'], unique=False)
+    op.create_index(op.f('ix_alarm_history_id'), 'alarm_history', ['id'], unique=False)
+
+
+def upgrade() -> None:
+    op.create_table('alarm_history_daily',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('alarm_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('sent_count', sa.Integer(), nullable=False),
+    sa.Column('failed_count', sa.Integer(), nullable=False),
+    sa.Column('pending_count', sa.Integer(), nullable=False),
+    sa.Column('retry_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['alarm_id'], ['alarms.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('alarm_id', 'day', name='uq_alarm_history_daily_alarm_day')
+    )
+    op.create_index('idx_alarm_history_daily_day', 'alarm_history_daily', ['day'], unique=False)
+    op.create_index(op.f('ix_alarm_history_daily_id'), 'alarm_history_daily', ['id'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        _partition_alarm_history()
+    else:
+        # SQLite keeps a single table; retention deletes by triggered_at range
+        op.create_index('idx_alarm_history_triggered_at', 'alarm_history', ['triggered_at'], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _unpartition_alarm_history()
+    else:
+        op.drop_index('idx_alarm_history_triggered_at', table_name='alarm_history')
+
+    op.drop_index(op.f('ix_alarm_history_daily_id'), table_name='alarm_history_daily')
+    op.drop_index('idx_alarm_history_daily_day', table_name='alarm_history_daily')
+    op.drop_table('alarm_history_daily')
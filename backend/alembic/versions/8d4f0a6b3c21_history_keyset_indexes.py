@@ -0,0 +1,42 @@
+"""Keyset indexes on alarm_history and denormalized user_id
+
+Revision ID: 8d4f0a6b3c21
+Revises: 5b2e9c1d7a40
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4f0a6b3c21'
+down_revision = '5b2e9c1d7a40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('alarm_history', sa.Column('user_id', sa.Integer(), nullable=True))
+
+    # Backfill the memo owner for existing rows
+    op.execute("""
+        UPDATE alarm_history SET user_id = (
+            SELECT memos.user_id FROM alarms
+            JOIN memos ON memos.id = alarms.memo_id
+            WHERE alarms.id = alarm_history.alarm_id
+        )
+    """)
+
+    # (alarm_id, triggered_at, id) covers the old alarm_id-only index
+    op.drop_index('idx_alarm_history_alarm_id', table_name='alarm_history')
+    op.create_index('idx_alarm_history_alarm_triggered', 'alarm_history', ['alarm_id', 'triggered_at', 'id'], unique=False)
+    op.create_index('idx_alarm_history_user_triggered', 'alarm_history', ['user_id', 'triggered_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alarm_history_user_triggered', table_name='alarm_history')
+    op.drop_index('idx_alarm_history_alarm_triggered', table_name='alarm_history')
+    op.create_index('idx_alarm_history_alarm_id', 'alarm_history', ['alarm_id'], unique=False)
+    with op.batch_alter_table('alarm_history', schema=None) as batch_op:
+        batch_op.drop_column('user_id')
@@ -0,0 +1,43 @@
+"""Add import_jobs table
+
+Revision ID: a9d3c5e7f102
+Revises: f4c6a8b0d217
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d3c5e7f102'
+down_revision = 'f4c6a8b0d217'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('import_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('records_processed', sa.Integer(), nullable=False),
+    sa.Column('memos_created', sa.Integer(), nullable=False),
+    sa.Column('alarms_created', sa.Integer(), nullable=False),
+    sa.Column('records_rejected', sa.Integer(), nullable=False),
+    sa.Column('error_samples', sa.Text(), nullable=True),
+    sa.Column('error_message', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_import_job_user_id', 'import_jobs', ['user_id'], unique=False)
+    op.create_index(op.f('ix_import_jobs_id'), 'import_jobs', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_import_jobs_id'), table_name='import_jobs')
+    op.drop_index('idx_import_job_user_id', table_name='import_jobs')
+    op.drop_table('import_jobs')
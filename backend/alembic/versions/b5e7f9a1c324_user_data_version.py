@@ -0,0 +1,25 @@
+"""Add per-user data_version for ETags
+
+Revision ID: b5e7f9a1c324
+Revises: a9d3c5e7f102
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e7f9a1c324'
+down_revision = 'a9d3c5e7f102'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
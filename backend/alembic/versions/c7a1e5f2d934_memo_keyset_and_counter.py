@@ -0,0 +1,36 @@
+"""Memo keyset index and per-user memo counter
+
+Revision ID: c7a1e5f2d934
+Revises: 8d4f0a6b3c21
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a1e5f2d934'
+down_revision = '8d4f0a6b3c21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('memo_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute("""
+        UPDATE users SET memo_count = (
+            SELECT count(*) FROM memos WHERE memos.user_id = users.id
+        )
+    """)
+
+    # (user_id, created_at, id) covers the old user_id-only index
+    op.drop_index('idx_memo_user_id', table_name='memos')
+    op.create_index('idx_memo_user_created', 'memos', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_memo_user_created', table_name='memos')
+    op.create_index('idx_memo_user_id', 'memos', ['user_id'], unique=False)
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('memo_count')
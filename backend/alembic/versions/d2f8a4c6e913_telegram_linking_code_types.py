@@ -0,0 +1,40 @@
+"""Type telegram_linking_codes.user_id as integer and index expires_at
+
+Revision ID: d2f8a4c6e913
+Revises: b5e7f9a1c324
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f8a4c6e913'
+down_revision = 'b5e7f9a1c324'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # user_id references users.id, so it must be an integer for the redeem join
+    with op.batch_alter_table('telegram_linking_codes', schema=None) as batch_op:
+        batch_op.alter_column(
+            'user_id',
+            existing_type=sa.String(length=255),
+            type_=sa.Integer(),
+            existing_nullable=False,
+            postgresql_using='user_id::integer'
+        )
+    op.create_index('idx_telegram_expires_at', 'telegram_linking_codes', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_telegram_expires_at', table_name='telegram_linking_codes')
+    with op.batch_alter_table('telegram_linking_codes', schema=None) as batch_op:
+        batch_op.alter_column(
+            'user_id',
+            existing_type=sa.Integer(),
+            type_=sa.String(length=255),
+            existing_nullable=False
+        )
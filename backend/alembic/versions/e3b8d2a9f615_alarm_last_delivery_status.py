@@ -0,0 +1,35 @@
+"""Add last_delivery_status to alarms
+
+Revision ID: e3b8d2a9f615
+Revises: c7a1e5f2d934
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8d2a9f615'
+down_revision = 'c7a1e5f2d934'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('alarms', sa.Column('last_delivery_status', sa.String(length=20), nullable=True))
+
+    # Backfill from each alarm's most recent history row
+    op.execute("""
+        UPDATE alarms SET last_delivery_status = (
+            SELECT h.delivery_status FROM alarm_history h
+            WHERE h.alarm_id = alarms.id
+            ORDER BY h.triggered_at DESC, h.id DESC
+            LIMIT 1
+        )
+    """)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('alarms', schema=None) as batch_op:
+        batch_op.drop_column('last_delivery_status')
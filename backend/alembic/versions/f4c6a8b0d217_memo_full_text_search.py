@@ -0,0 +1,43 @@
+"""Full-text search index over memos
+
+Revision ID: f4c6a8b0d217
+Revises: e3b8d2a9f615
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4c6a8b0d217'
+down_revision = 'e3b8d2a9f615'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # Generated column: PostgreSQL keeps it in sync on every write
+        op.execute("""
+            ALTER TABLE memos ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX idx_memo_search_vector ON memos USING GIN (search_vector)")
+    else:
+        # FTS5 table maintained by MemoService
+        op.execute("CREATE VIRTUAL TABLE memos_fts USING fts5(title, description, owner, tokenize='unicode61')")
+        op.execute("""
+            INSERT INTO memos_fts (rowid, title, description, owner)
+            SELECT id, title, coalesce(description, ''), 'u' || user_id FROM memos
+        """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX idx_memo_search_vector")
+        op.execute("ALTER TABLE memos DROP COLUMN search_vector")
+    else:
+        op.execute("DROP TABLE memos_fts")
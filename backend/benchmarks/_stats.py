@@ -0,0 +1,34 @@
+"""Small helpers shared by the benchmark scripts."""
+
+from typing import Dict, Sequence
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize_ms(samples_s: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/max in milliseconds for durations given in seconds."""
+    values = sorted(s * 1000 for s in samples_s)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 50),
+        "p95_ms": percentile(values, 95),
+        "p99_ms": percentile(values, 99),
+        "max_ms": values[-1] if values else 0.0,
+    }
+
+
+def format_row(name: str, stats: Dict[str, float]) -> str:
+    """One aligned line of a latency table."""
+    return (
+        f"{name:<28}{stats['count']:>8}{stats['p50_ms']:>10.2f}"
+        f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['max_ms']:>10.2f}"
+    )
+
+
+HEADER = f"{'case':<28}{'n':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
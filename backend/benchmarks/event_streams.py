@@ -0,0 +1,111 @@
+"""Memory cost of idle event streams (GET /api/v1/events).
+
+Serves the app with uvicorn in a subprocess (see benchmarks.load_test),
+opens ``--streams`` Server-Sent Events connections for seeded users, waits
+for every stream's first heartbeat, and reports the server's resident
+memory before and after, per open stream.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.event_streams --streams 2000
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+def rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def open_stream(port: int, token: str, ready: list):
+    """Minimal SSE client: send the request, wait for a heartbeat, then idle."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET /api/v1/events HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {token}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        if line.startswith(b": ping"):
+            ready.append(1)
+            break
+    try:
+        while await reader.readline():
+            pass
+    finally:
+        writer.close()
+
+
+async def run(port: int, pid: int, args) -> None:
+    import httpx
+    from benchmarks.seed import PASSWORD, email_for
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}") as http:
+        tokens = []
+        for user_id in range(1, args.users + 1):
+            response = await http.post("/api/v1/auth/login", json={"email": email_for(user_id), "password": PASSWORD})
+            tokens.append(response.json()["access_token"])
+
+    before = rss_kib(pid)
+    ready: list = []
+    t0 = time.perf_counter()
+    tasks = [
+        asyncio.create_task(open_stream(port, tokens[i % len(tokens)], ready)) for i in range(args.streams)
+    ]
+    deadline = time.monotonic() + args.heartbeat * 3 + 30
+    while len(ready) < args.streams and time.monotonic() < deadline:
+        await asyncio.sleep(0.2)
+    after = rss_kib(pid)
+    print(f"open streams: {len(ready)}/{args.streams} (all heartbeating after {time.perf_counter() - t0:.1f}s)")
+    print(f"server RSS: {before / 1024:.1f} MiB -> {after / 1024:.1f} MiB")
+    if ready:
+        print(f"per stream: {(after - before) / len(ready):.1f} KiB")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--heartbeat", type=float, default=2.0, help="EVENTS_HEARTBEAT_SECONDS for the server")
+    args = parser.parse_args()
+
+    from benchmarks.load_test import free_port, start_server
+    from benchmarks.seed import seed_database
+
+    tmp = tempfile.TemporaryDirectory()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tmp.name}/event_streams.db",
+        BCRYPT_ROUNDS="4",
+        EVENTS_HEARTBEAT_SECONDS=str(args.heartbeat),
+        LOG_LEVEL="WARNING",
+    )
+    os.environ.update(env)
+    seed_database(users=args.users, memos_per_user=1, history_per_alarm=0)
+
+    port = free_port()
+    server = start_server(port, env, workers=1)
+    try:
+        asyncio.run(run(port, server.pid, args))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
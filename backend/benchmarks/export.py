@@ -0,0 +1,92 @@
+"""Memory and throughput benchmark for streaming exports.
+
+Seeds synthetic memos, then consumes ExportService.stream for growing
+prefixes of the table and reports rows/s and the tracemalloc peak. With
+streaming the peak should stay flat as the row count grows.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.export --memos 1000000
+    python -m benchmarks.export --database-url postgresql://... --memos 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+CHUNK = 10000
+
+
+def seed(start: int, stop: int) -> None:
+    """Insert memos with ids in [start, stop) in large multi-row batches."""
+    from sqlalchemy import insert
+    from src.database import SessionLocal
+    from src.models import Memo
+
+    db = SessionLocal()
+    try:
+        for chunk_start in range(start, stop, CHUNK):
+            db.execute(insert(Memo), [
+                {"user_id": 1, "title": f"memo {i}", "description": "lorem ipsum dolor sit amet " * 4}
+                for i in range(chunk_start, min(stop, chunk_start + CHUNK))
+            ])
+            db.commit()
+    finally:
+        db.close()
+
+
+def measure(fmt: str) -> tuple:
+    """Stream all memos; return (seconds, bytes written, peak traced bytes)."""
+    from src.database import SessionLocal
+    from src.services.export_service import ExportService
+
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        written = sum(len(chunk) for chunk in ExportService.stream(db, "memos", fmt, user_id=1))
+        elapsed = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        db.close()
+    return elapsed, written, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memos", type=int, default=200_000)
+    parser.add_argument("--database-url", default=None, help="defaults to a throwaway SQLite file")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tmp.name}/export.db"
+
+    from sqlalchemy import insert
+    from src.database import SessionLocal, init_db
+    from src.models import User
+
+    init_db()
+    db = SessionLocal()
+    db.execute(insert(User), [{"id": 1, "email": "bench@example.com", "password_hash": "", "timezone": "UTC"}])
+    db.commit()
+    db.close()
+
+    print(f"{'format':<8}{'rows':>10}{'rows/s':>12}{'MB out':>10}{'peak MB':>10}")
+    seeded = 0
+    for rows in (args.memos // 100, args.memos // 10, args.memos):
+        if rows <= seeded:
+            continue
+        seed(seeded, rows)
+        seeded = rows
+        for fmt in ("ndjson", "csv"):
+            elapsed, written, peak = measure(fmt)
+            print(f"{fmt:<8}{rows:>10}{rows / elapsed:>12.0f}{written / 1e6:>10.1f}{peak / 1e6:>10.2f}")
+
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Before/after benchmark for GitHub OAuth login against the local stub.
+
+Compares, per login (private profile email, so all three GitHub calls
+are needed):
+
+* ``per-login client``: a new httpx.AsyncClient per login and sequential
+  calls (the previous path);
+* ``pooled``: the /api/v1/auth/github route with the shared client and
+  concurrent /user + /user/emails.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.github_login --logins 200 --delay-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+async def per_login_client(base_url: str, code: str) -> str:
+    """The previous flow: fresh client, three sequential calls."""
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        token = (await client.post(
+            f"{base_url}/login/oauth/access_token",
+            headers={"Accept": "application/json"},
+            data={"client_id": "bench", "client_secret": "bench", "code": code},
+        )).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        user = (await client.get(f"{base_url}/user", headers=headers)).json()
+        if not user.get("email"):
+            return (await client.get(f"{base_url}/user/emails", headers=headers)).json()[0]["email"]
+        return user["email"]
+
+
+async def run(args, base_url: str) -> None:
+    import httpx
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+    from src.database import init_db
+    from src.main import app
+    from src.utils.http_client import create_http_client
+
+    init_db()
+    app.state.http_client = create_http_client()
+
+    async def time_logins(login) -> list:
+        samples = []
+        for i in range(args.logins):
+            t0 = time.perf_counter()
+            await login(f"private{i % 20}")
+            samples.append(time.perf_counter() - t0)
+        return samples
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as api:
+        async def pooled(code: str) -> None:
+            response = await api.post("/api/v1/auth/github", json={"code": code})
+            response.raise_for_status()
+
+        print(HEADER)
+        print(format_row("per-login client", summarize_ms(await time_logins(lambda c: per_login_client(base_url, c)))))
+        print(format_row("pooled", summarize_ms(await time_logins(pooled))))
+
+    await app.state.http_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=20.0, help="stub latency per GitHub call")
+    args = parser.parse_args()
+
+    from benchmarks.github_stub import start_stub
+
+    server, base_url = start_stub(delay=args.delay_ms / 1000)
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{tmp.name}/github_login.db",
+        "GITHUB_CLIENT_ID": "bench",
+        "GITHUB_CLIENT_SECRET": "bench",
+        "GITHUB_OAUTH_URL": base_url,
+        "GITHUB_API_URL": base_url,
+    })
+    print(f"stub {base_url}, {args.delay_ms} ms per call")
+    asyncio.run(run(args, base_url))
+    server.shutdown()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
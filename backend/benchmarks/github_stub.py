@@ -0,0 +1,97 @@
+"""Local stand-in for the GitHub OAuth and user APIs.
+
+Serves the three endpoints github_login calls, with an optional delay per
+request to mimic network latency:
+
+* ``POST /login/oauth/access_token``: any code except ``bad`` gets a token;
+* ``GET /user``: a user whose profile email is private for codes starting
+  with ``private``;
+* ``GET /user/emails``: a verified primary email.
+
+Point the backend at it with ``GITHUB_OAUTH_URL`` and ``GITHUB_API_URL``
+set to the printed URL. Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.github_stub --port 8765 --delay-ms 50
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import parse_qs
+import argparse
+import json
+import threading
+import time
+
+
+class GitHubStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients can reuse connections
+    # Send headers and body in one segment; otherwise Nagle plus delayed
+    # ACKs add ~40 ms per response
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def _send(self, status: int, body) -> None:
+        time.sleep(self.delay)
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _token(self) -> str:
+        return self.headers.get("Authorization", "").removeprefix("Bearer ")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode())
+        code = form.get("code", [""])[0]
+        if self.path != "/login/oauth/access_token":
+            return self._send(404, {"message": "Not Found"})
+        if code == "bad":
+            return self._send(200, {"error": "bad_verification_code"})
+        return self._send(200, {"access_token": f"stub-{code}", "token_type": "bearer"})
+
+    def do_GET(self):
+        token = self._token()
+        if not token.startswith("stub-"):
+            return self._send(401, {"message": "Bad credentials"})
+        login = token.removeprefix("stub-")
+        email = f"{login}@users.example.com"
+        if self.path == "/user":
+            public_email = None if login.startswith("private") else email
+            return self._send(200, {"id": abs(hash(login)) % 10**8, "login": login, "email": public_email})
+        if self.path == "/user/emails":
+            return self._send(200, [{"email": email, "primary": True, "verified": True}])
+        return self._send(404, {"message": "Not Found"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(port: int = 0, delay: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub on a background thread; returns the server and its base URL."""
+    handler = type("Handler", (GitHubStubHandler,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, url = start_stub(args.port, args.delay_ms / 1000)
+    print(f"GitHub stub listening on {url} (GITHUB_OAUTH_URL={url} GITHUB_API_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Before/after benchmark for bearer token verification.
+
+Compares, per request:
+
+* ``decode``: full ``jose.jwt.decode`` with signature and expiry checks
+  (the previous path);
+* ``cached hit``: ``verify_token`` for a token verified before;
+* ``cached, N tokens``: ``verify_token`` cycling through N distinct tokens,
+  as with many polling clients (misses once N exceeds the cache size).
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.jwt_verify --runs 20000
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+
+def time_runs(fn, runs: int) -> list:
+    samples = []
+    for i in range(runs):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20000)
+    args = parser.parse_args()
+
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+    from src.utils.security import create_access_token, decode_token, token_cache, verify_token
+
+    def tokens(count: int) -> list:
+        return [
+            create_access_token({"sub": f"user{i}@example.com", "user_id": i}, timedelta(hours=1))
+            for i in range(count)
+        ]
+
+    def report(name: str, samples: list) -> None:
+        # Per-call times are in the microseconds, so show the mean as well
+        print(format_row(name, summarize_ms(samples)) + f"{sum(samples) / len(samples) * 1e6:>10.1f}")
+
+    token = tokens(1)[0]
+    print(f"cache size: {token_cache.max_entries}")
+    print(HEADER + f"{'mean us':>10}")
+    report("decode", time_runs(lambda i: decode_token(token), args.runs))
+    verify_token(token)
+    report("cached hit", time_runs(lambda i: verify_token(token), args.runs))
+    for count in (100, token_cache.max_entries * 2):
+        token_cache.clear()
+        pool = tokens(count)
+        report(f"cached, {count} tokens", time_runs(lambda i: verify_token(pool[i % count]), args.runs))
+
+
+if __name__ == "__main__":
+    main()
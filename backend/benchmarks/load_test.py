@@ -0,0 +1,299 @@
+"""Load test: concurrent clients against a locally served app.
+
+Seeds a temporary SQLite database (see benchmarks.seed), serves the app
+with uvicorn in a subprocess on localhost, and runs ``--concurrency``
+clients for ``--duration`` seconds. Each client logs in as one seeded
+user, then picks operations from a weighted mix:
+
+* ``list``: GET /api/v1/memos (first page);
+* ``toggle``: PATCH /api/v1/alarms/{id} flipping ``enabled``;
+* ``create``: POST /api/v1/memos;
+* ``login``: POST /api/v1/auth/login.
+
+Operation choices are seeded, so runs with the same arguments send the
+same request sequence per client. Samples from the first ``--warmup``
+seconds are discarded. The per-operation throughput and latency
+percentiles can be saved as a JSON baseline and compared on another
+branch::
+
+    python -m benchmarks.load_test --mix read --save baseline.json
+    git checkout my-branch
+    python -m benchmarks.load_test --mix read --compare baseline.json
+
+Compare runs made on the same machine with the same arguments (a
+mismatch is reported). Run from the ``backend`` directory. No external
+services are needed; Telegram is not configured, so nothing is sent.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Mix operation -> Client method
+OPERATIONS = {"list": "list_memos", "toggle": "toggle_alarm", "create": "create_memo", "login": "login"}
+
+MIXES = {
+    "read": {"list": 80, "toggle": 10, "create": 5, "login": 5},
+    "write": {"list": 40, "toggle": 30, "create": 25, "login": 5},
+}
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """A named mix, or weights such as "list=70,toggle=20,create=10"."""
+    if spec in MIXES:
+        return MIXES[spec]
+    mix = {}
+    for item in spec.split(","):
+        name, weight = item.split("=", 1)
+        if name.strip() not in OPERATIONS:
+            raise SystemExit(f"Unknown operation: {name}")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, env: Dict[str, str], workers: int) -> subprocess.Popen:
+    """Serve src.main:app with uvicorn and wait until /health answers."""
+    import httpx
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"Server exited with status {server.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("Server did not start within 30s")
+
+
+class Client:
+    """One simulated user: its token, its alarms and the operations it runs."""
+
+    def __init__(self, http, user_id: int, rng: random.Random):
+        self.http = http
+        self.user_id = user_id
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+        self.alarms: Dict[int, bool] = {}
+        self.created = 0
+
+    async def login(self):
+        from benchmarks.seed import PASSWORD, email_for
+
+        response = await self.http.post(
+            "/api/v1/auth/login", json={"email": email_for(self.user_id), "password": PASSWORD}
+        )
+        if response.status_code == 200:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return response
+
+    async def setup(self) -> None:
+        (await self.login()).raise_for_status()
+        response = await self.http.get(
+            "/api/v1/memos", params={"include": "alarms", "limit": 100}, headers=self.headers
+        )
+        response.raise_for_status()
+        self.alarms = {
+            alarm["id"]: alarm["enabled"] for memo in response.json()["items"] for alarm in memo["alarms"]
+        }
+
+    async def list_memos(self):
+        return await self.http.get("/api/v1/memos", params={"limit": 20}, headers=self.headers)
+
+    async def toggle_alarm(self):
+        alarm_id = self.rng.choice(list(self.alarms))
+        self.alarms[alarm_id] = not self.alarms[alarm_id]
+        return await self.http.patch(
+            f"/api/v1/alarms/{alarm_id}", json={"enabled": self.alarms[alarm_id]}, headers=self.headers
+        )
+
+    async def create_memo(self):
+        self.created += 1
+        return await self.http.post("/api/v1/memos", headers=self.headers, json={
+            "title": f"load test {self.user_id}-{self.created}",
+            "description": "created by benchmarks.load_test",
+        })
+
+
+async def run_clients(base_url: str, args, mix: Dict[str, int]) -> Dict[str, Dict]:
+    """Run the clients; returns latency samples and error counts per operation."""
+    import httpx
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    ops, weights = list(mix), list(mix.values())
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as http:
+        clients = [
+            Client(http, i % args.users + 1, random.Random(f"{args.seed}:{i}")) for i in range(args.concurrency)
+        ]
+        await asyncio.gather(*(client.setup() for client in clients))
+
+        start = time.monotonic()
+        measure_from = start + args.warmup
+        stop_at = measure_from + args.duration
+
+        async def drive(client: Client) -> None:
+            while True:
+                t0 = time.monotonic()
+                if t0 >= stop_at:
+                    return
+                op = client.rng.choices(ops, weights)[0]
+                if op == "toggle" and not client.alarms:
+                    continue
+                try:
+                    response = await getattr(client, OPERATIONS[op])()
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                if t0 >= measure_from:
+                    samples[op].append(time.monotonic() - t0)
+                    errors[op] += failed
+
+        await asyncio.gather(*(drive(client) for client in clients))
+    return {"samples": samples, "errors": errors}
+
+
+def summarize(results: Dict, seconds: float) -> Dict[str, Dict]:
+    from benchmarks._stats import summarize_ms
+
+    summary = {}
+    all_samples = []
+    for op, samples in sorted(results["samples"].items()):
+        all_samples.extend(samples)
+        summary[op] = dict(
+            summarize_ms(samples), rps=len(samples) / seconds, errors=results["errors"][op]
+        )
+    summary["all"] = dict(
+        summarize_ms(all_samples), rps=len(all_samples) / seconds, errors=sum(results["errors"].values())
+    )
+    return summary
+
+
+def print_summary(summary: Dict[str, Dict]) -> None:
+    from benchmarks._stats import HEADER, format_row
+
+    print(f"{HEADER}{'req/s':>10}{'errors':>8}")
+    for op, stats in summary.items():
+        print(f"{format_row(op, stats)}{stats['rps']:>10.1f}{stats['errors']:>8}")
+
+
+def print_comparison(summary: Dict[str, Dict], baseline: Dict) -> None:
+    """Change against the baseline per operation (latency down / throughput up is better)."""
+    def change(new: float, old: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"\nvs baseline ({baseline.get('git', 'unknown')}):")
+    print(f"{'case':<28}{'p50':>10}{'p95':>10}{'p99':>10}{'req/s':>10}")
+    for op, stats in summary.items():
+        old = baseline["results"].get(op)
+        if old is None:
+            continue
+        print(
+            f"{op:<28}{change(stats['p50_ms'], old['p50_ms']):>10}{change(stats['p95_ms'], old['p95_ms']):>10}"
+            f"{change(stats['p99_ms'], old['p99_ms']):>10}{change(stats['rps'], old['rps']):>10}"
+        )
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100, help="seeded users")
+    parser.add_argument("--memos-per-user", type=int, default=50)
+    parser.add_argument("--history-per-alarm", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=20, help="simulated clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds discarded at the start")
+    parser.add_argument("--mix", default="read", help=f"{' | '.join(MIXES)} | op=weight,...")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4,
+                        help="cost of the seeded password hash (the app default is 12)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare the results with this JSON baseline")
+    args = parser.parse_args()
+    mix = parse_mix(args.mix)
+
+    tmp = tempfile.TemporaryDirectory()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{tmp.name}/load_test.db",
+        BCRYPT_ROUNDS=str(args.bcrypt_rounds),
+        TELEGRAM_BOT_TOKEN="",
+        LOG_LEVEL="WARNING",
+    )
+    os.environ.update(env)
+
+    from benchmarks.seed import seed_database
+
+    counts = seed_database(args.users, args.memos_per_user, 1, args.history_per_alarm, args.seed)
+    print("Seeded", ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+    port = free_port()
+    server = start_server(port, env, args.workers)
+    try:
+        results = asyncio.run(run_clients(f"http://127.0.0.1:{port}", args, mix))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        tmp.cleanup()
+
+    summary = summarize(results, args.duration)
+    print(f"mix {mix}, {args.concurrency} clients, {args.duration:g}s")
+    print_summary(summary)
+
+    config = {
+        key: getattr(args, key)
+        for key in ("users", "memos_per_user", "history_per_alarm", "concurrency", "duration", "workers",
+                    "bcrypt_rounds", "seed")
+    }
+    config["mix"] = mix
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("config") != config:
+            print("\nwarning: baseline was recorded with different settings:", baseline.get("config"))
+        print_comparison(summary, baseline)
+    if args.save:
+        Path(args.save).write_text(json.dumps(
+            {"git": git_revision(), "config": config, "results": summary}, indent=2
+        ))
+        print(f"\nSaved baseline to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Caller-side cost of a log call: direct file handler vs the logging queue.
+
+Measures how long ``logger.info`` blocks the calling thread (for example
+the event loop) with:
+
+* ``direct``: a RotatingFileHandler attached to the logger (the previous setup);
+* ``queue``: src.utils.logging's queue handler, text and JSON output;
+* ``queue, sampled 10%``: the same with LOG_SAMPLING keeping 1 in 10.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.logging_overhead --records 50000
+"""
+
+import argparse
+import logging
+import logging.handlers
+import queue
+import tempfile
+import time
+from pathlib import Path
+
+
+def time_calls(logger: logging.Logger, records: int) -> list:
+    samples = []
+    for i in range(records):
+        t0 = time.perf_counter()
+        logger.info("Alarm %s processed: %s", i, "sent")
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50000)
+    args = parser.parse_args()
+
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+    from src.utils.logging import (
+        DATE_FORMAT, TEXT_FORMAT, BoundedQueueHandler, JsonFormatter, SamplingFilter,
+    )
+
+    tmp = tempfile.TemporaryDirectory()
+
+    def file_handler(name: str, formatter: logging.Formatter) -> logging.Handler:
+        handler = logging.handlers.RotatingFileHandler(Path(tmp.name) / name, maxBytes=10 * 1024 * 1024, backupCount=1)
+        handler.setFormatter(formatter)
+        return handler
+
+    def run(name: str, handler: logging.Handler, listener=None) -> None:
+        logger = logging.getLogger(f"bench.{name}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        if listener:
+            listener.start()
+        samples = time_calls(logger, args.records)
+        if listener:
+            listener.stop()
+        stats = summarize_ms(samples)
+        print(format_row(name, stats) + f"{sum(samples) / len(samples) * 1e6:>10.2f}")
+
+    text = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+    print(HEADER + f"{'mean us':>10}")
+    run("direct", file_handler("direct.log", text))
+    for name, formatter, rate in (
+        ("queue", text, None),
+        ("queue, json", JsonFormatter(), None),
+        ("queue, sampled 10%", text, 0.1),
+    ):
+        handler = BoundedQueueHandler(queue.Queue(100000), "block")
+        if rate is not None:
+            handler.addFilter(SamplingFilter({"bench": rate}))
+        listener = logging.handlers.QueueListener(handler.queue, file_handler(f"{name}.log", formatter))
+        run(name, handler, listener)
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Latency benchmark for password verification under concurrent logins.
+
+Fires bursts of concurrent logins at one event loop, with a probe task
+that measures how late the loop runs a 10 ms timer (what every other
+request on the worker would feel). It compares:
+
+* ``inline``: ``verify_password`` called on the event loop (the previous path);
+* ``pool``: ``verify_password_async`` through the bounded password pool.
+  Logins over the pool's limit are rejected (429 in the API) and counted.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.password_hashing --logins 32 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+
+async def probe_loop_lag(stop: asyncio.Event, samples: list, interval: float = 0.01) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - t0 - interval))
+
+
+async def burst(login, count: int) -> tuple:
+    stop = asyncio.Event()
+    lag = []
+    probe = asyncio.create_task(probe_loop_lag(stop, lag))
+    await asyncio.sleep(0.05)
+
+    # Latency counts from the start of the burst, as all logins arrive together
+    t0 = time.perf_counter()
+
+    async def timed():
+        ok = await login()
+        return ok, time.perf_counter() - t0
+
+    results = await asyncio.gather(*(timed() for _ in range(count)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await probe
+    return results, lag, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="concurrent logins per burst")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    args = parser.parse_args()
+
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+    from src.utils.password_pool import PasswordPoolBusy, create_password_pool
+    from src.utils.security import hash_password, verify_password
+
+    hashed = hash_password("correct horse battery staple")
+    pool = create_password_pool(args.executor, args.workers, args.max_pending)
+
+    async def inline_login():
+        return verify_password("correct horse battery staple", hashed)
+
+    async def pool_login():
+        try:
+            future = pool.submit(verify_password, "correct horse battery staple", hashed)
+        except PasswordPoolBusy:
+            return None
+        return await asyncio.wrap_future(future)
+
+    print(f"rounds={args.rounds} logins={args.logins} executor={args.executor} "
+          f"workers={args.workers} max_pending={pool.max_pending}")
+    print(HEADER + f"{'429s':>8}{'wall s':>10}")
+    for name, login in (("inline", inline_login), ("pool", pool_login)):
+        results, lag, elapsed = asyncio.run(burst(login, args.logins))
+        served = [seconds for ok, seconds in results if ok is not None]
+        rejected = sum(1 for ok, _ in results if ok is None)
+        print(format_row(f"{name}: login", summarize_ms(served)) + f"{rejected:>8}{elapsed:>10.2f}")
+        print(format_row(f"{name}: loop lag", summarize_ms(lag or [0.0])))
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Query budgets for the hot service paths.
+
+Runs each path once against a seeded SQLite database inside
+src.utils.query_stats.query_budget and fails (exit status 1, listing the
+statements) when a path runs more queries than its budget. Budgets are
+per call with cold caches, except the scheduler tick, which is allowed a
+fixed part plus a per-alarm part; checking it at two sizes catches
+per-row lazy loads.
+
+The same cases run under pytest (tests/integration/test_query_budgets.py).
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.query_budgets
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+
+def seed(memos: int, due_alarms: int) -> None:
+    """One linked user with memos (an alarm each), some alarms due now, and history."""
+    from sqlalchemy import insert
+    from src.database import SessionLocal, init_db
+    from src.models import Alarm, AlarmHistory, Memo, User
+
+    init_db()
+    db = SessionLocal()
+    now = datetime.now(timezone.utc)
+    db.execute(insert(User), [{
+        "id": 1, "email": "budget@example.com", "password_hash": "", "timezone": "UTC",
+        "telegram_chat_id": "1", "memo_count": memos
+    }])
+    db.execute(insert(Memo), [
+        {"id": i, "user_id": 1, "title": f"memo {i}", "description": "budget"} for i in range(1, memos + 1)
+    ])
+    db.execute(insert(Alarm), [
+        {"id": i, "memo_id": i, "scheduled_time": "09:00", "recurrence_type": "daily", "user_timezone": "UTC",
+         "next_trigger_time": now - timedelta(minutes=1) if i <= due_alarms else now + timedelta(days=1)}
+        for i in range(1, memos + 1)
+    ])
+    db.execute(insert(AlarmHistory), [
+        {"alarm_id": 1, "user_id": 1, "triggered_at": now, "delivery_status": "sent", "retry_count": 0}
+        for _ in range(100)
+    ])
+    db.commit()
+    db.close()
+
+
+def cases(due_alarms: int):
+    """(name, budget, fn(db)) for each checked path."""
+    from src.schemas import AlarmUpdate
+    from src.services.alarm_service import AlarmService
+    from src.services.history_service import HistoryService
+    from src.services.memo_service import MemoService
+    from src.services.scheduler_service import AlarmSchedulerService
+    from src.services.user_service import UserService
+
+    def memo_list_request(db, include_alarms):
+        # check_etag's lookup, then the page with the total it read
+        _, total = UserService.get_version_and_count(db, 1)
+        return MemoService.get_memo_page(db, 1, limit=50, include_alarms=include_alarms, total=total)
+
+    return [
+        ("list memos", 1, lambda db: MemoService.list_memos(db, 1, limit=50)),
+        ("list memos + alarms", 2, lambda db: MemoService.list_memos(db, 1, limit=50, include_alarms=True)),
+        ("memo list request", 2, lambda db: memo_list_request(db, False)),
+        ("memo list request + alarms", 3, lambda db: memo_list_request(db, True)),
+        ("memo detail", 1, lambda db: MemoService.get_memo_data(db, 1, 1)),
+        ("owned alarm", 1, lambda db: AlarmService.get_owned_alarm(db, 1, 1)),
+        ("update alarm", 3, lambda db: AlarmService.update_alarm(db, 2, 1, AlarmUpdate(scheduled_time="10:00"))),
+        ("history page", 1, lambda db: HistoryService.list_for_user(db, 1, None, 50)),
+        ("alarm history page", 2, lambda db: (
+            HistoryService.user_owns_alarm(db, 1, 1) and HistoryService.list_for_alarm(db, 1, None, 50)
+        )),
+        # Fixed: due alarms and recipients. Per alarm: history insert, data
+        # version and alarm update (nothing is reloaded after each commit)
+        (f"scheduler tick ({due_alarms} due)", 2 + 3 * due_alarms,
+         lambda db: AlarmSchedulerService.check_due_alarms(db)),
+    ]
+
+
+def run_case(name, budget, fn) -> bool:
+    from src.database import SessionLocal
+    from src.services.user_service import get_profile_cache
+    from src.utils.cache import get_cache
+    from src.utils.query_stats import QueryBudgetExceeded, query_budget
+
+    # Budgets are for cold caches
+    get_cache().invalidate_all()
+    get_profile_cache().clear()
+    db = SessionLocal()
+    try:
+        with query_budget(budget) as counter:
+            fn(db)
+    except QueryBudgetExceeded as e:
+        print(f"{name:<28}{counter.count:>8}{budget:>8}  FAIL\n{e}")
+        return False
+    finally:
+        db.close()
+    print(f"{name:<28}{counter.count:>8}{budget:>8}  ok")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp.name}/query_budgets.db"
+
+    print(f"{'case':<28}{'queries':>8}{'budget':>8}")
+    ok = True
+    for due in (10, 40):
+        seed(memos=60, due_alarms=due)
+        for name, budget, fn in cases(due):
+            ok = run_case(name, budget, fn) and ok
+        os.remove(f"{tmp.name}/query_budgets.db")
+    tmp.cleanup()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Scheduler simulation on a virtual clock against a fake Telegram API.
+
+Seeds a temporary SQLite database with ``--alarms`` recurring alarms
+(daily, weekly and monthly at random times, ``--linked`` of the users
+with a Telegram chat) and replays ``--days`` of scheduling from a fixed
+start. Instead of sleeping, the clock jumps to the next scheduler tick
+(every ``--tick-seconds``) that has a due alarm, and
+AlarmSchedulerService.check_due_alarms runs with that time as ``now``.
+Messages go to benchmarks.telegram_stub with the given latency, error
+rate and 429 rate.
+
+Reports:
+
+* dispatch lag: virtual time from an alarm's trigger time to the end of
+  its processing (tick granularity plus the wall time spent earlier in
+  the same tick, which is what delays alarms in production);
+* messages per second and the fake server's outcomes;
+* database statements per fired alarm;
+* peak RSS of the process.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.scheduler_sim --alarms 1000 --days 7 --latency-ms 20
+"""
+
+import argparse
+import logging
+import os
+import random
+import resource
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+RECURRENCES = {"daily": None, "weekly": "[0, 2, 4]", "monthly": "[1, 15]"}
+
+
+def _utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes; they are UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def seed(alarms: int, users: int, linked: float, rng: random.Random, batch_size: int = 10000) -> None:
+    """One memo per alarm, spread over the users; next triggers computed from START."""
+    from sqlalchemy import insert
+    from src.database import SessionLocal, init_db
+    from src.models import Alarm, Memo, User
+    from src.utils.recurrence import calculate_next_trigger_times
+
+    init_db()
+    db = SessionLocal()
+    db.execute(insert(User), [
+        {"id": i, "email": f"sim{i}@example.com", "password_hash": "", "timezone": "UTC",
+         "telegram_chat_id": str(10**6 + i) if rng.random() < linked else None}
+        for i in range(1, users + 1)
+    ])
+    for first in range(1, alarms + 1, batch_size):
+        ids = range(first, min(first + batch_size, alarms + 1))
+        patterns = []
+        for _ in ids:
+            recurrence = rng.choices(list(RECURRENCES), weights=(6, 3, 1))[0]
+            patterns.append((f"{rng.randrange(24):02d}:{rng.randrange(0, 60, 5):02d}", recurrence,
+                             RECURRENCES[recurrence], "UTC"))
+        next_triggers = calculate_next_trigger_times(patterns, now=START)
+        db.execute(insert(Memo), [
+            {"id": i, "user_id": (i - 1) % users + 1, "title": f"alarm {i}", "description": "simulated"}
+            for i in ids
+        ])
+        db.execute(insert(Alarm), [
+            {"id": i, "memo_id": i, "scheduled_time": p[0], "recurrence_type": p[1], "recurrence_days": p[2],
+             "user_timezone": p[3], "next_trigger_time": t}
+            for i, p, t in zip(ids, patterns, next_triggers)
+        ])
+    db.commit()
+    db.close()
+
+
+def simulate(days: float, tick_seconds: int):
+    """Run the scheduler over the virtual span; returns (lags in seconds, ticks, statements, wall seconds)."""
+    from sqlalchemy import func, select
+    from src.database import SessionLocal
+    from src.models import Alarm
+    from src.services.scheduler_service import AlarmSchedulerService
+    from src.utils.query_stats import track_queries
+
+    step = timedelta(seconds=tick_seconds)
+    end = START + timedelta(days=days)
+    lags = []
+    tick_wall_start = 0.0
+    process_alarm = AlarmSchedulerService.process_alarm
+
+    # Measure each alarm's lag around the real processing
+    def timed_process_alarm(db, alarm, recipient=None, now=None):
+        due = _utc(alarm.next_trigger_time)
+        result = process_alarm(db, alarm, recipient, now)
+        lags.append((now - due).total_seconds() + time.perf_counter() - tick_wall_start)
+        return result
+
+    AlarmSchedulerService.process_alarm = staticmethod(timed_process_alarm)
+    db = SessionLocal()
+    ticks = 0
+    wall = 0.0
+    now = START
+    try:
+        with track_queries() as queries:
+            while True:
+                next_due = db.scalar(select(func.min(Alarm.next_trigger_time)).where(Alarm.enabled == True))
+                if next_due is None:
+                    break
+                # First tick at or after the next trigger, on the tick grid
+                steps = -((START - _utc(next_due)) // step)
+                now = max(START + steps * step, now + step)
+                if now > end:
+                    break
+                tick_wall_start = time.perf_counter()
+                AlarmSchedulerService.check_due_alarms(db, now=now)
+                wall += time.perf_counter() - tick_wall_start
+                ticks += 1
+    finally:
+        AlarmSchedulerService.process_alarm = staticmethod(process_alarm)
+        db.close()
+    return lags, ticks, queries.count, wall
+
+
+def delivery_statuses() -> Counter:
+    from sqlalchemy import func, select
+    from src.database import SessionLocal
+    from src.models import AlarmHistory
+
+    db = SessionLocal()
+    try:
+        return Counter(dict(db.execute(
+            select(AlarmHistory.delivery_status, func.count()).group_by(AlarmHistory.delivery_status)
+        ).all()))
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alarms", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--linked", type=float, default=0.9, help="fraction of users with a Telegram chat")
+    parser.add_argument("--days", type=float, default=7.0, help="virtual time to replay")
+    parser.add_argument("--tick-seconds", type=int, default=60, help="scheduler interval")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fake Telegram latency per message")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="fraction of sends answered 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.01, help="fraction of sends answered 429")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from benchmarks.telegram_stub import start_stub
+
+    server, url = start_stub(
+        delay=args.latency_ms / 1000, error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=args.seed
+    )
+    tmp = tempfile.TemporaryDirectory()
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{tmp.name}/scheduler_sim.db",
+        "TELEGRAM_BOT_TOKEN": "123456:simulation",
+        "TELEGRAM_API_URL": url,
+    })
+    # Failed sends are expected here; keep per-alarm errors off the console
+    logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    from benchmarks._stats import percentile
+
+    t0 = time.perf_counter()
+    seed(args.alarms, args.users, args.linked, random.Random(args.seed))
+    print(f"Seeded {args.alarms} alarms for {args.users} users in {time.perf_counter() - t0:.1f}s")
+
+    lags, ticks, statements, wall = simulate(args.days, args.tick_seconds)
+    lags.sort()
+    fired = len(lags)
+    stub = dict(server.stats)
+    server.shutdown()
+
+    print(f"Replayed {args.days:g} days in {wall:.1f}s wall ({args.days * 86400 / max(wall, 1e-9):,.0f}x real time)")
+    print(f"ticks with due alarms: {ticks}, alarms fired: {fired}")
+    if fired:
+        print("dispatch lag (s): " + ", ".join(
+            f"p{p} {percentile(lags, p):.2f}" for p in (50, 95, 99)
+        ) + f", max {lags[-1]:.2f}")
+        print(f"alarms/s: {fired / wall:.1f}, messages/s: {sum(stub.values()) / wall:.1f}")
+        print(f"DB statements per alarm: {statements / fired:.2f}")
+    print(f"Telegram fake: {stub}")
+    print(f"delivery status: {dict(delivery_statuses())}")
+    print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
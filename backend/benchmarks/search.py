@@ -0,0 +1,115 @@
+"""Latency benchmark for full-text memo search.
+
+Seeds a database with synthetic memos (1M by default) using multi-row
+inserts, builds the search index, then times MemoSearchService.search for
+random users and terms.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.search --memos 1000000 --users 1000
+    python -m benchmarks.search --database-url postgresql://... --memos 1000000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+WORDS = (
+    "meeting report invoice groceries doctor dentist birthday flight hotel "
+    "payment rent gym yoga lecture deadline review release deploy backup "
+    "garden laundry pharmacy insurance passport visa taxes budget coffee "
+    "dinner lunch breakfast project sprint retro standup interview call "
+    "email letter parcel delivery car service bike train ticket concert"
+).split()
+
+CHUNK = 10000
+
+
+def seed(database_url: str, users: int, memos: int, rng: random.Random) -> None:
+    """Insert users and memos in large multi-row batches."""
+    from sqlalchemy import insert
+    from src.database import SessionLocal, init_db
+    from src.models import Memo, User
+    from src.services.search_service import MemoSearchService
+
+    init_db()
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [
+            {"id": i, "email": f"bench{i}@example.com", "password_hash": "", "timezone": "UTC"}
+            for i in range(1, users + 1)
+        ])
+        db.commit()
+
+        for start in range(0, memos, CHUNK):
+            rows = []
+            for _ in range(min(CHUNK, memos - start)):
+                rows.append({
+                    "user_id": rng.randint(1, users),
+                    "title": " ".join(rng.choices(WORDS, k=3)),
+                    "description": " ".join(rng.choices(WORDS, k=12)),
+                })
+            db.execute(insert(Memo), rows)
+            db.commit()
+
+        # Builds the index over all existing memos in one statement
+        MemoSearchService.ensure_index(db)
+    finally:
+        db.close()
+
+
+def run_queries(users: int, queries: int, rng: random.Random) -> dict:
+    """Time single- and two-term searches."""
+    from src.database import SessionLocal
+    from src.services.search_service import MemoSearchService
+
+    samples = {"one term": [], "two terms": [], "one term, page 5": []}
+    db = SessionLocal()
+    try:
+        for _ in range(queries):
+            user_id = rng.randint(1, users)
+            cases = (
+                ("one term", rng.choice(WORDS), 0),
+                ("two terms", " ".join(rng.sample(WORDS, 2)), 0),
+                ("one term, page 5", rng.choice(WORDS), 80),
+            )
+            for name, q, skip in cases:
+                t0 = time.perf_counter()
+                MemoSearchService.search(db, user_id, q, skip=skip, limit=20)
+                samples[name].append(time.perf_counter() - t0)
+    finally:
+        db.close()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--memos", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="defaults to a throwaway SQLite file")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tmp.name}/search.db"
+    rng = random.Random(args.seed)
+
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+
+    t0 = time.perf_counter()
+    seed(os.environ["DATABASE_URL"], args.users, args.memos, rng)
+    print(f"seeded {args.memos} memos for {args.users} users in {time.perf_counter() - t0:.1f}s")
+
+    samples = run_queries(args.users, args.queries, rng)
+    print(HEADER)
+    for name, values in samples.items():
+        print(format_row(name, summarize_ms(values)))
+
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
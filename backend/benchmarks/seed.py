@@ -0,0 +1,154 @@
+"""Synthetic data seeder for benchmarks and load tests.
+
+Fills an empty database with users, memos, alarms and alarm history using
+multi-row inserts in batches, deterministically for a given ``--seed``.
+Every user is ``load<N>@example.com`` with password ``loadtest1``; alarms
+are scheduled in the future so the scheduler leaves them alone.
+
+Usage (from the ``backend`` directory, against ``DATABASE_URL``)::
+
+    python -m benchmarks.seed --users 200 --memos-per-user 50
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List
+
+PASSWORD = "loadtest1"
+RECURRENCES = {"daily": None, "weekly": "[0, 2, 4]", "monthly": "[1, 15]"}
+STATUSES = ("sent", "sent", "sent", "failed", "pending")
+WORDS = (
+    "groceries call dentist invoice review deploy backup renew passport team standup "
+    "water plants pay rent gym laundry birthday gift meeting notes report budget"
+).split()
+
+
+def email_for(user_id: int) -> str:
+    return f"load{user_id}@example.com"
+
+
+def _batches(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def seed_database(
+    users: int = 100,
+    memos_per_user: int = 50,
+    alarms_per_memo: int = 1,
+    history_per_alarm: int = 5,
+    seed: int = 0,
+    batch_size: int = 5000,
+) -> Dict[str, int]:
+    """Seed an empty database and return the number of rows per table."""
+    from sqlalchemy import func, insert, select
+    from src.database import SessionLocal, init_db
+    from src.models import Alarm, AlarmHistory, Memo, User
+    from src.services.search_service import MemoSearchService
+    from src.utils.security import hash_password
+
+    init_db()
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    # One bcrypt hash shared by every user (hashing is the slow part otherwise)
+    password_hash = hash_password(PASSWORD)
+
+    db = SessionLocal()
+    try:
+        if db.scalar(select(func.count()).select_from(User)):
+            raise SystemExit("Database already has users; seed an empty database")
+
+        def memo_rows():
+            for memo_id in range(1, users * memos_per_user + 1):
+                yield {
+                    "id": memo_id,
+                    "user_id": (memo_id - 1) // memos_per_user + 1,
+                    "title": " ".join(rng.choices(WORDS, k=3)),
+                    "description": " ".join(rng.choices(WORDS, k=rng.randint(0, 20))) or None,
+                    "created_at": now - timedelta(minutes=memo_id),
+                }
+
+        def alarm_rows():
+            for alarm_id in range(1, users * memos_per_user * alarms_per_memo + 1):
+                recurrence = rng.choices(list(RECURRENCES), weights=(6, 3, 1))[0]
+                yield {
+                    "id": alarm_id,
+                    "memo_id": (alarm_id - 1) // alarms_per_memo + 1,
+                    "scheduled_time": f"{rng.randrange(24):02d}:{rng.randrange(0, 60, 5):02d}",
+                    "recurrence_type": recurrence,
+                    "recurrence_days": RECURRENCES[recurrence],
+                    "user_timezone": "UTC",
+                    "enabled": rng.random() < 0.9,
+                    "next_trigger_time": now + timedelta(minutes=rng.randint(60, 60 * 24 * 7)),
+                }
+
+        def history_rows():
+            for alarm_id in range(1, users * memos_per_user * alarms_per_memo + 1):
+                user_id = (alarm_id - 1) // (memos_per_user * alarms_per_memo) + 1
+                for _ in range(history_per_alarm):
+                    status = rng.choice(STATUSES)
+                    yield {
+                        "alarm_id": alarm_id,
+                        "user_id": user_id,
+                        "triggered_at": now - timedelta(minutes=rng.randint(1, 60 * 24 * 30)),
+                        "delivery_status": status,
+                        "error_message": "timeout" if status == "failed" else None,
+                        "retry_count": 0,
+                    }
+
+        user_rows = (
+            {
+                "id": user_id,
+                "email": email_for(user_id),
+                "password_hash": password_hash,
+                "timezone": "UTC",
+                "memo_count": memos_per_user,
+            }
+            for user_id in range(1, users + 1)
+        )
+        counts = {}
+        for name, model, rows in (
+            ("users", User, user_rows),
+            ("memos", Memo, memo_rows()),
+            ("alarms", Alarm, alarm_rows()),
+            ("alarm_history", AlarmHistory, history_rows()),
+        ):
+            counts[name] = 0
+            for batch in _batches(rows, batch_size):
+                db.execute(insert(model), batch)
+                counts[name] += len(batch)
+        db.commit()
+
+        # Builds the SQLite full-text index from the seeded memos
+        MemoSearchService.ensure_index(db)
+    finally:
+        db.close()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--memos-per-user", type=int, default=50)
+    parser.add_argument("--alarms-per-memo", type=int, default=1)
+    parser.add_argument("--history-per-alarm", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    counts = seed_database(
+        args.users, args.memos_per_user, args.alarms_per_memo, args.history_per_alarm, args.seed
+    )
+    print(", ".join(f"{count} {name}" for name, count in counts.items()), f"in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
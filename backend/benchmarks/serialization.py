@@ -0,0 +1,108 @@
+"""Before/after benchmark for response serialization.
+
+Compares, per page of ORM rows:
+
+* ``pydantic + json``: the default path (validate each row into its
+  response schema, dump to JSON-mode dicts, encode with the stdlib);
+* ``direct + orjson``: src.schemas.serializers dicts encoded by
+  src.utils.serialization (orjson when installed);
+* ``direct + msgpack``: the same dicts as MessagePack.
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.serialization --runs 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+
+def load_rows(count: int):
+    """Seed memos (two alarms each) and history rows, then load them as the API does."""
+    from sqlalchemy import insert
+    from sqlalchemy.orm import selectinload
+    from src.database import SessionLocal, init_db
+    from src.models import Alarm, AlarmHistory, Memo, User
+
+    init_db()
+    db = SessionLocal()
+    now = datetime.now(timezone.utc)
+    db.execute(insert(User), [{"id": 1, "email": "bench@example.com", "password_hash": "", "timezone": "UTC"}])
+    db.execute(insert(Memo), [
+        {"id": i, "user_id": 1, "title": f"memo {i}", "description": "lorem ipsum " * 8}
+        for i in range(1, count + 1)
+    ])
+    db.execute(insert(Alarm), [
+        {"memo_id": i, "scheduled_time": "09:00", "recurrence_type": "daily", "user_timezone": "UTC",
+         "next_trigger_time": now + timedelta(days=k), "last_triggered": now, "last_delivery_status": "sent"}
+        for i in range(1, count + 1) for k in range(2)
+    ])
+    db.execute(insert(AlarmHistory), [
+        {"alarm_id": 1, "user_id": 1, "triggered_at": now, "delivery_status": "sent", "retry_count": 0}
+        for _ in range(count)
+    ])
+    db.commit()
+    memos = db.query(Memo).options(selectinload(Memo.alarms)).order_by(Memo.id).all()
+    history = db.query(AlarmHistory).order_by(AlarmHistory.id).all()
+    return db, memos, history
+
+
+def time_runs(fn, runs: int) -> list:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp.name}/serialization.db"
+
+    from benchmarks._stats import HEADER, format_row, summarize_ms
+    from src.schemas import AlarmHistoryPage, MemoPage, MemoWithAlarmsResponse
+    from src.schemas.serializers import history_to_dict, memo_with_alarms_to_dict
+    from src.utils.serialization import MSGPACK_AVAILABLE, ORJSON_AVAILABLE, dumps, msgpack_dumps
+
+    print(f"orjson: {ORJSON_AVAILABLE}, msgpack: {MSGPACK_AVAILABLE}")
+    print(HEADER)
+    db, all_memos, all_history = load_rows(1000)
+    for size in (50, 100, 1000):
+        memos = all_memos[:size]
+        history = all_history[:size]
+        cases = {
+            f"memos+alarms {size}: pydantic": lambda: json.dumps(MemoPage(
+                items=[MemoWithAlarmsResponse.model_validate(m) for m in memos], total=size
+            ).model_dump(mode="json")).encode(),
+            f"memos+alarms {size}: direct": lambda: dumps(
+                {"items": [memo_with_alarms_to_dict(m) for m in memos], "total": size, "next_cursor": None}
+            ),
+            f"history {size}: pydantic": lambda: json.dumps(AlarmHistoryPage.model_validate(
+                {"items": history}, from_attributes=True
+            ).model_dump(mode="json")).encode(),
+            f"history {size}: direct": lambda: dumps(
+                {"items": [history_to_dict(h) for h in history], "next_cursor": None}
+            ),
+        }
+        if MSGPACK_AVAILABLE:
+            cases[f"memos+alarms {size}: msgpack"] = lambda: msgpack_dumps(
+                {"items": [memo_with_alarms_to_dict(m) for m in memos], "total": size, "next_cursor": None}
+            )
+        for name, fn in cases.items():
+            print(format_row(name, summarize_ms(time_runs(fn, args.runs))))
+
+    db.close()
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
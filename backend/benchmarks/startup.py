@@ -0,0 +1,73 @@
+"""Cold-start benchmark for the API process.
+
+Each run happens in a fresh interpreter so nothing is cached between runs.
+Three phases are timed:
+
+- import: ``import src.main``
+- create_app: building the FastAPI application
+- first_request: lifespan startup plus the first ``GET /health``
+
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+import src.main
+t1 = time.perf_counter()
+app = src.main.create_app()
+t2 = time.perf_counter()
+from fastapi.testclient import TestClient  # test harness only, not timed
+t3 = time.perf_counter()
+with TestClient(app) as client:
+    client.get("/health")
+    t4 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "create_app": t2 - t1, "first_request": t4 - t3}))
+"""
+
+
+def run_once(database_url: str) -> dict:
+    """Time one cold start in a fresh interpreter."""
+    env = dict(os.environ, DATABASE_URL=database_url)
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=None, help="defaults to a throwaway SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/startup.db"
+        samples = [run_once(database_url) for _ in range(args.runs)]
+
+    print(f"{'phase':<14}{'median ms':>12}{'max ms':>12}")
+    for phase in ("import", "create_app", "first_request"):
+        values = [s[phase] * 1000 for s in samples]
+        print(f"{phase:<14}{statistics.median(values):>12.1f}{max(values):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
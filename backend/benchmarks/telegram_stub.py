@@ -0,0 +1,120 @@
+"""Local fake of the Telegram Bot API's sendMessage.
+
+Answers ``POST /bot<token>/sendMessage`` like Telegram does, after an
+optional delay, and injects failures at configurable rates:
+
+* ``--error-rate``: 500 Internal Server Error;
+* ``--rate-limit-rate``: 429 Too Many Requests with ``retry_after``.
+
+Failures are drawn from a seeded generator, so a run is repeatable.
+Counts per outcome are kept in ``server.stats``. Point the backend at it
+with ``TELEGRAM_API_URL`` set to the printed URL (any bot token works).
+Usage (from the ``backend`` directory)::
+
+    python -m benchmarks.telegram_stub --port 8766 --delay-ms 30 --rate-limit-rate 0.01
+"""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import parse_qs
+import argparse
+import json
+import random
+import threading
+import time
+
+
+class TelegramStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # One segment per response; see github_stub
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def _send(self, status: int, body) -> None:
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _params(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length).decode()
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(raw or "{}")
+        # python-telegram-bot posts form-encoded parameters
+        return {name: values[0] for name, values in parse_qs(raw).items()}
+
+    def do_POST(self):
+        server = self.server
+        params = self._params()
+        time.sleep(server.delay)
+        if not self.path.endswith("/sendMessage"):
+            return self._send(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+
+        with server.lock:
+            draw = server.rng.random()
+        if draw < server.rate_limit_rate:
+            outcome = "rate_limited"
+            self._send(429, {
+                "ok": False, "error_code": 429, "description": "Too Many Requests: retry after 1",
+                "parameters": {"retry_after": 1},
+            })
+        elif draw < server.rate_limit_rate + server.error_rate:
+            outcome = "error"
+            self._send(500, {"ok": False, "error_code": 500, "description": "Internal Server Error"})
+        else:
+            outcome = "sent"
+            with server.lock:
+                message_id = server.stats["sent"] + 1
+            self._send(200, {"ok": True, "result": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": int(params.get("chat_id", 0)), "type": "private"},
+                "text": params.get("text", ""),
+            }})
+        with server.lock:
+            server.stats[outcome] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(
+    port: int = 0, delay: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0, seed: int = 0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the fake on a background thread; returns the server and its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), TelegramStubHandler)
+    server.daemon_threads = True
+    server.delay = delay
+    server.error_rate = error_rate
+    server.rate_limit_rate = rate_limit_rate
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.stats = Counter()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, url = start_stub(args.port, args.delay_ms / 1000, args.error_rate, args.rate_limit_rate, args.seed)
+    print(f"Telegram stub listening on {url} (TELEGRAM_API_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    print(dict(server.stats))
+
+
+if __name__ == "__main__":
+    main()
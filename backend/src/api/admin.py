@@ -0,0 +1,27 @@
+"""Operational admin endpoints."""
+
+from fastapi import APIRouter, Depends, Request
+from src.middleware.auth import require_admin
+from src.utils.cache import get_cache
+from src.utils.events import get_broker
+
+router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+
+
+@router.get("/cache")
+async def get_cache_stats(current_user: dict = Depends(require_admin)):
+    """Read cache backend, size and hit/miss counters for this process."""
+    return get_cache().info()
+
+
+@router.get("/latency")
+async def get_route_latency(request: Request, current_user: dict = Depends(require_admin)):
+    """Rolling per-route latency for this process (p50/p95/p99 and mean time per phase)."""
+    stats = request.app.state.route_stats
+    return {"window": stats.window, "routes": stats.summary()}
+
+
+@router.get("/events")
+async def get_event_stats(current_user: dict = Depends(require_admin)):
+    """Open event streams and publish/drop counters for this process."""
+    return get_broker().info()
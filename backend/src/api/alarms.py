@@ -4,9 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 from src.database import get_db
-from src.schemas import AlarmCreate, AlarmUpdate, AlarmResponse
-from src.services.alarm_service import AlarmService
-from src.services.memo_service import MemoService
+from src.schemas import AlarmCreate, AlarmUpdate, AlarmResponse, AlarmBulkCreate, AlarmBulkUpdate, BulkDelete, BulkResult
+from src.services.alarm_service import AlarmService, InvalidAlarmError
 from src.middleware.auth import get_current_user
 
 router = APIRouter(prefix="/api/v1/alarms", tags=["Alarms"])
@@ -19,17 +18,48 @@ async def create_alarm(
     db: Session = Depends(get_db)
 ):
     """Create an alarm for a memo."""
-    # Verify user owns the memo
-    memo = MemoService.get_memo(db, alarm_data.memo_id, current_user["user_id"])
-    if not memo:
-        raise HTTPException(status_code=404, detail="Memo not found")
-    
-    alarm = AlarmService.create_alarm(db, alarm_data)
+    try:
+        alarm = AlarmService.create_alarm(db, current_user["user_id"], alarm_data)
+    except InvalidAlarmError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not alarm:
-        raise HTTPException(status_code=400, detail="Failed to create alarm")
+        raise HTTPException(status_code=404, detail="Memo not found")
     return alarm
 
 
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_alarms(
+    payload: AlarmBulkCreate,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create many alarms in one transaction."""
+    ids, errors = AlarmService.bulk_create_alarms(db, current_user["user_id"], payload.items)
+    return {"succeeded": ids, "failed": errors}
+
+
+@router.patch("/bulk", response_model=BulkResult)
+async def bulk_update_alarms(
+    payload: AlarmBulkUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update many alarms in one transaction."""
+    ids, errors = AlarmService.bulk_update_alarms(db, current_user["user_id"], payload.items)
+    return {"succeeded": ids, "failed": errors}
+
+
+@router.post("/bulk-delete", response_model=BulkResult)
+async def bulk_delete_alarms(
+    payload: BulkDelete,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete many alarms and their history in one transaction."""
+    ids, errors = AlarmService.bulk_delete_alarms(db, current_user["user_id"], payload.ids)
+    return {"succeeded": ids, "failed": errors}
+
+
 @router.patch("/{alarm_id}", response_model=AlarmResponse)
 async def update_alarm(
     alarm_id: int,
@@ -38,16 +68,12 @@ async def update_alarm(
     db: Session = Depends(get_db)
 ):
     """Update an alarm."""
-    alarm = AlarmService.get_alarm(db, alarm_id)
-    if not alarm:
-        raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    # Verify user owns the memo
-    memo = MemoService.get_memo(db, alarm.memo_id, current_user["user_id"])
-    if not memo:
+    try:
+        updated = AlarmService.update_alarm(db, alarm_id, current_user["user_id"], alarm_data)
+    except InvalidAlarmError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not updated:
         raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    updated = AlarmService.update_alarm(db, alarm_id, alarm_data)
     return updated
 
 
@@ -58,14 +84,6 @@ async def delete_alarm(
     db: Session = Depends(get_db)
 ):
     """Delete an alarm."""
-    alarm = AlarmService.get_alarm(db, alarm_id)
-    if not alarm:
-        raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    # Verify user owns the memo
-    memo = MemoService.get_memo(db, alarm.memo_id, current_user["user_id"])
-    if not memo:
+    if not AlarmService.delete_alarm(db, alarm_id, current_user["user_id"]):
         raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    AlarmService.delete_alarm(db, alarm_id)
     return None
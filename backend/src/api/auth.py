@@ -2,16 +2,22 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
+from src.config import settings
 from src.database import get_db
 from src.schemas import UserCreate, UserLogin, UserResponse, TokenResponse
-from src.utils.security import hash_password, verify_password, create_access_token
+from src.utils.password_pool import PasswordPoolBusy, hash_password_async, verify_password_async
+from src.utils.security import create_access_token
 from src.models import User
-import httpx
+from src.services.user_service import UserService
+from src.utils.http_client import get_http_client
+import asyncio
+import logging
 import os
 from pydantic import BaseModel
 from typing import Any, Optional
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
+logger = logging.getLogger(__name__)
 
 
 class GitHubAuthRequest(BaseModel):
@@ -26,18 +32,30 @@ class GitHubAuthResponse(BaseModel):
     user: UserResponse
 
 
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many concurrent sign-ins, please retry shortly",
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/register", response_model=UserResponse)
 async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
     # Check if user exists
-    existing = db.query(User).filter(User.email == user_data.email).first()
+    existing = UserService.get_profile_by_email(db, user_data.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Create new user
+    # Create new user (bcrypt runs in the password pool, off the event loop)
+    try:
+        password_hash = await hash_password_async(user_data.password)
+    except PasswordPoolBusy:
+        raise _busy()
     user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=password_hash,
         timezone=user_data.timezone
     )
     db.add(user)
@@ -49,8 +67,14 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", response_model=TokenResponse)
 async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Login user and return JWT token."""
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.password_hash):
+    user = UserService.get_user_by_email(db, credentials.email)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    try:
+        valid = await verify_password_async(credentials.password, user.password_hash)
+    except PasswordPoolBusy:
+        raise _busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     # Create access token
@@ -63,12 +87,42 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     }
 
 
+def _pick_github_email(emails: Any) -> Optional[str]:
+    """Best email candidate from GitHub's /user/emails response."""
+    if not isinstance(emails, list):
+        return None
+
+    def pick_email(predicate) -> Optional[str]:
+        for entry in emails:
+            if not isinstance(entry, dict):
+                continue
+            if predicate(entry) and entry.get("email"):
+                return entry["email"]
+        return None
+
+    # Prefer primary+verified first, then any verified, then anything we get.
+    return (
+        pick_email(lambda e: e.get("primary") and e.get("verified"))
+        or pick_email(lambda e: e.get("verified"))
+        or pick_email(lambda e: bool(e.get("email")))
+    )
+
+
 @router.post("/github", response_model=GitHubAuthResponse)
-async def github_login(auth_request: GitHubAuthRequest, db: Session = Depends(get_db)):
+async def github_login(
+    auth_request: GitHubAuthRequest,
+    db: Session = Depends(get_db),
+    client=Depends(get_http_client)
+):
     """
     Authenticate user with GitHub OAuth code.
     Exchange the GitHub OAuth code for an access token and user info.
+
+    Uses the application's pooled HTTP client; `/user` and `/user/emails`
+    are fetched concurrently.
     """
+    import httpx
+
     github_client_id = os.getenv("GITHUB_CLIENT_ID")
     github_client_secret = os.getenv("GITHUB_CLIENT_SECRET")
 
@@ -78,10 +132,10 @@ async def github_login(auth_request: GitHubAuthRequest, db: Session = Depends(ge
             detail="GitHub OAuth not configured"
         )
 
-    # Exchange code for GitHub access token
-    async with httpx.AsyncClient() as client:
+    try:
+        # Exchange code for GitHub access token
         token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
+            f"{settings.GITHUB_OAUTH_URL}/login/oauth/access_token",
             headers={"Accept": "application/json"},
             data={
                 "client_id": github_client_id,
@@ -105,65 +159,39 @@ async def github_login(auth_request: GitHubAuthRequest, db: Session = Depends(ge
                 detail="No access token received from GitHub"
             )
 
-        async def fetch_verified_github_email(access_token: str) -> Optional[str]:
-            """Retrieve the best email candidate from GitHub when profile email is missing."""
-            email_response = await client.get(
-                "https://api.github.com/user/emails",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/json"
-                }
-            )
-
-            if email_response.status_code != 200:
-                return None
-
-            emails: Any = email_response.json()
-            if not isinstance(emails, list):
-                return None
-
-            def pick_email(predicate) -> Optional[str]:
-                for entry in emails:
-                    if not isinstance(entry, dict):
-                        continue
-                    if predicate(entry) and entry.get("email"):
-                        return entry["email"]
-                return None
-
-            # Prefer primary+verified first, then any verified, then anything we get.
-            return (
-                pick_email(lambda e: e.get("primary") and e.get("verified"))
-                or pick_email(lambda e: e.get("verified"))
-                or pick_email(lambda e: bool(e.get("email")))
-            )
-
-        # Get GitHub user info
-        user_response = await client.get(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": f"Bearer {github_access_token}",
-                "Accept": "application/json"
-            }
+        # Get GitHub user info and emails together (emails are only used
+        # when the profile email is private)
+        api_headers = {
+            "Authorization": f"Bearer {github_access_token}",
+            "Accept": "application/json"
+        }
+        user_response, email_response = await asyncio.gather(
+            client.get(f"{settings.GITHUB_API_URL}/user", headers=api_headers),
+            client.get(f"{settings.GITHUB_API_URL}/user/emails", headers=api_headers),
         )
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=504, detail="GitHub did not respond in time")
+    except httpx.HTTPError as e:
+        logger.warning("GitHub request failed: %s", e)
+        raise HTTPException(status_code=502, detail="Failed to reach GitHub")
 
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to fetch GitHub user info"
-            )
+    if user_response.status_code != 200:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to fetch GitHub user info"
+        )
 
-        github_user = user_response.json()
-        github_id = str(github_user["id"])
-        github_login = github_user["login"]
-        github_email = github_user.get("email")
+    github_user = user_response.json()
+    github_login = github_user["login"]
+    github_email = github_user.get("email")
 
-        if not github_email:
-            github_email = await fetch_verified_github_email(github_access_token)
+    if not github_email and email_response.status_code == 200:
+        github_email = _pick_github_email(email_response.json())
 
-        github_email = github_email or f"{github_login}@github.user"
+    github_email = github_email or f"{github_login}@github.user"
 
     # Find or create user
-    user = db.query(User).filter(User.email == github_email).first()
+    user = UserService.get_user_by_email(db, github_email)
 
     if not user:
         # Create new user from GitHub info
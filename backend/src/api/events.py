@@ -0,0 +1,71 @@
+"""Live event stream (Server-Sent Events)."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from src.config import settings
+from src.middleware.auth import get_current_user, get_stream_user
+from src.utils.events import EventBroker, get_broker
+from src.utils.security import STREAM_TICKET_SECONDS, create_stream_ticket
+from typing import AsyncIterator, Optional
+import asyncio
+import time
+
+router = APIRouter(prefix="/api/v1/events", tags=["Events"])
+
+
+async def _event_stream(broker: EventBroker, user_id: int, expires_at: Optional[float]) -> AsyncIterator[bytes]:
+    """Yield SSE frames until the client disconnects, the broker stops or the token expires.
+
+    An idle stream holds no database session and no thread, just this
+    generator and its subscription queue.
+    """
+    subscription = broker.subscribe(user_id)
+    try:
+        # Reconnect delay for EventSource
+        yield b"retry: 5000\n\n"
+        while True:
+            timeout = settings.EVENTS_HEARTBEAT_SECONDS
+            if expires_at is not None:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    # The client reconnects with a ticket for a fresh token
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                data = await asyncio.wait_for(subscription.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            if data is None:
+                return
+            yield b"data: " + data + b"\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.post("/ticket")
+async def create_ticket(current_user: dict = Depends(get_current_user)):
+    """Issue a single-use ticket for opening the stream (`GET /api/v1/events?ticket=`).
+
+    The stream ends when the access token used here expires.
+    """
+    return {
+        "ticket": create_stream_ticket(current_user["user_id"], current_user.get("exp")),
+        "expires_in": STREAM_TICKET_SECONDS,
+    }
+
+
+@router.get("")
+async def stream_events(current_user: dict = Depends(get_stream_user)):
+    """Stream the user's alarm delivery events as Server-Sent Events.
+
+    Browsers authenticate with `?ticket=` from POST /ticket, since
+    EventSource cannot send headers. Each event is a JSON object with a
+    `type`; on `resync` (events were dropped for a slow client) the client
+    should reload its data.
+    """
+    return StreamingResponse(
+        _event_stream(get_broker(), current_user["user_id"], current_user.get("exp")),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,54 @@
+"""Data export API endpoints."""
+
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from src.database import ReplicaSessionLocal, SessionLocal
+from src.middleware.auth import get_current_user, require_admin
+from src.services.export_service import EXPORT_FORMATS, ExportService
+
+router = APIRouter(prefix="/api/v1/export", tags=["Export"])
+
+RESOURCE_PATTERN = "^(memos|alarms|history)$"
+FORMAT_PATTERN = "^(ndjson|csv)$"
+
+
+def _export_response(resource: str, fmt: str, user_id: Optional[int]) -> StreamingResponse:
+    """Stream an export from its own session.
+
+    The session lives as long as the response body is being written rather
+    than the request, and reads from the replica when one is configured.
+    """
+    def body():
+        db = (ReplicaSessionLocal or SessionLocal)()
+        try:
+            yield from ExportService.stream(db, resource, fmt, user_id)
+        finally:
+            db.close()
+
+    scope = f"user{user_id}" if user_id is not None else "all"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{resource}-{scope}.{fmt}"'}
+    )
+
+
+@router.get("/admin/{resource}")
+async def export_all(
+    resource: str = Path(..., pattern=RESOURCE_PATTERN),
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN),
+    current_user: dict = Depends(require_admin)
+):
+    """Export every user's memos, alarms or alarm history (admins only)."""
+    return _export_response(resource, format, None)
+
+
+@router.get("/{resource}")
+async def export_own(
+    resource: str = Path(..., pattern=RESOURCE_PATTERN),
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN),
+    current_user: dict = Depends(get_current_user)
+):
+    """Export the user's memos, alarms or alarm history as NDJSON or CSV."""
+    return _export_response(resource, format, current_user["user_id"])
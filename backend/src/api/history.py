@@ -1,36 +1,58 @@
 """Alarm history API endpoints (Phase 4+)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
-from src.database import get_db
-from src.schemas import AlarmHistoryResponse
+from typing import Optional
+from src.database import get_read_db
+from src.schemas import AlarmHistoryPage
 from src.middleware.auth import get_current_user
-from src.models import AlarmHistory, Alarm, Memo
+from src.middleware.etag import check_etag
+from src.schemas.serializers import history_to_dict
+from src.utils.serialization import fast_response
+from src.services.history_service import HistoryService
+from src.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/api/v1/history", tags=["History"])
 
 
-@router.get("/{alarm_id}", response_model=List[AlarmHistoryResponse])
+@router.get("", response_model=AlarmHistoryPage)
+async def get_history_feed(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    current_user: dict = Depends(get_current_user),
+    cache_headers: dict = Depends(check_etag),
+    db: Session = Depends(get_read_db)
+):
+    """Get history across all of the user's alarms, newest first."""
+    try:
+        items, next_cursor = HistoryService.list_for_user(db, current_user["user_id"], cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    page = {"items": [history_to_dict(item) for item in items], "next_cursor": next_cursor}
+    return fast_response(request, page, headers=cache_headers)
+
+
+@router.get("/{alarm_id}", response_model=AlarmHistoryPage)
 async def get_alarm_history(
+    request: Request,
     alarm_id: int,
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cache_headers: dict = Depends(check_etag),
+    db: Session = Depends(get_read_db)
 ):
-    """Get alarm history with pagination."""
-    alarm = db.query(Alarm).filter(Alarm.id == alarm_id).first()
-    if not alarm:
-        raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    # Verify user owns the memo
-    memo = db.query(Memo).filter(Memo.id == alarm.memo_id, Memo.user_id == current_user["user_id"]).first()
-    if not memo:
+    """Get alarm history with cursor pagination, newest first."""
+    # Verify user owns the alarm's memo
+    if not HistoryService.user_owns_alarm(db, alarm_id, current_user["user_id"]):
         raise HTTPException(status_code=404, detail="Alarm not found")
-    
-    history = db.query(AlarmHistory).filter(
-        AlarmHistory.alarm_id == alarm_id
-    ).offset(skip).limit(limit).all()
-    
-    return history
+
+    try:
+        items, next_cursor = HistoryService.list_for_alarm(db, alarm_id, cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    page = {"items": [history_to_dict(item) for item in items], "next_cursor": next_cursor}
+    return fast_response(request, page, headers=cache_headers)
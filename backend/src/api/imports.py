@@ -0,0 +1,84 @@
+"""Bulk import API endpoints."""
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from src.database import get_db
+from src.schemas import ImportJobResponse
+from src.middleware.auth import get_current_user
+from src.services.import_service import ImportService
+import os
+import tempfile
+
+router = APIRouter(prefix="/api/v1/imports", tags=["Imports"])
+
+
+async def _spool_body(request: Request) -> str:
+    """Write the streamed request body to a temporary file, chunk by chunk."""
+    fd, path = tempfile.mkstemp(prefix="memo-import-")
+    with os.fdopen(fd, "wb") as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+    return path
+
+
+def _run_and_discard(job_id: int, path: str) -> None:
+    try:
+        ImportService.run_file(job_id, path)
+    finally:
+        os.unlink(path)
+
+
+@router.post("", response_model=ImportJobResponse, status_code=202)
+async def start_import(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Import memos and alarms from an NDJSON or CSV request body.
+
+    The body is spooled to disk and imported in the background; poll the
+    returned job for progress.
+    """
+    path = await _spool_body(request)
+    job = ImportService.create_job(db, current_user["user_id"], format)
+    background_tasks.add_task(_run_and_discard, job.id, path)
+    return job
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+async def get_import(
+    job_id: int,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get import job progress."""
+    job = ImportService.get_job(db, job_id, current_user["user_id"])
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+
+@router.post("/{job_id}/resume", response_model=ImportJobResponse, status_code=202)
+async def resume_import(
+    job_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Resume a failed import, or one whose worker died, from where it stopped.
+
+    Send the same file again; records that were already imported are skipped.
+    """
+    job = ImportService.get_job(db, job_id, current_user["user_id"])
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+    if not ImportService.claim_for_resume(db, job):
+        raise HTTPException(status_code=409, detail=f"Import job is {job.status}")
+
+    path = await _spool_body(request)
+    background_tasks.add_task(_run_and_discard, job.id, path)
+    return job
@@ -1,12 +1,20 @@
 """Memo API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
-from src.database import get_db
-from src.schemas import MemoCreate, MemoUpdate, MemoResponse
+from typing import List, Optional
+from src.database import get_db, get_read_db
+from src.schemas import (
+    MemoCreate, MemoUpdate, MemoResponse, MemoPage, MemoSearchPage,
+    MemoBulkCreate, MemoBulkUpdate, BulkDelete, BulkResult,
+)
 from src.services.memo_service import MemoService
+from src.services.search_service import MemoSearchService
+from src.utils.pagination import InvalidCursorError
 from src.middleware.auth import get_current_user
+from src.middleware.etag import check_etag
+from src.schemas.serializers import memo_to_dict
+from src.utils.serialization import fast_response
 from src.models import User
 
 router = APIRouter(prefix="/api/v1/memos", tags=["Memos"])
@@ -23,29 +31,91 @@ async def create_memo(
     return memo
 
 
-@router.get("", response_model=List[MemoResponse])
+@router.get("", response_model=MemoPage)
 async def list_memos(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    include: Optional[str] = Query(None, pattern="^alarms$"),
+    current_user: dict = Depends(get_current_user),
+    cache_headers: dict = Depends(check_etag),
+    db: Session = Depends(get_read_db)
+):
+    """List memos for authenticated user, newest first.
+
+    `include=alarms` embeds each memo's alarms, next trigger and last
+    delivery status.
+    """
+    try:
+        page = MemoService.get_memo_page(
+            db, current_user["user_id"], cursor, limit, include_alarms=include == "alarms",
+            total=request.state.memo_count
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return fast_response(request, page, headers=cache_headers)
+
+
+@router.get("/search", response_model=MemoSearchPage)
+async def search_memos(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0, le=1000),
+    limit: int = Query(20, ge=1, le=50),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """Full-text search over memo titles and descriptions, best match first."""
+    memos, next_skip = MemoSearchService.search(db, current_user["user_id"], q, skip, limit)
+    return fast_response(request, {"items": [memo_to_dict(memo) for memo in memos], "next_skip": next_skip})
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_memos(
+    payload: MemoBulkCreate,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """List memos for authenticated user."""
-    memos = MemoService.list_memos(db, current_user["user_id"], skip, limit)
-    return memos
+    """Create many memos with their alarms in one transaction."""
+    ids, errors = MemoService.bulk_create_memos(db, current_user["user_id"], payload.items)
+    return {"succeeded": ids, "failed": errors}
+
+
+@router.patch("/bulk", response_model=BulkResult)
+async def bulk_update_memos(
+    payload: MemoBulkUpdate,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Update many memos in one transaction."""
+    ids, errors = MemoService.bulk_update_memos(db, current_user["user_id"], payload.items)
+    return {"succeeded": ids, "failed": errors}
+
+
+@router.post("/bulk-delete", response_model=BulkResult)
+async def bulk_delete_memos(
+    payload: BulkDelete,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete many memos and their alarms in one transaction."""
+    ids, errors = MemoService.bulk_delete_memos(db, current_user["user_id"], payload.ids)
+    return {"succeeded": ids, "failed": errors}
 
 
 @router.get("/{memo_id}", response_model=MemoResponse)
 async def get_memo(
+    request: Request,
     memo_id: int,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cache_headers: dict = Depends(check_etag),
+    db: Session = Depends(get_read_db)
 ):
     """Get a specific memo."""
-    memo = MemoService.get_memo(db, memo_id, current_user["user_id"])
+    memo = MemoService.get_memo_data(db, memo_id, current_user["user_id"])
     if not memo:
         raise HTTPException(status_code=404, detail="Memo not found")
-    return memo
+    return fast_response(request, memo, headers=cache_headers)
 
 
 @router.patch("/{memo_id}", response_model=MemoResponse)
@@ -1,19 +1,41 @@
 """Telegram integration API endpoints (Phase 7)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta, timezone
+from typing import Optional
+from urllib.parse import urlsplit
 import secrets
 import logging
 
+from src.config import settings
 from src.database import get_db
 from src.middleware.auth import get_current_user
-from src.models import User, TelegramLinkingCode
+from src.models import User
 from src.schemas import TelegramLinkingCodeResponse
+from src.services.telegram_linking_service import TelegramLinkingService
+from src.services.telegram_webhook_service import FULL
+from src.utils.serialization import loads
 
 router = APIRouter(prefix="/api/v1/telegram", tags=["Telegram"])
+webhook_router = APIRouter(tags=["Telegram"])
 logger = logging.getLogger(__name__)
 
+DEFAULT_WEBHOOK_PATH = "/webhook/telegram"
+
+
+def webhook_path(url: str) -> str:
+    """Path the webhook is served at: that of TELEGRAM_WEBHOOK_URL, or the default."""
+    # Exactly as registered: Telegram does not follow redirects
+    path = urlsplit(url).path
+    if path in ("", "/"):
+        return DEFAULT_WEBHOOK_PATH
+    if path.startswith("/api/"):
+        raise ValueError(f"TELEGRAM_WEBHOOK_URL path {path} collides with the API routes")
+    return path
+
+
+WEBHOOK_PATH = webhook_path(settings.TELEGRAM_WEBHOOK_URL)
+
 
 @router.post("/linking-code", response_model=TelegramLinkingCodeResponse)
 async def generate_linking_code(
@@ -21,25 +43,7 @@ async def generate_linking_code(
     db: Session = Depends(get_db)
 ):
     """Generate a Telegram linking code (10 minute expiry)."""
-    code = secrets.token_urlsafe(32)
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
-    
-    # Clean up old codes
-    db.query(TelegramLinkingCode).filter(
-        TelegramLinkingCode.user_id == current_user["user_id"],
-        TelegramLinkingCode.used == False
-    ).delete()
-    
-    linking_code = TelegramLinkingCode(
-        code=code,
-        user_id=current_user["user_id"],
-        expires_at=expires_at
-    )
-    db.add(linking_code)
-    db.commit()
-    db.refresh(linking_code)
-    
-    return linking_code
+    return TelegramLinkingService.create_code(db, current_user["user_id"])
 
 
 @router.post("/unlink")
@@ -56,3 +60,31 @@ async def unlink_telegram(
     db.commit()
     
     return {"detail": "Telegram account unlinked"}
+
+
+@webhook_router.post(WEBHOOK_PATH)
+async def telegram_webhook(
+    request: Request,
+    x_telegram_bot_api_secret_token: Optional[str] = Header(None)
+):
+    """Receive a Telegram update.
+
+    The update is only validated and queued here; linking happens in the
+    background. Redeliveries of the same `update_id` are acknowledged and
+    ignored. Answers 503 when the queue is full so Telegram retries.
+    """
+    if settings.TELEGRAM_WEBHOOK_SECRET and not secrets.compare_digest(
+        x_telegram_bot_api_secret_token or "", settings.TELEGRAM_WEBHOOK_SECRET
+    ):
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+
+    try:
+        update = loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON")
+    if not isinstance(update, dict) or not isinstance(update.get("update_id"), int):
+        raise HTTPException(status_code=400, detail="Missing update_id")
+
+    if request.app.state.telegram_updates.offer(update) == FULL:
+        raise HTTPException(status_code=503, detail="Update queue is full", headers={"Retry-After": "5"})
+    return {"ok": True}
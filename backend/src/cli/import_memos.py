@@ -0,0 +1,80 @@
+"""Import memos and alarms for a user from an NDJSON or CSV file.
+
+Usage (from the ``backend`` directory)::
+
+    python -m src.cli.import_memos --email user@example.com memos.ndjson
+    python -m src.cli.import_memos --email user@example.com --format csv memos.csv
+    python -m src.cli.import_memos --email user@example.com --resume 12 memos.ndjson
+
+``--resume`` continues a failed job (or a running one whose worker died)
+on the same file after its last committed chunk.
+"""
+
+import argparse
+import sys
+import time
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="input file, or - for stdin")
+    parser.add_argument("--email", required=True, help="owner of the imported memos")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default=None, help="defaults to the file extension")
+    parser.add_argument("--resume", type=int, metavar="JOB_ID", help="resume this failed import job")
+    args = parser.parse_args()
+
+    from src.database import SessionLocal, init_db
+    from src.models import ImportJob, User
+    from src.services.import_service import ImportService
+    from src.services.search_service import MemoSearchService
+
+    init_db()
+    db = SessionLocal()
+    try:
+        MemoSearchService.ensure_index(db)
+        user = db.query(User).filter(User.email == args.email).first()
+        if not user:
+            print(f"No user with email {args.email}", file=sys.stderr)
+            return 1
+
+        if args.resume:
+            job = ImportService.get_job(db, args.resume, user.id)
+            if not job:
+                print(f"No import job {args.resume} for {args.email}", file=sys.stderr)
+                return 1
+            if not ImportService.claim_for_resume(db, job):
+                print(f"Import job {job.id} is {job.status}", file=sys.stderr)
+                return 1
+        else:
+            fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+            job = ImportService.create_job(db, user.id, fmt)
+        print(f"Import job {job.id} ({job.format}), starting after record {job.records_processed}")
+
+        started = time.perf_counter()
+
+        def report(job: ImportJob) -> None:
+            elapsed = time.perf_counter() - started
+            print(
+                f"  {job.records_processed} records, {job.memos_created} memos, "
+                f"{job.alarms_created} alarms, {job.records_rejected} rejected ({elapsed:.1f}s)",
+                file=sys.stderr
+            )
+
+        stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+        with stream:
+            job = ImportService.run(db, job, stream, on_progress=report)
+
+        for error in job.errors:
+            print(f"  record {error['record']}: {error['detail']}", file=sys.stderr)
+        if job.status != "completed":
+            print(f"Import job {job.id} failed: {job.error_message}", file=sys.stderr)
+            print(f"Fix the cause and rerun with --resume {job.id}", file=sys.stderr)
+            return 1
+        print(f"Import job {job.id} completed")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,24 +10,52 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./memo.db")
+    DATABASE_REPLICA_URL: str = os.getenv("DATABASE_REPLICA_URL", "")
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5"))
     
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     
+    # Password hashing pool: "thread" or "process" workers, and the number of
+    # calls allowed to queue or run before logins/registrations get 429s
+    PASSWORD_HASH_EXECUTOR: str = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    
+    # Admins (comma-separated emails) allowed to run tenant-wide exports
+    ADMIN_EMAILS: str = os.getenv("ADMIN_EMAILS", "")
+    
     # Telegram
     TELEGRAM_BOT_TOKEN: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
     TELEGRAM_WEBHOOK_URL: str = os.getenv("TELEGRAM_WEBHOOK_URL", "")
+    # Bot API server (the scheduler simulation points this at a local fake)
+    TELEGRAM_API_URL: str = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
+    # Checked against X-Telegram-Bot-Api-Secret-Token when set (setWebhook secret_token)
+    TELEGRAM_WEBHOOK_SECRET: str = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
+    TELEGRAM_UPDATE_QUEUE_SIZE: int = int(os.getenv("TELEGRAM_UPDATE_QUEUE_SIZE", "10000"))
+    TELEGRAM_UPDATE_WORKERS: int = int(os.getenv("TELEGRAM_UPDATE_WORKERS", "1"))
 
     # GitHub OAuth
     GITHUB_CLIENT_ID: Optional[str] = os.getenv("GITHUB_CLIENT_ID")
     GITHUB_CLIENT_SECRET: Optional[str] = os.getenv("GITHUB_CLIENT_SECRET")
+    # Overridable so tests and benchmarks can point at a local stub
+    GITHUB_OAUTH_URL: str = os.getenv("GITHUB_OAUTH_URL", "https://github.com")
+    GITHUB_API_URL: str = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    
+    # Outbound HTTP (shared client)
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "3"))
+    HTTP_READ_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "5"))
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
     
     # Application
     APP_NAME: str = os.getenv("APP_NAME", "Telegram Memo Alerts")
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    # Worker processes serving the app (uvicorn and gunicorn read it too);
+    # per-process caches warn when it is above 1
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
     
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -35,8 +63,37 @@ class Settings(BaseSettings):
         "http://localhost:5173",
     ]
     
+    # Alarm history retention
+    HISTORY_RETENTION_DAYS: int = int(os.getenv("HISTORY_RETENTION_DAYS", "90"))
+    HISTORY_PARTITIONS_AHEAD: int = int(os.getenv("HISTORY_PARTITIONS_AHEAD", "2"))  # Months
+
+    # Read cache: "memory" (per process), "redis" (CACHE_URL) or "none"
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_URL: str = os.getenv("CACHE_URL", "")
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    CACHE_MAX_BYTES: int = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # Per-process user profile cache (email, timezone; no credentials or chat ids)
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+    USER_CACHE_MAX_ENTRIES: int = int(os.getenv("USER_CACHE_MAX_ENTRIES", "50000"))
+
+    # Live event stream: "memory" (per process) or "redis" (EVENTS_URL, shared by workers)
+    EVENTS_BACKEND: str = os.getenv("EVENTS_BACKEND", "memory")
+    EVENTS_URL: str = os.getenv("EVENTS_URL", "")
+    EVENTS_QUEUE_SIZE: int = int(os.getenv("EVENTS_QUEUE_SIZE", "100"))
+    EVENTS_HEARTBEAT_SECONDS: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+
+    # Request timing: Server-Timing response header and per-route rolling window
+    SERVER_TIMING_HEADER: bool = os.getenv("SERVER_TIMING_HEADER", "True").lower() == "true"
+    LATENCY_WINDOW: int = int(os.getenv("LATENCY_WINDOW", "1000"))
+
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
+    # Fraction of DEBUG/INFO records kept per logger, e.g. "src.services.scheduler_service=0.1"
+    LOG_SAMPLING: str = os.getenv("LOG_SAMPLING", "")
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    LOG_QUEUE_OVERFLOW: str = os.getenv("LOG_QUEUE_OVERFLOW", "drop")  # "drop" or "block"
     
     class Config:
         env_file = ".env"
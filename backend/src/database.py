@@ -1,11 +1,17 @@
 """Database connection and configuration module."""
 
-from sqlalchemy import create_engine
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import NullPool
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
+from src.middleware.auth import get_current_user
+from src.utils.query_stats import instrument_engine
+
 load_dotenv()
 
 # Get database URL from environment
@@ -14,33 +20,175 @@ DATABASE_URL = os.getenv(
     "sqlite:///./memo.db"  # Default to SQLite for development
 )
 
-# Create engine with appropriate pooling
-# Use NullPool for SQLite (not thread-safe pool)
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=NullPool
-    )
-else:
+# Optional streaming replica for read-only routes
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+
+# Seconds after a user's own commit during which their reads stay on the primary
+REPLICA_READ_YOUR_WRITES_SECONDS = float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5"))
+
+# Statements at least this slow are logged with their parameter types (0 disables)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+
+def _create_engine(url: str):
+    """Create an instrumented engine with pooling appropriate for the backend."""
+    engine = _create_pooled_engine(url)
+    instrument_engine(engine, SLOW_QUERY_MS)
+    return engine
+
+
+def _create_pooled_engine(url: str):
+    # Use NullPool for SQLite (not thread-safe pool)
+    if url.startswith("sqlite"):
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=NullPool
+        )
+
     # PostgreSQL with connection pooling
     # psycopg3 uses 'postgresql+psycopg' driver
-    if DATABASE_URL.startswith("postgresql://") and "+psycopg" not in DATABASE_URL:
-        DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://")
+    if url.startswith("postgresql://") and "+psycopg" not in url:
+        url = url.replace("postgresql://", "postgresql+psycopg://")
 
-    engine = create_engine(
-        DATABASE_URL,
+    return create_engine(
+        url,
         pool_pre_ping=True,  # Test connections before using
         echo=False  # Set to True for SQL logging
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class _LazySessionMaker(sessionmaker):
+    """Session factory that binds to its engine on first use."""
+
+    def __init__(self, engine_getter, **kw):
+        super().__init__(**kw)
+        self._engine_getter = engine_getter
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=self._engine_getter())
+        return super().__call__(**local_kw)
+
+
+_engine = None
+_replica_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the primary engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine(DATABASE_URL)
+    return _engine
+
+
+def get_replica_engine():
+    """Return the replica engine, or None when no replica is configured."""
+    global _replica_engine
+    if not DATABASE_REPLICA_URL:
+        return None
+    if _replica_engine is None:
+        with _engine_lock:
+            if _replica_engine is None:
+                _replica_engine = _create_engine(DATABASE_REPLICA_URL)
+    return _replica_engine
+
+
+def __getattr__(name):
+    """Build `engine` / `replica_engine` lazily on attribute access."""
+    if name == "engine":
+        return get_engine()
+    if name == "replica_engine":
+        return get_replica_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+SessionLocal = _LazySessionMaker(get_engine, autocommit=False, autoflush=False)
+ReplicaSessionLocal = (
+    _LazySessionMaker(get_replica_engine, autocommit=False, autoflush=False)
+    if DATABASE_REPLICA_URL
+    else None
+)
 Base = declarative_base()
 
 
-def get_db():
+def init_db() -> None:
+    """Create any missing tables on the primary database."""
+    import src.models  # noqa: F401  (register models on Base.metadata)
+
+    Base.metadata.create_all(bind=get_engine())
+
+
+# Last commit time per user (monotonic clock), used for read-your-writes.
+# This is per process; with several workers a user may hit a worker that
+# has not seen their write, which is bounded by the replica's own lag.
+_last_write_at: dict = {}
+_last_write_lock = threading.Lock()
+
+
+def record_user_write(user_id) -> None:
+    """Remember that a user has just committed a write on the primary."""
+    if not DATABASE_REPLICA_URL or REPLICA_READ_YOUR_WRITES_SECONDS <= 0:
+        return
+    now = time.monotonic()
+    with _last_write_lock:
+        _last_write_at[user_id] = now
+        # Scheduler writes touch many users who may never read; sweep the map
+        if len(_last_write_at) > 10000:
+            for key in [k for k, at in _last_write_at.items() if now - at >= REPLICA_READ_YOUR_WRITES_SECONDS]:
+                del _last_write_at[key]
+
+
+def wrote_recently(user_id) -> bool:
+    """Check whether a user's reads must stay on the primary."""
+    if REPLICA_READ_YOUR_WRITES_SECONDS <= 0:
+        return False
+    with _last_write_lock:
+        last = _last_write_at.get(user_id)
+        if last is None:
+            return False
+        if time.monotonic() - last < REPLICA_READ_YOUR_WRITES_SECONDS:
+            return True
+        # Window elapsed; drop the entry so the map stays small
+        del _last_write_at[user_id]
+        return False
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _track_user_write(session):
+    """Record commits made on behalf of an authenticated request."""
+    state = session.info.get("request_state")
+    user_id = getattr(state, "user_id", None) if state is not None else None
+    if user_id is not None:
+        record_user_write(user_id)
+
+
+def get_db(request: Request):
     """Get database session dependency for FastAPI."""
     db = SessionLocal()
+    db.info["request_state"] = request.state
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request, current_user: dict = Depends(get_current_user)):
+    """Get a session for read-only routes.
+
+    Uses the replica when one is configured, unless the user committed a
+    write within the read-your-writes window, in which case the primary is
+    used so they see their own changes.
+    """
+    if ReplicaSessionLocal is None or wrote_recently(current_user["user_id"]):
+        yield from get_db(request)
+        return
+
+    db = ReplicaSessionLocal()
     try:
         yield db
     finally:
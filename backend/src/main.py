@@ -4,28 +4,50 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from src.config import settings
-from src.database import engine, Base
-from src.scheduler import scheduler
-from src.utils.logging import get_logger
-from src.api import auth, memos, alarms
+from src.middleware.timing import RouteLatencyStats, ServerTimingMiddleware
+from src.utils.events import get_broker
+from src.utils.logging import configure_logging, get_logger
+from src.utils.password_pool import shutdown_password_pool
+from src.utils.serialization import FastJSONResponse
+from src.api import auth, memos, alarms, history, export, imports, admin, telegram, events
 
 logger = get_logger(__name__)
 
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifecycle management."""
     # Startup
+    from src.database import init_db
+    from src.scheduler import scheduler
+    from src.services.telegram_webhook_service import TelegramUpdateQueue
+    from src.utils.http_client import create_http_client
+
     logger.info("Starting Telegram Memo Alert System")
+
+    # Create database tables and the memo search index
+    init_db()
+    ensure_search_index()
+
     scheduler.start()
-    
+
+    # Shared outbound HTTP client (GitHub OAuth)
+    app.state.http_client = create_http_client()
+
+    # Telegram webhook updates are processed off the request path
+    app.state.telegram_updates = TelegramUpdateQueue(
+        maxsize=settings.TELEGRAM_UPDATE_QUEUE_SIZE,
+        workers=settings.TELEGRAM_UPDATE_WORKERS
+    )
+    app.state.telegram_updates.start()
+
+    # Live event streams; the scheduler thread publishes onto this loop
+    get_broker().start(asyncio.get_running_loop())
+
     # Add alarm checking job
     def check_alarms_job():
         from src.database import SessionLocal
@@ -35,36 +57,55 @@ async def lifespan(app: FastAPI):
             AlarmSchedulerService.check_due_alarms(db)
         finally:
             db.close()
-    
+
     scheduler.add_job(check_alarms_job, "interval", minutes=1, id="check_alarms")
-    
+
+    # Add daily alarm history retention job
+    def history_retention_job():
+        from src.database import SessionLocal
+        from src.services.history_retention_service import HistoryRetentionService
+        db = SessionLocal()
+        try:
+            HistoryRetentionService.run_retention(db)
+        finally:
+            db.close()
+
+    scheduler.add_job(history_retention_job, "cron", hour=3, minute=15, id="history_retention")
+
+    # Sweep expired and used Telegram linking codes
+    def telegram_code_sweep_job():
+        from src.database import SessionLocal
+        from src.services.telegram_linking_service import TelegramLinkingService
+        db = SessionLocal()
+        try:
+            TelegramLinkingService.sweep_codes(db)
+        finally:
+            db.close()
+
+    scheduler.add_job(telegram_code_sweep_job, "interval", minutes=15, id="telegram_code_sweep")
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down Telegram Memo Alert System")
     scheduler.stop()
+    get_broker().stop()
+    await app.state.telegram_updates.stop()
+    shutdown_password_pool()
+    await app.state.http_client.aclose()
 
 
-# Create FastAPI app
-app = FastAPI(
-    title=settings.APP_NAME,
-    description="A memo management system with scheduled Telegram notifications",
-    version="0.1.0",
-    lifespan=lifespan
-)
+def ensure_search_index():
+    """Create the memo full-text index if it does not exist yet."""
+    from src.database import SessionLocal
+    from src.services.search_service import MemoSearchService
+    db = SessionLocal()
+    try:
+        MemoSearchService.ensure_index(db)
+    finally:
+        db.close()
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-
-# Global exception handler
-@app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Handle uncaught exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
@@ -74,17 +115,80 @@ async def global_exception_handler(request, exc):
     )
 
 
-# Health check endpoint
-@app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
 
-# Include API routers
-app.include_router(auth.router)
-app.include_router(memos.router)
-app.include_router(alarms.router)
+def create_app() -> FastAPI:
+    """Create the FastAPI application.
+
+    Building the app only wires routes and middleware. The database engine,
+    table creation and the scheduler are set up in `lifespan`, and the
+    Telegram client is imported on first send, so importing this module and
+    creating the app stay cheap on cold start.
+    """
+    configure_logging(
+        settings.LOG_LEVEL,
+        fmt=settings.LOG_FORMAT,
+        sampling=settings.LOG_SAMPLING,
+        queue_size=settings.LOG_QUEUE_SIZE,
+        overflow=settings.LOG_QUEUE_OVERFLOW
+    )
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        description="A memo management system with scheduled Telegram notifications",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse
+    )
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Request timing (Server-Timing header, per-route latency for admins)
+    app.state.route_stats = RouteLatencyStats(settings.LATENCY_WINDOW)
+    app.add_middleware(ServerTimingMiddleware, stats=app.state.route_stats, header=settings.SERVER_TIMING_HEADER)
+
+    # Global exception handler
+    app.add_exception_handler(Exception, global_exception_handler)
+
+    # Health check endpoint
+    app.add_api_route("/health", health_check, methods=["GET"], tags=["Health"])
+
+    # Include API routers
+    app.include_router(auth.router)
+    app.include_router(memos.router)
+    app.include_router(alarms.router)
+    app.include_router(history.router)
+    app.include_router(export.router)
+    app.include_router(imports.router)
+    app.include_router(admin.router)
+    app.include_router(telegram.router)
+    app.include_router(telegram.webhook_router)
+    app.include_router(events.router)
+
+    return app
+
+
+_app = None
+
+
+def __getattr__(name):
+    """Create the module-level `app` on first access (`uvicorn src.main:app`)."""
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
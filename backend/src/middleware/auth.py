@@ -1,12 +1,20 @@
 """Authentication middleware for JWT bearer token validation."""
 
-from fastapi import Request, HTTPException, status
-from src.utils.security import verify_token
+from fastapi import Depends, Request, HTTPException, status
+from src.config import settings
+from src.middleware.timing import phase
+from src.utils.events import get_broker
+from src.utils.security import STREAM_TICKET_SECONDS, STREAM_TICKET_TYPE, decode_token, verify_token
 from typing import Optional
 
 
 async def get_current_user(request: Request) -> Optional[dict]:
     """Extract and verify JWT token from request headers."""
+    with phase("auth"):
+        return _authenticate(request)
+
+
+def _authenticate(request: Request) -> dict:
     auth_header = request.headers.get("Authorization")
     
     if not auth_header:
@@ -29,10 +37,49 @@ async def get_current_user(request: Request) -> Optional[dict]:
         )
     
     payload = verify_token(token)
-    if not payload:
+    # Stream tickets are not access tokens
+    if not payload or payload.get("typ") == STREAM_TICKET_TYPE:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token"
         )
     
+    # Expose the caller to session hooks (read-your-writes tracking)
+    request.state.user_id = payload.get("user_id")
     return payload
+
+
+async def get_stream_user(request: Request) -> dict:
+    """Like get_current_user, but also accepts a single-use `?ticket=` (EventSource cannot set headers).
+
+    A ticket stands for the access token it was issued against: the
+    returned `exp` is that token's expiry.
+    """
+    ticket = request.query_params.get("ticket")
+    if not ticket or request.headers.get("Authorization"):
+        return await get_current_user(request)
+    
+    with phase("auth"):
+        payload = decode_token(ticket)
+        if (
+            not payload
+            or payload.get("typ") != STREAM_TICKET_TYPE
+            or not get_broker().claim_ticket(payload["jti"], STREAM_TICKET_SECONDS)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid, expired or used ticket"
+            )
+    request.state.user_id = payload["user_id"]
+    return {"user_id": payload["user_id"], "exp": payload.get("until")}
+
+
+async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
+    """Allow only users listed in ADMIN_EMAILS."""
+    admins = {email.strip() for email in settings.ADMIN_EMAILS.split(",") if email.strip()}
+    if current_user.get("sub") not in admins:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
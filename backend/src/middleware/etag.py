@@ -0,0 +1,55 @@
+"""Conditional GET support (ETag / If-None-Match) for per-user reads."""
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+from src.database import get_read_db
+from src.middleware.auth import get_current_user
+from src.services.user_service import UserService
+from src.utils.serialization import wants_msgpack
+from typing import Dict, Optional
+
+
+def make_etag(user_id: int, data_version: int, variant: str = "") -> str:
+    """Strong ETag for a snapshot of one user's memos, alarms and history.
+
+    `variant` distinguishes representations of the same data (MessagePack).
+    """
+    return f'"u{user_id}-v{data_version}{variant}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+async def check_etag(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+) -> Dict[str, str]:
+    """Answer 304 if the client's copy is current, else set the ETag header.
+
+    The ETag is the user's data version, which every write to their memos,
+    alarms or history bumps, so a match is decided with one primary key
+    lookup and no rows are queried or serialized. Returns the headers, for
+    routes that build their own Response.
+
+    The same lookup reads the user's memo total into
+    `request.state.memo_count`, for the memo list.
+    """
+    data_version, request.state.memo_count = UserService.get_version_and_count(db, current_user["user_id"])
+    etag = make_etag(
+        current_user["user_id"],
+        data_version,
+        "-msgpack" if wants_msgpack(request) else ""
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return headers
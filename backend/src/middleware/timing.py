@@ -0,0 +1,155 @@
+"""Per-request timing: Server-Timing headers and rolling per-route latency.
+
+The middleware starts a timing record for each HTTP request in a context
+variable. Code on the request path adds to it with `phase()` (auth,
+serialization), and the request's query counter (src.utils.query_stats)
+supplies the "db" phase and the number of statements, including work done
+in the threadpool, which inherits the context. When the response starts,
+the phases and the total go out as a `Server-Timing` header; when it
+finishes, they are added to the route's rolling window in
+RouteLatencyStats (see GET /api/v1/admin/latency). Event streams
+(`text/event-stream`) stay open for as long as the client listens, so they
+are left out of the window.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from src.utils.query_stats import track_queries
+from typing import Deque, Dict, Iterator, List, Optional
+import threading
+import time
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+def record(name: str, seconds: float) -> None:
+    """Add `seconds` to a phase of the current request (no-op outside requests)."""
+    timings = _timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as part of a phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class RouteLatencyStats:
+    """Last `window` request durations per route, with phases and query counts."""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: Dict[str, Deque[Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, route: str, timings: Dict[str, float], queries: int = 0) -> None:
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self.window)
+            samples.append(dict(timings, queries=queries))
+
+    def summary(self) -> List[Dict]:
+        """Per-route count, p50/p95/p99/max total, mean per phase (ms) and queries; slowest p95 first."""
+        with self._lock:
+            snapshot = {route: list(samples) for route, samples in self._samples.items()}
+
+        routes = []
+        for route, samples in snapshot.items():
+            totals = sorted(s["total"] * 1000 for s in samples)
+            phases = {name for s in samples for name in s if name not in ("total", "queries")}
+            routes.append({
+                "route": route,
+                "count": len(totals),
+                "p50_ms": round(_percentile(totals, 50), 3),
+                "p95_ms": round(_percentile(totals, 95), 3),
+                "p99_ms": round(_percentile(totals, 99), 3),
+                "max_ms": round(totals[-1], 3),
+                "mean_phase_ms": {
+                    name: round(sum(s.get(name, 0.0) for s in samples) * 1000 / len(samples), 3)
+                    for name in sorted(phases)
+                },
+                "mean_queries": round(sum(s["queries"] for s in samples) / len(samples), 2),
+                "max_queries": max(s["queries"] for s in samples),
+            })
+        return sorted(routes, key=lambda r: r["p95_ms"], reverse=True)
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware that times requests and adds a Server-Timing header."""
+
+    def __init__(self, app, stats: RouteLatencyStats, header: bool = True):
+        self.app = app
+        self.stats = stats
+        self.header = header
+        self._route_paths: Optional[Dict] = None
+
+    def _route_name(self, scope) -> str:
+        # Route templates, not raw paths, so ids do not multiply the keys
+        if self._route_paths is None:
+            self._route_paths = {
+                getattr(route, "endpoint", None): route.path for route in scope["app"].routes
+            }
+        path = self._route_paths.get(scope.get("endpoint"))
+        return f"{scope['method']} {path}" if path else "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        timings: Dict[str, float] = {}
+        completed: Dict[str, float] = {}
+        streaming = False
+        token = _timings.set(timings)
+        start = time.perf_counter()
+
+        def snapshot():
+            if queries.count:
+                timings["db"] = queries.seconds
+            timings["total"] = time.perf_counter() - start
+
+        async def send_with_timing(message):
+            nonlocal streaming
+            if message["type"] == "http.response.start":
+                streaming = any(
+                    name.lower() == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message.get("headers", [])
+                )
+            if message["type"] == "http.response.start" and self.header:
+                snapshot()
+                value = ", ".join(
+                    f'db;desc="{queries.count} queries";dur={seconds * 1000:.2f}' if name == "db"
+                    else f"{name};dur={seconds * 1000:.2f}"
+                    for name, seconds in timings.items()
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", value.encode())]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Measured when the last body chunk is sent (so streamed bodies
+                # count), before any background tasks run
+                snapshot()
+                completed.update(timings, queries=queries.count)
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _timings.reset(token)
+                if not completed:
+                    snapshot()
+                    completed.update(timings, queries=queries.count)
+        if streaming:
+            return
+        query_count = int(completed.pop("queries"))
+        self.stats.add(self._route_name(scope), completed, query_count)
@@ -4,6 +4,8 @@ from src.models.user import User
 from src.models.memo import Memo
 from src.models.alarm import Alarm
 from src.models.alarm_history import AlarmHistory
+from src.models.alarm_history_daily import AlarmHistoryDaily
 from src.models.telegram_linking_code import TelegramLinkingCode
+from src.models.import_job import ImportJob
 
-__all__ = ["User", "Memo", "Alarm", "AlarmHistory", "TelegramLinkingCode"]
+__all__ = ["User", "Memo", "Alarm", "AlarmHistory", "AlarmHistoryDaily", "TelegramLinkingCode", "ImportJob"]
@@ -50,6 +50,7 @@ class Alarm(Base):
     recurrence_days = Column(String(255), nullable=True)
     next_trigger_time = Column(DateTime, nullable=True, index=True)  # UTC time
     last_triggered = Column(DateTime, nullable=True)
+    last_delivery_status = Column(String(20), nullable=True)  # Status of the latest trigger
 
     # Control fields
     enabled = Column(Boolean, default=True, nullable=False)
@@ -62,6 +63,7 @@ class Alarm(Base):
     # Relationships
     memo = relationship("Memo", back_populates="alarms")
     history = relationship("AlarmHistory", back_populates="alarm", cascade="all, delete-orphan")
+    daily_history = relationship("AlarmHistoryDaily", back_populates="alarm", cascade="all, delete-orphan")
 
     __table_args__ = (
         Index("idx_alarm_memo_id", "memo_id"),
@@ -7,12 +7,17 @@ from src.database import Base
 
 
 class AlarmHistory(Base):
-    """AlarmHistory model for tracking alarm trigger events and delivery status."""
+    """AlarmHistory model for tracking alarm trigger events and delivery status.
+
+    On PostgreSQL the table is range-partitioned by month on `triggered_at`
+    (primary key `(id, triggered_at)`); see HistoryRetentionService.
+    """
     
     __tablename__ = "alarm_history"
     
     id = Column(Integer, primary_key=True, index=True)
     alarm_id = Column(Integer, ForeignKey("alarms.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, nullable=True)  # Denormalized memo owner, for the per-user feed
     triggered_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     delivery_status = Column(String(20), nullable=False)  # sent, failed, pending
     error_message = Column(String(500), nullable=True)
@@ -23,7 +28,9 @@ class AlarmHistory(Base):
     alarm = relationship("Alarm", back_populates="history")
     
     __table_args__ = (
-        Index("idx_alarm_history_alarm_id", "alarm_id"),
+        Index("idx_alarm_history_alarm_triggered", "alarm_id", "triggered_at", "id"),
+        Index("idx_alarm_history_user_triggered", "user_id", "triggered_at", "id"),
+        Index("idx_alarm_history_triggered_at", "triggered_at"),
     )
     
     def __repr__(self):
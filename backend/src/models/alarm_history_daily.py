@@ -0,0 +1,30 @@
+"""AlarmHistoryDaily model for compacted per-alarm daily delivery counts."""
+
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from src.database import Base
+
+
+class AlarmHistoryDaily(Base):
+    """Per-alarm daily summary of history rows that aged out of retention."""
+    
+    __tablename__ = "alarm_history_daily"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    alarm_id = Column(Integer, ForeignKey("alarms.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)  # UTC day of triggered_at
+    sent_count = Column(Integer, default=0, nullable=False)
+    failed_count = Column(Integer, default=0, nullable=False)
+    pending_count = Column(Integer, default=0, nullable=False)
+    retry_count = Column(Integer, default=0, nullable=False)  # Sum of retries
+    
+    # Relationships
+    alarm = relationship("Alarm", back_populates="daily_history")
+    
+    __table_args__ = (
+        UniqueConstraint("alarm_id", "day", name="uq_alarm_history_daily_alarm_day"),
+        Index("idx_alarm_history_daily_day", "day"),
+    )
+    
+    def __repr__(self):
+        return f"<AlarmHistoryDaily(alarm_id={self.alarm_id}, day={self.day}, sent={self.sent_count})>"
@@ -0,0 +1,41 @@
+"""ImportJob model for tracking bulk memo imports."""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from datetime import datetime, timezone
+from src.database import Base
+import json
+
+
+class ImportJob(Base):
+    """Progress of a streamed memo import.
+
+    `records_processed` only advances together with the commit of the chunk
+    it covers, so a failed import resumes from exactly that record.
+    """
+    
+    __tablename__ = "import_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    format = Column(String(10), nullable=False)  # ndjson, csv
+    status = Column(String(20), default="pending", nullable=False)  # pending, running, completed, failed
+    records_processed = Column(Integer, default=0, nullable=False)  # Input records consumed (resume point)
+    memos_created = Column(Integer, default=0, nullable=False)
+    alarms_created = Column(Integer, default=0, nullable=False)
+    records_rejected = Column(Integer, default=0, nullable=False)
+    error_samples = Column(Text, nullable=True)  # JSON list of the first rejected records
+    error_message = Column(String(500), nullable=True)  # Why the job failed
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    
+    __table_args__ = (
+        Index("idx_import_job_user_id", "user_id"),
+    )
+    
+    @property
+    def errors(self):
+        """Rejected records as a list of {"record", "detail"} dicts."""
+        return json.loads(self.error_samples) if self.error_samples else []
+    
+    def __repr__(self):
+        return f"<ImportJob(id={self.id}, user_id={self.user_id}, status={self.status})>"
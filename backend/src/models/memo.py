@@ -23,8 +23,22 @@ class Memo(Base):
     alarms = relationship("Alarm", back_populates="memo", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index("idx_memo_user_id", "user_id"),
+        Index("idx_memo_user_created", "user_id", "created_at", "id"),
     )
     
+    @property
+    def next_alarm_time(self):
+        """Earliest upcoming trigger among enabled alarms (uses loaded `alarms`)."""
+        times = [a.next_trigger_time for a in self.alarms if a.enabled and a.next_trigger_time]
+        return min(times) if times else None
+
+    @property
+    def last_delivery_status(self):
+        """Delivery status of the most recently triggered alarm (uses loaded `alarms`)."""
+        triggered = [a for a in self.alarms if a.last_triggered]
+        if not triggered:
+            return None
+        return max(triggered, key=lambda a: a.last_triggered).last_delivery_status
+
     def __repr__(self):
         return f"<Memo(id={self.id}, title={self.title}, user_id={self.user_id})>"
@@ -1,6 +1,6 @@
 """TelegramLinkingCode model for secure Telegram account linking."""
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from src.database import Base
@@ -12,7 +12,7 @@ class TelegramLinkingCode(Base):
     __tablename__ = "telegram_linking_codes"
     
     code = Column(String(50), primary_key=True, index=True)
-    user_id = Column(String(255), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     expires_at = Column(DateTime, nullable=False)  # 10 minutes from creation
     used = Column(Boolean, default=False, nullable=False)
@@ -23,6 +23,7 @@ class TelegramLinkingCode(Base):
     __table_args__ = (
         Index("idx_telegram_code", "code"),
         Index("idx_telegram_user_id", "user_id"),
+        Index("idx_telegram_expires_at", "expires_at"),  # Expired-code sweeps
     )
     
     def __repr__(self):
@@ -16,6 +16,8 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     telegram_chat_id = Column(String(255), nullable=True, index=True)
     timezone = Column(String(50), default="UTC", nullable=False)
+    memo_count = Column(Integer, default=0, nullable=False)  # Maintained by MemoService
+    data_version = Column(Integer, default=0, nullable=False)  # Bumped on every memo/alarm/history write (ETags)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     
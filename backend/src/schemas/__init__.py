@@ -1,7 +1,7 @@
 """Pydantic request/response schemas for API validation."""
 
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime
 from enum import Enum
 
@@ -89,9 +89,8 @@ class MemoResponse(BaseModel):
 
 
 # Alarm Schemas
-class AlarmCreate(BaseModel):
-    """Alarm creation request schema with flexible scheduling."""
-    memo_id: int
+class AlarmSpec(BaseModel):
+    """Alarm scheduling fields shared by single and bulk creation."""
     alarm_type: AlarmType = AlarmType.REPEAT
     alarm_time: Optional[datetime] = None  # For 'once' type
     repeat_interval: Optional[RepeatInterval] = None  # For 'repeat' type
@@ -103,6 +102,11 @@ class AlarmCreate(BaseModel):
     recurrence_days: Optional[str] = None
 
 
+class AlarmCreate(AlarmSpec):
+    """Alarm creation request schema with flexible scheduling."""
+    memo_id: int
+
+
 class AlarmUpdate(BaseModel):
     """Alarm update request schema."""
     alarm_type: Optional[AlarmType] = None
@@ -130,6 +134,7 @@ class AlarmResponse(BaseModel):
     recurrence_days: Optional[str] = None
     next_trigger_time: Optional[datetime] = None
     last_triggered: Optional[datetime] = None
+    last_delivery_status: Optional[str] = None
     enabled: bool
     user_timezone: str
     created_at: datetime
@@ -139,6 +144,63 @@ class AlarmResponse(BaseModel):
         from_attributes = True
 
 
+# Bulk Schemas
+BULK_MAX_ITEMS = 1000
+
+
+class MemoBulkCreateItem(MemoCreate):
+    """Memo to create in bulk, optionally with its alarms."""
+    alarms: List[AlarmSpec] = Field(default_factory=list, max_length=20)
+
+
+class MemoBulkCreate(BaseModel):
+    """Bulk memo creation request schema."""
+    items: List[MemoBulkCreateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class MemoBulkUpdateItem(MemoUpdate):
+    """Memo update within a bulk request."""
+    id: int
+
+
+class MemoBulkUpdate(BaseModel):
+    """Bulk memo update request schema."""
+    items: List[MemoBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class AlarmBulkCreate(BaseModel):
+    """Bulk alarm creation request schema."""
+    items: List[AlarmCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class AlarmBulkUpdateItem(AlarmUpdate):
+    """Alarm update within a bulk request."""
+    id: int
+
+
+class AlarmBulkUpdate(BaseModel):
+    """Bulk alarm update request schema."""
+    items: List[AlarmBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkDelete(BaseModel):
+    """Bulk delete request schema."""
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkItemError(BaseModel):
+    """Why one item of a bulk request was rejected."""
+    index: int  # Position in the request payload
+    id: Optional[int] = None
+    detail: str
+
+
+class BulkResult(BaseModel):
+    """Bulk operation report: ids applied and items rejected."""
+    succeeded: List[int]
+    failed: List[BulkItemError]
+
+
 # Alarm History Schemas
 class AlarmHistoryResponse(BaseModel):
     """Alarm history response schema."""
@@ -154,6 +216,58 @@ class AlarmHistoryResponse(BaseModel):
         from_attributes = True
 
 
+class MemoWithAlarmsResponse(MemoResponse):
+    """Memo response schema with embedded alarms (`include=alarms`)."""
+    alarms: List[AlarmResponse]
+    next_alarm_time: Optional[datetime] = None
+    last_delivery_status: Optional[str] = None
+
+
+class MemoPage(BaseModel):
+    """Cursor-paginated memo list response schema."""
+    # MemoWithAlarmsResponse requires `alarms`, so plain memos fall through to MemoResponse
+    items: List[Union[MemoWithAlarmsResponse, MemoResponse]]
+    total: int
+    next_cursor: Optional[str] = None  # Pass back as `cursor`; None on the last page
+
+
+class MemoSearchPage(BaseModel):
+    """Ranked memo search response schema."""
+    items: List[MemoResponse]
+    next_skip: Optional[int] = None  # Pass back as `skip`; None on the last page
+
+
+class AlarmHistoryPage(BaseModel):
+    """Cursor-paginated alarm history response schema."""
+    items: List[AlarmHistoryResponse]
+    next_cursor: Optional[str] = None  # Pass back as `cursor`; None on the last page
+
+
+# Import Schemas
+class ImportRecordError(BaseModel):
+    """Why one input record of an import was rejected."""
+    record: int  # 1-based record number in the input
+    detail: str
+
+
+class ImportJobResponse(BaseModel):
+    """Import job progress response schema."""
+    id: int
+    format: str
+    status: str
+    records_processed: int
+    memos_created: int
+    alarms_created: int
+    records_rejected: int
+    errors: List[ImportRecordError] = []  # First rejected records
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Telegram Schemas
 class TelegramLinkingCodeResponse(BaseModel):
     """Telegram linking code response."""
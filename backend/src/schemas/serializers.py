@@ -0,0 +1,69 @@
+"""Direct ORM-to-dict serializers for hot read paths.
+
+Each function returns exactly the fields of the matching response schema,
+read straight off the ORM row, so large pages skip pydantic validation.
+Datetimes are left as objects for the response encoder.
+"""
+
+from typing import Any, Dict
+
+
+def _value(member):
+    """Enum member to its value (None passes through)."""
+    return member.value if member is not None else None
+
+
+def memo_to_dict(memo) -> Dict[str, Any]:
+    """MemoResponse fields."""
+    return {
+        "id": memo.id,
+        "user_id": memo.user_id,
+        "title": memo.title,
+        "description": memo.description,
+        "created_at": memo.created_at,
+        "updated_at": memo.updated_at,
+    }
+
+
+def alarm_to_dict(alarm) -> Dict[str, Any]:
+    """AlarmResponse fields."""
+    return {
+        "id": alarm.id,
+        "memo_id": alarm.memo_id,
+        "alarm_type": _value(alarm.alarm_type),
+        "alarm_time": alarm.alarm_time,
+        "repeat_interval": _value(alarm.repeat_interval),
+        "scheduled_time": alarm.scheduled_time,
+        "channel": _value(alarm.channel),
+        "recurrence_type": alarm.recurrence_type,
+        "recurrence_days": alarm.recurrence_days,
+        "next_trigger_time": alarm.next_trigger_time,
+        "last_triggered": alarm.last_triggered,
+        "last_delivery_status": alarm.last_delivery_status,
+        "enabled": alarm.enabled,
+        "user_timezone": alarm.user_timezone,
+        "created_at": alarm.created_at,
+        "updated_at": alarm.updated_at,
+    }
+
+
+def memo_with_alarms_to_dict(memo) -> Dict[str, Any]:
+    """MemoWithAlarmsResponse fields (uses the loaded `alarms`)."""
+    data = memo_to_dict(memo)
+    data["alarms"] = [alarm_to_dict(alarm) for alarm in memo.alarms]
+    data["next_alarm_time"] = memo.next_alarm_time
+    data["last_delivery_status"] = memo.last_delivery_status
+    return data
+
+
+def history_to_dict(history) -> Dict[str, Any]:
+    """AlarmHistoryResponse fields."""
+    return {
+        "id": history.id,
+        "alarm_id": history.alarm_id,
+        "triggered_at": history.triggered_at,
+        "delivery_status": history.delivery_status,
+        "error_message": history.error_message,
+        "retry_count": history.retry_count,
+        "created_at": history.created_at,
+    }
@@ -1,60 +1,84 @@
 """Service for alarm management and scheduling."""
 
+from sqlalchemy import delete, exists, insert, literal, select, update
 from sqlalchemy.orm import Session
-from src.models import Alarm, Memo, AlarmHistory
-from src.schemas import AlarmCreate, AlarmUpdate
-from src.utils.recurrence import calculate_next_trigger_time, validate_recurrence_pattern
-from typing import List, Optional
+from src.models import Alarm, Memo, AlarmHistory, AlarmHistoryDaily
+from src.schemas import AlarmCreate, AlarmSpec, AlarmUpdate, AlarmBulkUpdateItem
+from src.schemas.serializers import alarm_to_dict
+from src.services.user_service import UserService
+from src.utils.recurrence import (
+    calculate_next_trigger_time,
+    calculate_next_trigger_times,
+    validate_recurrence_pattern,
+)
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# AlarmUpdate fields written as-is; the next trigger is derived from them
+UPDATABLE_FIELDS = ("scheduled_time", "recurrence_type", "recurrence_days", "enabled")
+
+
+class InvalidAlarmError(ValueError):
+    """Raised when an alarm's recurrence pattern is invalid."""
+
 
 class AlarmService:
     """Service for alarm operations."""
     
     @staticmethod
-    def create_alarm(db: Session, alarm_data: AlarmCreate) -> Optional[Alarm]:
-        """Create a new alarm for a memo."""
-        # Validate recurrence pattern
-        if not validate_recurrence_pattern(alarm_data.recurrence_type, alarm_data.recurrence_days):
-            logger.warning(f"Invalid recurrence pattern: {alarm_data.recurrence_type}")
-            return None
+    def create_alarm(db: Session, user_id: int, alarm_data: AlarmCreate) -> Optional[Dict]:
+        """Create an alarm on one of the user's memos.
+        
+        The ownership check is fused into the insert (INSERT ... SELECT from
+        the user's memo ... RETURNING), so a missing or foreign memo inserts
+        nothing and returns None. Raises InvalidAlarmError for a bad pattern.
+        """
+        error = AlarmService.spec_error(alarm_data)
+        if error:
+            raise InvalidAlarmError(error)
         
-        # Check memo exists
-        memo = db.query(Memo).filter(Memo.id == alarm_data.memo_id).first()
-        if not memo:
+        row = AlarmService.build_alarm_rows([(alarm_data.memo_id, alarm_data)])[0]
+        del row["memo_id"]
+        owned_memo = select(
+            Memo.id, *(literal(value, Alarm.__table__.c[key].type) for key, value in row.items())
+        ).where(Memo.id == alarm_data.memo_id, Memo.user_id == user_id)
+        alarm = db.scalars(
+            insert(Alarm).from_select(["memo_id", *row], owned_memo).returning(Alarm)
+        ).first()
+        if alarm is None:
             logger.warning(f"Memo not found: {alarm_data.memo_id}")
             return None
         
-        # Calculate next trigger time
-        next_trigger = calculate_next_trigger_time(
-            alarm_data.scheduled_time,
-            alarm_data.recurrence_type,
-            alarm_data.recurrence_days,
-            alarm_data.user_timezone
-        )
-        
-        alarm = Alarm(
-            memo_id=alarm_data.memo_id,
-            scheduled_time=alarm_data.scheduled_time,
-            recurrence_type=alarm_data.recurrence_type,
-            recurrence_days=alarm_data.recurrence_days,
-            next_trigger_time=next_trigger,
-            user_timezone=alarm_data.user_timezone,
-            enabled=True
-        )
-        db.add(alarm)
+        UserService.bump_data_version(db, user_id)
+        # Serialized before the commit expires it, which would cost a refresh
+        data = alarm_to_dict(alarm)
         db.commit()
-        db.refresh(alarm)
-        logger.info(f"Alarm created: {alarm.id} for memo {alarm_data.memo_id}")
-        return alarm
+        logger.info("Alarm created: %s for memo %s", data["id"], alarm_data.memo_id)
+        return data
     
     @staticmethod
     def get_alarm(db: Session, alarm_id: int) -> Optional[Alarm]:
-        """Get a specific alarm by ID."""
-        return db.query(Alarm).filter(Alarm.id == alarm_id).first()
+        """Get a specific alarm by ID (from the session's identity map when loaded)."""
+        return db.get(Alarm, alarm_id)
+    
+    @staticmethod
+    def _owned_by(user_id: int):
+        """Predicate: the alarm's memo belongs to the user (correlated EXISTS)."""
+        return exists().where(Memo.id == Alarm.memo_id, Memo.user_id == user_id)
+    
+    @staticmethod
+    def get_owned_alarm(db: Session, alarm_id: int, user_id: int) -> Optional[Alarm]:
+        """Get an alarm only if the user owns its memo (one joined query)."""
+        return db.scalars(
+            select(Alarm).join(Memo, Memo.id == Alarm.memo_id).where(
+                Alarm.id == alarm_id,
+                Memo.user_id == user_id
+            )
+        ).first()
     
     @staticmethod
     def list_alarms_for_memo(db: Session, memo_id: int) -> List[Alarm]:
@@ -62,63 +86,291 @@ class AlarmService:
         return db.query(Alarm).filter(Alarm.memo_id == memo_id).all()
     
     @staticmethod
-    def update_alarm(db: Session, alarm_id: int, alarm_data: AlarmUpdate) -> Optional[Alarm]:
-        """Update an alarm."""
-        alarm = AlarmService.get_alarm(db, alarm_id)
-        if not alarm:
-            return None
-        
+    def _merged_pattern(alarm: Alarm, alarm_data: AlarmUpdate) -> Tuple[str, str, Optional[str], str]:
+        """Recurrence pattern the alarm (or a row of its pattern columns) will have once `alarm_data` is applied."""
+        return (
+            alarm_data.scheduled_time if alarm_data.scheduled_time is not None else alarm.scheduled_time,
+            alarm_data.recurrence_type if alarm_data.recurrence_type is not None else alarm.recurrence_type,
+            alarm_data.recurrence_days if alarm_data.recurrence_days is not None else alarm.recurrence_days,
+            alarm.user_timezone,
+        )
+    
+    @staticmethod
+    def _apply_update(alarm: Alarm, alarm_data: AlarmUpdate, next_trigger: datetime) -> None:
+        """Copy the provided update fields onto the alarm."""
         if alarm_data.scheduled_time is not None:
             alarm.scheduled_time = alarm_data.scheduled_time
         if alarm_data.recurrence_type is not None:
             alarm.recurrence_type = alarm_data.recurrence_type
         if alarm_data.recurrence_days is not None:
             alarm.recurrence_days = alarm_data.recurrence_days
+        if alarm_data.enabled is not None:
+            alarm.enabled = alarm_data.enabled
+        alarm.next_trigger_time = next_trigger
+    
+    @staticmethod
+    def update_alarm(db: Session, alarm_id: int, user_id: int, alarm_data: AlarmUpdate) -> Optional[Dict]:
+        """Update one of the user's alarms.
+        
+        Returns None if the alarm is missing or not the user's, and raises
+        InvalidAlarmError if the merged pattern (time, recurrence, timezone)
+        is invalid.
+        """
+        # Only the pattern columns: an Alarm loaded here would be the same
+        # identity as the RETURNING row below and keep its stale attributes
+        current = db.execute(
+            select(Alarm.scheduled_time, Alarm.recurrence_type, Alarm.recurrence_days, Alarm.user_timezone)
+            .where(Alarm.id == alarm_id, AlarmService._owned_by(user_id))
+        ).first()
+        if not current:
+            return None
+        
+        pattern = AlarmService._merged_pattern(current, alarm_data)
+        error = AlarmService.pattern_error(pattern)
+        if error:
+            logger.warning("Alarm %s not updated: %s", alarm_id, error)
+            raise InvalidAlarmError(error)
         
         # Recalculate next trigger time
-        next_trigger = calculate_next_trigger_time(
-            alarm.scheduled_time,
-            alarm.recurrence_type,
-            alarm.recurrence_days,
-            alarm.user_timezone
-        )
-        alarm.next_trigger_time = next_trigger
+        values = alarm_data.model_dump(include=set(UPDATABLE_FIELDS), exclude_none=True)
+        values["next_trigger_time"] = calculate_next_trigger_time(*pattern)
+        alarm = db.scalars(
+            update(Alarm).where(Alarm.id == alarm_id).values(**values).returning(Alarm)
+        ).one()
+        UserService.bump_data_version(db, user_id)
         
+        data = alarm_to_dict(alarm)
         db.commit()
-        db.refresh(alarm)
-        logger.info(f"Alarm updated: {alarm.id}")
-        return alarm
+        logger.info("Alarm updated: %s", alarm_id)
+        return data
     
     @staticmethod
-    def delete_alarm(db: Session, alarm_id: int) -> bool:
-        """Delete an alarm."""
-        alarm = AlarmService.get_alarm(db, alarm_id)
-        if not alarm:
+    def delete_alarm(db: Session, alarm_id: int, user_id: int) -> bool:
+        """Delete one of the user's alarms. Returns False if there was none."""
+        deleted = db.scalars(
+            delete(Alarm).where(Alarm.id == alarm_id, AlarmService._owned_by(user_id))
+            .returning(Alarm.id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if deleted is None:
             return False
         
-        db.delete(alarm)
+        if db.get_bind().dialect.name != "postgresql":
+            # Only PostgreSQL enforces the ON DELETE CASCADE to history here
+            for model in (AlarmHistory, AlarmHistoryDaily):
+                db.execute(delete(model).where(model.alarm_id == alarm_id).execution_options(synchronize_session=False))
+        UserService.bump_data_version(db, user_id)
         db.commit()
-        logger.info(f"Alarm deleted: {alarm_id}")
+        logger.info("Alarm deleted: %s", alarm_id)
         return True
     
     @staticmethod
-    def update_alarm_after_trigger(db: Session, alarm_id: int) -> Optional[Alarm]:
-        """Update alarm's next trigger time after it has been triggered."""
+    def update_alarm_after_trigger(db: Session, alarm_id: int, now: Optional[datetime] = None) -> Optional[Alarm]:
+        """Update alarm's next trigger time after it has been triggered (caller commits).
+        
+        `now` is the trigger time (default: the current time).
+        """
         alarm = AlarmService.get_alarm(db, alarm_id)
         if not alarm:
             return None
         
-        alarm.last_triggered = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
+        alarm.last_triggered = now
         
         # Recalculate next trigger
         next_trigger = calculate_next_trigger_time(
             alarm.scheduled_time,
             alarm.recurrence_type,
             alarm.recurrence_days,
-            alarm.user_timezone
+            alarm.user_timezone,
+            now=now
         )
         alarm.next_trigger_time = next_trigger
-        
-        db.commit()
-        db.refresh(alarm)
         return alarm
+    
+    # Bulk operations: validate every item, apply the valid ones in one
+    # transaction with multi-row statements, and report the rest.
+    
+    @staticmethod
+    def build_alarm_rows(
+        specs: Sequence[Tuple[int, AlarmSpec]], now: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Insert rows for (memo_id, spec) pairs, with next triggers computed in one batch."""
+        next_triggers = calculate_next_trigger_times(
+            ((s.scheduled_time, s.recurrence_type, s.recurrence_days, s.user_timezone) for _, s in specs),
+            now=now
+        )
+        return [
+            {
+                "memo_id": memo_id,
+                "scheduled_time": spec.scheduled_time,
+                "recurrence_type": spec.recurrence_type,
+                "recurrence_days": spec.recurrence_days,
+                "next_trigger_time": next_trigger,
+                "user_timezone": spec.user_timezone,
+                "enabled": True,
+            }
+            for (memo_id, spec), next_trigger in zip(specs, next_triggers)
+        ]
+    
+    @staticmethod
+    def spec_error(spec: AlarmSpec) -> Optional[str]:
+        """Validation error for an alarm spec, or None if it is valid."""
+        return AlarmService.pattern_error(
+            (spec.scheduled_time, spec.recurrence_type, spec.recurrence_days, spec.user_timezone)
+        )
+    
+    @staticmethod
+    def pattern_error(pattern: Tuple[str, str, Optional[str], str]) -> Optional[str]:
+        """Validation error for a (scheduled_time, recurrence_type, recurrence_days, user_timezone) pattern, or None."""
+        scheduled_time, recurrence_type, recurrence_days, user_timezone = pattern
+        if not scheduled_time:
+            return "scheduled_time is required"
+        hours, minutes = map(int, scheduled_time.split(":"))
+        if hours > 23 or minutes > 59:
+            return f"Invalid scheduled_time: {scheduled_time}"
+        if not validate_recurrence_pattern(recurrence_type, recurrence_days):
+            return f"Invalid recurrence pattern: {recurrence_type}"
+        try:
+            ZoneInfo(user_timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            return f"Invalid timezone: {user_timezone}"
+        return None
+    
+    @staticmethod
+    def owned_memo_ids(db: Session, user_id: int, memo_ids: Sequence[int]) -> set:
+        """Subset of memo ids owned by the user (one query)."""
+        if not memo_ids:
+            return set()
+        return set(db.execute(
+            select(Memo.id).where(Memo.user_id == user_id, Memo.id.in_(set(memo_ids)))
+        ).scalars())
+    
+    @staticmethod
+    def bulk_create_alarms(
+        db: Session, user_id: int, items: Sequence[AlarmCreate]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Create many alarms on the user's memos."""
+        owned = AlarmService.owned_memo_ids(db, user_id, [item.memo_id for item in items])
+        
+        errors = []
+        valid = []
+        for index, item in enumerate(items):
+            if item.memo_id not in owned:
+                errors.append({"index": index, "detail": "Memo not found"})
+                continue
+            error = AlarmService.spec_error(item)
+            if error:
+                errors.append({"index": index, "detail": error})
+                continue
+            valid.append((item.memo_id, item))
+        
+        ids = []
+        if valid:
+            rows = AlarmService.build_alarm_rows(valid)
+            ids = list(db.execute(
+                insert(Alarm).returning(Alarm.id, sort_by_parameter_order=True), rows
+            ).scalars())
+            UserService.bump_data_version(db, user_id)
+            db.commit()
+        
+        logger.info("Bulk created %s alarms for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
+    
+    @staticmethod
+    def bulk_update_alarms(
+        db: Session, user_id: int, items: Sequence[AlarmBulkUpdateItem]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Update many of the user's alarms."""
+        alarms = {
+            alarm.id: alarm
+            for alarm in db.query(Alarm).join(Memo, Memo.id == Alarm.memo_id).filter(
+                Memo.user_id == user_id,
+                Alarm.id.in_({item.id for item in items})
+            )
+        }
+        
+        errors = []
+        valid = []
+        seen = set()
+        for index, item in enumerate(items):
+            alarm = alarms.get(item.id)
+            if alarm is None:
+                errors.append({"index": index, "id": item.id, "detail": "Alarm not found"})
+                continue
+            if item.id in seen:
+                errors.append({"index": index, "id": item.id, "detail": "Duplicate id"})
+                continue
+            seen.add(item.id)
+            pattern = AlarmService._merged_pattern(alarm, item)
+            error = AlarmService.pattern_error(pattern)
+            if error:
+                errors.append({"index": index, "id": item.id, "detail": error})
+                continue
+            valid.append((index, alarm, item, pattern))
+        
+        try:
+            next_triggers = calculate_next_trigger_times(pattern for _, _, _, pattern in valid)
+        except ValueError:
+            # Not caught by pattern_error (e.g. a stored pattern that no longer
+            # parses): compute item by item to report the ones that fail
+            next_triggers = []
+            for index, alarm, item, pattern in list(valid):
+                try:
+                    next_triggers.append(calculate_next_trigger_time(*pattern))
+                except ValueError as e:
+                    valid.remove((index, alarm, item, pattern))
+                    errors.append({"index": index, "id": item.id, "detail": str(e)})
+        
+        if valid:
+            for (_, alarm, item, _), next_trigger in zip(valid, next_triggers):
+                AlarmService._apply_update(alarm, item, next_trigger)
+            UserService.bump_data_version(db, user_id)
+            # Flushed as executemany UPDATEs
+            db.commit()
+        
+        errors.sort(key=lambda error: error["index"])
+        ids = [alarm.id for _, alarm, _, _ in valid]
+        logger.info("Bulk updated %s alarms for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
+    
+    @staticmethod
+    def delete_alarm_rows(db: Session, alarm_ids: Sequence[int]) -> None:
+        """Delete alarms and their history with set-based statements (caller commits)."""
+        if not alarm_ids:
+            return
+        db.execute(delete(AlarmHistory).where(AlarmHistory.alarm_id.in_(alarm_ids)).execution_options(synchronize_session=False))
+        db.execute(delete(AlarmHistoryDaily).where(AlarmHistoryDaily.alarm_id.in_(alarm_ids)).execution_options(synchronize_session=False))
+        db.execute(delete(Alarm).where(Alarm.id.in_(alarm_ids)).execution_options(synchronize_session=False))
+    
+    @staticmethod
+    def bulk_delete_alarms(
+        db: Session, user_id: int, alarm_ids: Sequence[int]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Delete many of the user's alarms."""
+        owned = set(db.execute(
+            select(Alarm.id).join(Memo, Memo.id == Alarm.memo_id).where(
+                Memo.user_id == user_id,
+                Alarm.id.in_(set(alarm_ids))
+            )
+        ).scalars())
+        
+        errors = []
+        ids = []
+        seen = set()
+        for index, alarm_id in enumerate(alarm_ids):
+            if alarm_id not in owned:
+                errors.append({"index": index, "id": alarm_id, "detail": "Alarm not found"})
+            elif alarm_id in seen:
+                errors.append({"index": index, "id": alarm_id, "detail": "Duplicate id"})
+            else:
+                seen.add(alarm_id)
+                ids.append(alarm_id)
+        
+        if ids:
+            AlarmService.delete_alarm_rows(db, ids)
+            UserService.bump_data_version(db, user_id)
+            db.commit()
+        
+        logger.info("Bulk deleted %s alarms for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from ..models import User
 from ..schemas import UserCreate
+from .user_service import UserService
 from ..utils.security import (
     hash_password,
     verify_password,
@@ -90,6 +91,7 @@ class AuthService:
             return None
 
         user.timezone = timezone
+        UserService.invalidate_profile(db, user.id)
         db.commit()
         db.refresh(user)
         return user
@@ -0,0 +1,114 @@
+"""Service for streaming data exports."""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.models import Alarm, AlarmHistory, Memo
+from typing import Iterator, Optional
+from datetime import date, datetime
+import csv
+import enum
+import io
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip. Also the unit in which output is yielded.
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = {
+    "memos": [
+        Memo.id, Memo.user_id, Memo.title, Memo.description, Memo.created_at, Memo.updated_at,
+    ],
+    "alarms": [
+        Alarm.id, Alarm.memo_id, Alarm.alarm_type, Alarm.alarm_time, Alarm.repeat_interval,
+        Alarm.scheduled_time, Alarm.channel, Alarm.recurrence_type, Alarm.recurrence_days,
+        Alarm.next_trigger_time, Alarm.last_triggered, Alarm.last_delivery_status,
+        Alarm.enabled, Alarm.user_timezone, Alarm.created_at, Alarm.updated_at,
+    ],
+    "history": [
+        AlarmHistory.id, AlarmHistory.alarm_id, AlarmHistory.user_id, AlarmHistory.triggered_at,
+        AlarmHistory.delivery_status, AlarmHistory.error_message, AlarmHistory.retry_count,
+        AlarmHistory.created_at,
+    ],
+}
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain(value):
+    """Convert a column value to a JSON/CSV friendly scalar."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+class ExportService:
+    """Service for exporting memos, alarms and alarm history.
+
+    Rows are selected as plain column tuples (no ORM identity map) and
+    fetched `EXPORT_BATCH_SIZE` at a time with `yield_per`, which uses a
+    server-side cursor on PostgreSQL. Output is produced batch by batch, so
+    memory stays flat however large the export is.
+    """
+
+    @staticmethod
+    def _statement(resource: str, user_id: Optional[int]):
+        """Select for one resource, scoped to a user unless `user_id` is None."""
+        stmt = select(*EXPORT_COLUMNS[resource])
+        if resource == "memos":
+            if user_id is not None:
+                stmt = stmt.where(Memo.user_id == user_id)
+            return stmt.order_by(Memo.id)
+        if resource == "alarms":
+            if user_id is not None:
+                stmt = stmt.join(Memo, Memo.id == Alarm.memo_id).where(Memo.user_id == user_id)
+            return stmt.order_by(Alarm.id)
+        if user_id is not None:
+            stmt = stmt.where(AlarmHistory.user_id == user_id)
+        return stmt.order_by(AlarmHistory.id)
+
+    @staticmethod
+    def _batches(db: Session, resource: str, user_id: Optional[int]) -> Iterator[list]:
+        result = db.execute(
+            ExportService._statement(resource, user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        try:
+            for batch in result.partitions():
+                yield batch
+        finally:
+            result.close()
+
+    @staticmethod
+    def stream(db: Session, resource: str, fmt: str = "ndjson", user_id: Optional[int] = None) -> Iterator[str]:
+        """Yield the export as text chunks, one chunk per fetched batch.
+
+        `user_id=None` exports every user's rows (tenant-wide export).
+        """
+        names = [column.key for column in EXPORT_COLUMNS[resource]]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n") if fmt == "csv" else None
+        if writer:
+            writer.writerow(names)
+
+        count = 0
+        for batch in ExportService._batches(db, resource, user_id):
+            if writer:
+                writer.writerows([_plain(v) for v in row] for row in batch)
+            else:
+                for row in batch:
+                    buffer.write(json.dumps(dict(zip(names, map(_plain, row))), ensure_ascii=False))
+                    buffer.write("\n")
+            count += len(batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if writer and count == 0:
+            yield buffer.getvalue()
+        logger.info("Exported %s %s rows as %s (user %s)", count, resource, fmt, user_id if user_id is not None else "all")
@@ -0,0 +1,263 @@
+"""Service for alarm history partitioning, retention and compaction."""
+
+from sqlalchemy import TableClause, case, column, delete, func, select, table, text
+from sqlalchemy.orm import Session
+from src.config import settings
+from src.models import Alarm, AlarmHistory, AlarmHistoryDaily
+from src.services.user_service import UserService
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PREFIX = "alarm_history_p"
+_PARTITION_RE = re.compile(r"^alarm_history_p(\d{4})(\d{2})$")
+
+# Rows deleted per transaction when partitions are not available
+DELETE_BATCH_SIZE = 10000
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Return the first day of the month `months` after `month_start`."""
+    year, month = divmod(month_start.month - 1 + months, 12)
+    return date(month_start.year + year, month + 1, 1)
+
+
+def partition_name(month_start: date) -> str:
+    """Name of the monthly partition holding `month_start`'s rows."""
+    return f"{PARTITION_PREFIX}{month_start:%Y%m}"
+
+
+class HistoryRetentionService:
+    """Service for keeping `alarm_history` bounded.
+
+    PostgreSQL: the table is range-partitioned by month on `triggered_at`.
+    Partitions are created ahead of time and whole partitions past the
+    retention window are detached, summarized and dropped, which avoids
+    large deletes and index bloat. Expired rows that landed in the default
+    partition are deleted in batches.
+
+    SQLite (and unpartitioned PostgreSQL): expired rows are summarized and
+    deleted in batches using the `triggered_at` index.
+
+    In both cases expired detail rows are folded into `alarm_history_daily`.
+    """
+
+    @staticmethod
+    def is_partitioned(db: Session) -> bool:
+        """Check whether `alarm_history` is a partitioned table."""
+        if db.get_bind().dialect.name != "postgresql":
+            return False
+        row = db.execute(text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = 'alarm_history'"
+        )).first()
+        return row is not None
+
+    @staticmethod
+    def list_partitions(db: Session) -> List[Tuple[str, date]]:
+        """List monthly partitions as (name, first day of month), oldest first."""
+        names = db.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'alarm_history'"
+        )).scalars()
+
+        partitions = []
+        for name in names:
+            match = _PARTITION_RE.match(name)
+            if match:
+                partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+        return sorted(partitions, key=lambda p: p[1])
+
+    @staticmethod
+    def ensure_partitions(db: Session, now: Optional[datetime] = None) -> int:
+        """Create partitions for the current month and the configured months ahead."""
+        if not HistoryRetentionService.is_partitioned(db):
+            return 0
+
+        now = now or datetime.now(timezone.utc)
+        current = now.date().replace(day=1)
+        existing = {name for name, _ in HistoryRetentionService.list_partitions(db)}
+
+        created = 0
+        for offset in range(settings.HISTORY_PARTITIONS_AHEAD + 1):
+            start = _add_months(current, offset)
+            name = partition_name(start)
+            if name in existing:
+                continue
+            end = _add_months(start, 1)
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF alarm_history "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            created += 1
+
+        db.commit()
+        if created:
+            logger.info("Created %s alarm_history partitions", created)
+        return created
+
+    @staticmethod
+    def _summarize(db: Session, *conditions, source: TableClause = AlarmHistory.__table__) -> None:
+        """Add per-alarm daily counts for the matching history rows to the summary table.
+
+        `source` is `alarm_history` or a detached partition with the same columns.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        rows = source.c
+        day = func.date(rows.triggered_at)
+        summary = select(
+            rows.alarm_id,
+            day,
+            func.sum(case((rows.delivery_status == "sent", 1), else_=0)),
+            func.sum(case((rows.delivery_status == "failed", 1), else_=0)),
+            func.sum(case((rows.delivery_status == "pending", 1), else_=0)),
+            func.sum(rows.retry_count),
+        ).where(*conditions).group_by(rows.alarm_id, day)
+
+        stmt = insert(AlarmHistoryDaily).from_select(
+            ["alarm_id", "day", "sent_count", "failed_count", "pending_count", "retry_count"],
+            summary,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["alarm_id", "day"],
+            set_={
+                "sent_count": AlarmHistoryDaily.sent_count + stmt.excluded.sent_count,
+                "failed_count": AlarmHistoryDaily.failed_count + stmt.excluded.failed_count,
+                "pending_count": AlarmHistoryDaily.pending_count + stmt.excluded.pending_count,
+                "retry_count": AlarmHistoryDaily.retry_count + stmt.excluded.retry_count,
+            },
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def _bump_owners(db: Session, *conditions, source: TableClause = AlarmHistory.__table__) -> None:
+        """Bump the data version of the users owning the matching history rows (caller commits)."""
+        alarm_ids = select(source.c.alarm_id).where(*conditions)
+        UserService.bump_data_version_for_memos(db, select(Alarm.memo_id).where(Alarm.id.in_(alarm_ids)))
+
+    @staticmethod
+    def compact_expired(db: Session, now: Optional[datetime] = None) -> int:
+        """Summarize and remove history older than the retention window.
+
+        Returns the number of partitions dropped plus rows deleted.
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=settings.HISTORY_RETENTION_DAYS)).replace(tzinfo=None)
+
+        if not HistoryRetentionService.is_partitioned(db):
+            return HistoryRetentionService._delete_expired_rows(db, cutoff)
+
+        dropped = HistoryRetentionService._drop_expired_partitions(db, cutoff)
+        # Rows older than every remaining partition can only be in the default
+        # partition; delete those in batches (pruning keeps this to that partition)
+        partitions = HistoryRetentionService.list_partitions(db)
+        if partitions:
+            oldest = datetime.combine(partitions[0][1], datetime.min.time())
+            cutoff = min(cutoff, oldest)
+        return dropped + HistoryRetentionService._delete_expired_rows(db, cutoff)
+
+    @staticmethod
+    def _has_default_partition(db: Session) -> bool:
+        row = db.execute(text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = 'alarm_history' AND p.partdefid <> 0"
+        )).first()
+        return row is not None
+
+    @staticmethod
+    def _list_detached(db: Session) -> List[str]:
+        """Monthly partition tables left detached by an interrupted run."""
+        names = db.execute(text(
+            "SELECT c.relname FROM pg_class c "
+            "WHERE c.relkind = 'r' AND c.relname LIKE 'alarm\\_history\\_p%' "
+            "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)"
+        )).scalars()
+        return [name for name in names if _PARTITION_RE.match(name)]
+
+    @staticmethod
+    def _drop_expired_partitions(db: Session, cutoff: datetime) -> int:
+        """Detach and drop whole monthly partitions that end before the cutoff.
+
+        The partition is detached first, so the parent is locked only for
+        the detach (CONCURRENTLY, without blocking readers or writers, when
+        there is no default partition; PostgreSQL forbids it otherwise).
+        The detached table is then summarized and dropped in one transaction.
+        """
+        dropped = 0
+        for name in HistoryRetentionService._list_detached(db):
+            HistoryRetentionService._drop_detached(db, name)
+            dropped += 1
+
+        concurrently = not HistoryRetentionService._has_default_partition(db)
+        for name, start in HistoryRetentionService.list_partitions(db):
+            end = _add_months(start, 1)
+            if end > cutoff.date():
+                break
+
+            if concurrently:
+                # Cannot run inside a transaction block
+                db.commit()
+                with db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                    conn.execute(text(f"ALTER TABLE alarm_history DETACH PARTITION {name} CONCURRENTLY"))
+            else:
+                db.execute(text(f"ALTER TABLE alarm_history DETACH PARTITION {name}"))
+                db.commit()
+            HistoryRetentionService._drop_detached(db, name)
+            dropped += 1
+        return dropped
+
+    @staticmethod
+    def _drop_detached(db: Session, name: str) -> None:
+        """Summarize a detached partition and drop it."""
+        source = table(name, *(column(c) for c in ("alarm_id", "triggered_at", "delivery_status", "retry_count")))
+        # Summary, version bump and drop commit together so a crash cannot double-count
+        HistoryRetentionService._bump_owners(db, source=source)
+        HistoryRetentionService._summarize(db, source=source)
+        db.execute(text(f"DROP TABLE {name}"))
+        db.commit()
+        logger.info("Dropped expired alarm_history partition %s", name)
+
+    @staticmethod
+    def _delete_expired_rows(db: Session, cutoff: datetime) -> int:
+        """Summarize and delete expired rows in batches."""
+        deleted = 0
+        while True:
+            ids = db.execute(
+                select(AlarmHistory.id)
+                .where(AlarmHistory.triggered_at < cutoff)
+                .limit(DELETE_BATCH_SIZE)
+            ).scalars().all()
+            if not ids:
+                break
+
+            HistoryRetentionService._bump_owners(db, AlarmHistory.id.in_(ids))
+            HistoryRetentionService._summarize(db, AlarmHistory.id.in_(ids))
+            db.execute(
+                delete(AlarmHistory)
+                .where(AlarmHistory.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            deleted += len(ids)
+
+        if deleted:
+            logger.info("Compacted %s expired alarm_history rows", deleted)
+        return deleted
+
+    @staticmethod
+    def run_retention(db: Session, now: Optional[datetime] = None) -> int:
+        """Create upcoming partitions, then compact expired history."""
+        HistoryRetentionService.ensure_partitions(db, now)
+        # Owners of removed rows get their data version bumped as they go
+        return HistoryRetentionService.compact_expired(db, now)
@@ -0,0 +1,41 @@
+"""Service for reading alarm history."""
+
+from sqlalchemy.orm import Session
+from src.models import Alarm, AlarmHistory, Memo
+from src.utils.pagination import apply_keyset, split_page
+from typing import List, Optional, Tuple
+
+
+class HistoryService:
+    """Service for alarm history reads.
+
+    Pages are ordered newest first on (`triggered_at`, `id`) and use keyset
+    cursors, so every page is an index range scan of `limit` rows.
+    """
+
+    @staticmethod
+    def user_owns_alarm(db: Session, alarm_id: int, user_id: int) -> bool:
+        """Check alarm ownership with a single joined query."""
+        row = db.query(Alarm.id).join(Memo, Memo.id == Alarm.memo_id).filter(
+            Alarm.id == alarm_id,
+            Memo.user_id == user_id
+        ).first()
+        return row is not None
+
+    @staticmethod
+    def list_for_alarm(
+        db: Session, alarm_id: int, cursor: Optional[str] = None, limit: int = 50
+    ) -> Tuple[List[AlarmHistory], Optional[str]]:
+        """Page through one alarm's history (uses idx_alarm_history_alarm_triggered)."""
+        query = db.query(AlarmHistory).filter(AlarmHistory.alarm_id == alarm_id)
+        query = apply_keyset(query, AlarmHistory.triggered_at, AlarmHistory.id, cursor, limit)
+        return split_page(query.all(), limit, "triggered_at")
+
+    @staticmethod
+    def list_for_user(
+        db: Session, user_id: int, cursor: Optional[str] = None, limit: int = 50
+    ) -> Tuple[List[AlarmHistory], Optional[str]]:
+        """Page through the history of all of a user's alarms (uses idx_alarm_history_user_triggered)."""
+        query = db.query(AlarmHistory).filter(AlarmHistory.user_id == user_id)
+        query = apply_keyset(query, AlarmHistory.triggered_at, AlarmHistory.id, cursor, limit)
+        return split_page(query.all(), limit, "triggered_at")
@@ -0,0 +1,266 @@
+"""Service for streamed bulk memo imports."""
+
+from pydantic import ValidationError
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+from src.models import Alarm, ImportJob, Memo
+from src.schemas import MemoBulkCreateItem
+from src.services.alarm_service import AlarmService
+from src.services.memo_service import MemoService
+from src.services.user_service import UserService
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple
+from datetime import datetime, timedelta, timezone
+import csv
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Input records per transaction; progress is saved after each one
+IMPORT_CHUNK_SIZE = 5000
+# Rejected records kept on the job for the report
+MAX_REPORTED_ERRORS = 100
+# A running job whose progress has not been saved for this long is
+# presumed dead (its worker crashed or restarted) and may be resumed
+IMPORT_LEASE_SECONDS = 300
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+# CSV imports hold one memo per row with at most one alarm
+CSV_ALARM_FIELDS = ("scheduled_time", "recurrence_type", "recurrence_days", "user_timezone")
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Tuple[Optional[dict], Optional[str]]]:
+    """Yield (record, parse_error) for each input record, lazily.
+
+    NDJSON: one memo object per line, with an optional `alarms` list.
+    CSV: header row, then `title`, `description` and optional alarm columns.
+    Blank NDJSON lines are skipped and not counted as records.
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            row = {key: (value or None) for key, value in row.items() if key}
+            record = {"title": row.get("title"), "description": row.get("description")}
+            if row.get("scheduled_time"):
+                record["alarms"] = [{k: row[k] for k in CSV_ALARM_FIELDS if row.get(k)}]
+            yield record, None
+        return
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield None, "Expected a JSON object"
+            continue
+        yield record, None
+
+
+def _validate(record: Optional[dict], parse_error: Optional[str]) -> Tuple[Optional[MemoBulkCreateItem], Optional[str]]:
+    """Validate one record as a memo with alarms.
+
+    Everything the insert depends on is checked here (alarm times, patterns
+    and timezones), so a bad record is rejected on its own instead of
+    failing its whole chunk on every resume.
+    """
+    if parse_error:
+        return None, parse_error
+    try:
+        item = MemoBulkCreateItem.model_validate(record)
+    except ValidationError as e:
+        first = e.errors()[0]
+        return None, f"{'.'.join(str(p) for p in first['loc'])}: {first['msg']}"
+    error = next((e for e in map(AlarmService.spec_error, item.alarms) if e), None)
+    return (None, error) if error else (item, None)
+
+
+class ImportService:
+    """Service for importing memos and alarms from NDJSON or CSV streams.
+
+    Records are parsed and validated one at a time and inserted in chunks of
+    `IMPORT_CHUNK_SIZE`: with COPY on PostgreSQL, multi-row INSERTs
+    elsewhere. Each chunk commits together with the job's progress, so
+    running the job again on the same input resumes after the last
+    committed chunk.
+    """
+
+    @staticmethod
+    def create_job(db: Session, user_id: int, fmt: str) -> ImportJob:
+        """Create a pending import job."""
+        job = ImportJob(user_id=user_id, format=fmt, status="pending")
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def get_job(db: Session, job_id: int, user_id: int) -> Optional[ImportJob]:
+        """Get an import job (only if user owns it)."""
+        return db.query(ImportJob).filter(
+            ImportJob.id == job_id,
+            ImportJob.user_id == user_id
+        ).first()
+
+    @staticmethod
+    def claim_for_resume(db: Session, job: ImportJob, now: Optional[datetime] = None) -> bool:
+        """Set a failed or stale job back to pending; False if it is not resumable.
+
+        A job is stale when it is pending or running but its progress (and
+        so `updated_at`) has not moved for `IMPORT_LEASE_SECONDS`. The
+        check and the update are one statement, so only one resume wins.
+        """
+        now = (now or datetime.now(timezone.utc)).replace(tzinfo=None)
+        expired = now - timedelta(seconds=IMPORT_LEASE_SECONDS)
+        claimed = db.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == job.id,
+                or_(
+                    ImportJob.status == "failed",
+                    and_(ImportJob.status.in_(("pending", "running")), ImportJob.updated_at < expired),
+                ),
+            )
+            .values(status="pending", updated_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        db.refresh(job)
+        if claimed:
+            logger.info("Import job %s claimed for resume at record %s", job.id, job.records_processed)
+        return bool(claimed)
+
+    @staticmethod
+    def _copy_rows(db: Session, table, rows: List[dict]) -> None:
+        """Load rows with COPY, filling column defaults like an INSERT would."""
+        dialect = db.get_bind().dialect
+        columns = [c for c in table.columns if c.key in rows[0] or (c.default is not None and not c.primary_key)]
+        defaults = {
+            c.key: (c.default.arg(None) if c.default.is_callable else c.default.arg)
+            for c in columns if c.key not in rows[0]
+        }
+        processors = [c.type.bind_processor(dialect) for c in columns]
+
+        cursor = db.connection().connection.cursor()
+        try:
+            names = ", ".join(c.name for c in columns)
+            with cursor.copy(f"COPY {table.name} ({names}) FROM STDIN") as copy:
+                for row in rows:
+                    values = [row[c.key] if c.key in row else defaults[c.key] for c in columns]
+                    copy.write_row([p(v) if p else v for p, v in zip(processors, values)])
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _copy_memos(db: Session, user_id: int, items: List[MemoBulkCreateItem]) -> Tuple[List[int], int]:
+        """PostgreSQL: COPY memos and alarms, with memo ids taken from the sequence up front."""
+        ids = list(db.execute(
+            select(func.nextval("memos_id_seq")).select_from(func.generate_series(1, len(items)))
+        ).scalars())
+        now = datetime.now(timezone.utc)
+        ImportService._copy_rows(db, Memo.__table__, [
+            {
+                "id": memo_id,
+                "user_id": user_id,
+                "title": item.title,
+                "description": item.description,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for memo_id, item in zip(ids, items)
+        ])
+
+        specs = [(memo_id, spec) for memo_id, item in zip(ids, items) for spec in item.alarms]
+        if specs:
+            ImportService._copy_rows(db, Alarm.__table__, AlarmService.build_alarm_rows(specs, now=now))
+
+        # The search vector is a generated column, so only the counter needs updating
+        UserService.adjust_memo_count(db, user_id, len(ids))
+        return ids, len(specs)
+
+    @staticmethod
+    def _insert_chunk(db: Session, user_id: int, items: List[MemoBulkCreateItem]) -> Tuple[int, int]:
+        if db.get_bind().dialect.name == "postgresql":
+            ids, alarms = ImportService._copy_memos(db, user_id, items)
+        else:
+            ids, alarms = MemoService.insert_memos(db, user_id, items)
+        return len(ids), alarms
+
+    @staticmethod
+    def run(
+        db: Session,
+        job: ImportJob,
+        stream: TextIO,
+        on_progress: Optional[Callable[[ImportJob], None]] = None
+    ) -> ImportJob:
+        """Import `stream` into the job's user, resuming after `job.records_processed`.
+
+        Failures mark the job as failed and are not raised; the committed
+        chunks stay in place and a later run continues from there.
+        """
+        skip = job.records_processed
+        errors = job.errors
+        job.status = "running"
+        job.error_message = None
+        db.commit()
+
+        def flush(items: List[MemoBulkCreateItem], consumed: int, rejected: int) -> None:
+            if items:
+                memos, alarms = ImportService._insert_chunk(db, job.user_id, items)
+                job.memos_created += memos
+                job.alarms_created += alarms
+            job.records_processed += consumed
+            job.records_rejected += rejected
+            job.error_samples = json.dumps(errors) if errors else None
+            db.commit()
+            if on_progress:
+                on_progress(job)
+
+        try:
+            items, consumed, rejected = [], 0, 0
+            for number, (record, parse_error) in enumerate(read_records(stream, job.format), start=1):
+                if number <= skip:
+                    continue
+                item, error = _validate(record, parse_error)
+                if error:
+                    rejected += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append({"record": number, "detail": error})
+                else:
+                    items.append(item)
+                consumed += 1
+                if consumed >= IMPORT_CHUNK_SIZE:
+                    flush(items, consumed, rejected)
+                    items, consumed, rejected = [], 0, 0
+            flush(items, consumed, rejected)
+        except Exception as e:
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(e)[:500]
+            db.commit()
+            logger.error("Import job %s failed after %s records: %s", job.id, job.records_processed, e, exc_info=True)
+            return job
+
+        job.status = "completed"
+        db.commit()
+        logger.info(
+            f"Import job {job.id} completed: {job.memos_created} memos, "
+            f"{job.alarms_created} alarms, {job.records_rejected} rejected"
+        )
+        return job
+
+    @staticmethod
+    def run_file(job_id: int, path: str, encoding: str = "utf-8-sig") -> None:
+        """Run an import from a spooled file in a session of its own (background task)."""
+        from src.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            job = db.get(ImportJob, job_id)
+            with open(path, encoding=encoding, newline="") as stream:
+                ImportService.run(db, job, stream)
+        finally:
+            db.close()
@@ -1,9 +1,17 @@
 """Service for memo management."""
 
-from sqlalchemy.orm import Session
-from src.models import Memo, User
-from src.schemas import MemoCreate, MemoUpdate
-from typing import List, Optional
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, selectinload
+from src.models import Alarm, Memo, User
+from src.schemas import MemoCreate, MemoUpdate, MemoBulkCreateItem, MemoBulkUpdateItem
+from src.schemas.serializers import memo_to_dict, memo_with_alarms_to_dict
+from src.services.alarm_service import AlarmService
+from src.services.search_service import MemoSearchService
+from src.services.user_service import UserService
+from src.utils.cache import cached_json
+from src.utils.pagination import apply_keyset, split_page
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,9 +29,12 @@ class MemoService:
             description=memo_data.description
         )
         db.add(memo)
+        db.flush()
+        MemoSearchService.index_memo(db, memo)
+        UserService.adjust_memo_count(db, user_id, 1)
         db.commit()
         db.refresh(memo)
-        logger.info(f"Memo created: {memo.id} for user {user_id}")
+        logger.info("Memo created: %s for user %s", memo.id, user_id)
         return memo
     
     @staticmethod
@@ -35,11 +46,68 @@ class MemoService:
         ).first()
     
     @staticmethod
-    def list_memos(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Memo]:
-        """List all memos for a user."""
-        return db.query(Memo).filter(
-            Memo.user_id == user_id
-        ).offset(skip).limit(limit).all()
+    def list_memos(
+        db: Session,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_alarms: bool = False
+    ) -> Tuple[List[Memo], Optional[str]]:
+        """List a user's memos newest first, paginated by (created_at, id) cursor.
+
+        With `include_alarms`, the page's alarms are loaded in one extra
+        `IN` query rather than one query per memo.
+        """
+        query = db.query(Memo).filter(Memo.user_id == user_id)
+        if include_alarms:
+            query = query.options(selectinload(Memo.alarms))
+        query = apply_keyset(query, Memo.created_at, Memo.id, cursor, limit)
+        return split_page(query.all(), limit, "created_at")
+    
+    @staticmethod
+    def get_memo_data(db: Session, memo_id: int, user_id: int) -> Optional[dict]:
+        """Serialized memo detail, served from the user's read cache."""
+        def load():
+            memo = MemoService.get_memo(db, memo_id, user_id)
+            return memo_to_dict(memo) if memo else None
+        
+        return cached_json(user_id, f"memo:{memo_id}", load)
+    
+    @staticmethod
+    def get_memo_page(
+        db: Session,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_alarms: bool = False,
+        total: Optional[int] = None
+    ) -> dict:
+        """Serialized memo list page with total, served from the user's read cache.
+        
+        `total` is the user's memo count when the caller has it already
+        (check_etag reads it with the data version); otherwise it is queried.
+        
+        Entries are invalidated by any memo or alarm write for the user (see
+        UserService). Within one process (or with the Redis cache) a hit is
+        never older than the last commit, as long as a replica lags less
+        than REPLICA_READ_YOUR_WRITES_SECONDS; with the in-process cache and
+        several workers, other workers may serve a page up to
+        CACHE_TTL_SECONDS old.
+        """
+        def load():
+            memos, next_cursor = MemoService.list_memos(db, user_id, cursor, limit, include_alarms)
+            serialize = memo_with_alarms_to_dict if include_alarms else memo_to_dict
+            return {
+                "items": [serialize(memo) for memo in memos],
+                "total": total if total is not None else UserService.get_memo_count(db, user_id),
+                "next_cursor": next_cursor,
+            }
+        
+        page = cached_json(user_id, f"memos:{cursor}:{limit}:{int(include_alarms)}", load)
+        if total is not None:
+            # Fresher than a cached copy, and read with the ETag's version
+            page["total"] = total
+        return page
     
     @staticmethod
     def update_memo(db: Session, memo_id: int, user_id: int, memo_data: MemoUpdate) -> Optional[Memo]:
@@ -53,9 +121,11 @@ class MemoService:
         if memo_data.description is not None:
             memo.description = memo_data.description
         
+        MemoSearchService.index_memo(db, memo)
+        UserService.bump_data_version(db, user_id)
         db.commit()
         db.refresh(memo)
-        logger.info(f"Memo updated: {memo.id}")
+        logger.info("Memo updated: %s", memo.id)
         return memo
     
     @staticmethod
@@ -66,6 +136,141 @@ class MemoService:
             return False
         
         db.delete(memo)
+        MemoSearchService.remove_memo(db, memo_id)
+        UserService.adjust_memo_count(db, user_id, -1)
         db.commit()
-        logger.info(f"Memo deleted: {memo_id}")
+        logger.info("Memo deleted: %s", memo_id)
         return True
+    
+    # Bulk operations: validate every item, apply the valid ones in one
+    # transaction with multi-row statements, and report the rest.
+    
+    @staticmethod
+    def insert_memos(
+        db: Session, user_id: int, items: Sequence[MemoBulkCreateItem], now: Optional[datetime] = None
+    ) -> Tuple[List[int], int]:
+        """Insert validated memos and their alarms with multi-row statements (caller commits).
+        
+        Keeps the search index and memo counter in step. Returns the new memo
+        ids in input order and the number of alarms created.
+        """
+        now = now or datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": user_id,
+                "title": item.title,
+                "description": item.description,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in items
+        ]
+        ids = list(db.execute(
+            insert(Memo).returning(Memo.id, sort_by_parameter_order=True), rows
+        ).scalars())
+        
+        specs = [(memo_id, spec) for memo_id, item in zip(ids, items) for spec in item.alarms]
+        if specs:
+            db.execute(insert(Alarm), AlarmService.build_alarm_rows(specs, now=now))
+        
+        MemoSearchService.index_memos(db, [
+            Memo(id=memo_id, user_id=user_id, title=row["title"], description=row["description"])
+            for memo_id, row in zip(ids, rows)
+        ])
+        UserService.adjust_memo_count(db, user_id, len(ids))
+        return ids, len(specs)
+    
+    @staticmethod
+    def bulk_create_memos(
+        db: Session, user_id: int, items: Sequence[MemoBulkCreateItem]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Create many memos, each with its alarms.
+        
+        A memo with an invalid alarm is rejected as a whole.
+        """
+        errors = []
+        valid = []
+        for index, item in enumerate(items):
+            error = next((e for e in map(AlarmService.spec_error, item.alarms) if e), None)
+            if error:
+                errors.append({"index": index, "detail": error})
+                continue
+            valid.append(item)
+        
+        ids = []
+        if valid:
+            ids, _ = MemoService.insert_memos(db, user_id, valid)
+            db.commit()
+        
+        logger.info("Bulk created %s memos for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
+    
+    @staticmethod
+    def bulk_update_memos(
+        db: Session, user_id: int, items: Sequence[MemoBulkUpdateItem]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Update many of the user's memos."""
+        memos = {
+            memo.id: memo
+            for memo in db.query(Memo).filter(
+                Memo.user_id == user_id,
+                Memo.id.in_({item.id for item in items})
+            )
+        }
+        
+        errors = []
+        updated = []
+        seen = set()
+        for index, item in enumerate(items):
+            memo = memos.get(item.id)
+            if memo is None:
+                errors.append({"index": index, "id": item.id, "detail": "Memo not found"})
+                continue
+            if item.id in seen:
+                errors.append({"index": index, "id": item.id, "detail": "Duplicate id"})
+                continue
+            seen.add(item.id)
+            if item.title is not None:
+                memo.title = item.title
+            if item.description is not None:
+                memo.description = item.description
+            updated.append(memo)
+        
+        if updated:
+            MemoSearchService.index_memos(db, updated)
+            UserService.bump_data_version(db, user_id)
+            db.commit()
+        
+        ids = [memo.id for memo in updated]
+        logger.info("Bulk updated %s memos for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
+    
+    @staticmethod
+    def bulk_delete_memos(
+        db: Session, user_id: int, memo_ids: Sequence[int]
+    ) -> Tuple[List[int], List[Dict]]:
+        """Delete many of the user's memos with their alarms."""
+        owned = AlarmService.owned_memo_ids(db, user_id, memo_ids)
+        
+        errors = []
+        ids = []
+        seen = set()
+        for index, memo_id in enumerate(memo_ids):
+            if memo_id not in owned:
+                errors.append({"index": index, "id": memo_id, "detail": "Memo not found"})
+            elif memo_id in seen:
+                errors.append({"index": index, "id": memo_id, "detail": "Duplicate id"})
+            else:
+                seen.add(memo_id)
+                ids.append(memo_id)
+        
+        if ids:
+            alarm_ids = list(db.execute(select(Alarm.id).where(Alarm.memo_id.in_(ids))).scalars())
+            AlarmService.delete_alarm_rows(db, alarm_ids)
+            db.execute(delete(Memo).where(Memo.id.in_(ids)).execution_options(synchronize_session=False))
+            MemoSearchService.remove_memos(db, ids)
+            UserService.adjust_memo_count(db, user_id, -len(ids))
+            db.commit()
+        
+        logger.info("Bulk deleted %s memos for user %s (%s rejected)", len(ids), user_id, len(errors))
+        return ids, errors
@@ -1,11 +1,15 @@
 """Service for alarm scheduling and delivery."""
 
-from sqlalchemy.orm import Session
-from src.models import Alarm, AlarmHistory, User
+from sqlalchemy.orm import Session, joinedload
+from src.models import Alarm, AlarmHistory
 from src.database import SessionLocal
 from src.services.alarm_service import AlarmService
+from src.services.user_service import Recipient, UserService
 from src.services.telegram_service import TelegramNotificationService
+from src.utils.events import publish
+from src.utils.query_stats import track_queries
 from datetime import datetime, timezone
+from typing import Optional
 import asyncio
 import logging
 
@@ -16,28 +20,60 @@ class AlarmSchedulerService:
     """Service for checking and processing due alarms."""
     
     @staticmethod
-    def check_due_alarms(db: Session) -> int:
-        """Check for alarms that are due to trigger."""
-        now_utc = datetime.now(timezone.utc)
+    def check_due_alarms(db: Session, now: Optional[datetime] = None) -> int:
+        """Check for alarms that are due to trigger.
         
-        # Find alarms that are due (within next minute window)
-        due_alarms = db.query(Alarm).filter(
+        `now` replaces the wall clock (the scheduler simulation runs on a
+        virtual one); it defaults to the current UTC time.
+        """
+        with track_queries() as queries:
+            count = AlarmSchedulerService._process_due_alarms(db, now or datetime.now(timezone.utc))
+        
+        logger.info(
+            "Processed %s due alarms (%s queries, %.1f ms in the database)",
+            count, queries.count, queries.seconds * 1000
+        )
+        return count
+    
+    @staticmethod
+    def _process_due_alarms(db: Session, now_utc: datetime) -> int:
+        # Find alarms that are due (within next minute window), with their memos
+        due_alarms = db.query(Alarm).options(joinedload(Alarm.memo)).filter(
             Alarm.enabled == True,
             Alarm.next_trigger_time <= now_utc
         ).all()
         
+        # Resolve every recipient up front, with one query
+        recipients = UserService.get_recipients(
+            db, {alarm.memo.user_id for alarm in due_alarms if alarm.memo}
+        )
+        
+        # Each alarm commits on its own; keep the loaded alarms and memos
+        # across those commits instead of reloading every later one
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
         count = 0
-        for alarm in due_alarms:
-            success = AlarmSchedulerService.process_alarm(db, alarm)
-            if success:
-                count += 1
+        try:
+            for alarm in due_alarms:
+                recipient = recipients.get(alarm.memo.user_id) if alarm.memo else None
+                success = AlarmSchedulerService.process_alarm(db, alarm, recipient, now_utc)
+                if success:
+                    count += 1
+        finally:
+            db.expire_on_commit = expire_on_commit
         
-        logger.info(f"Processed {count} due alarms")
         return count
     
     @staticmethod
-    def process_alarm(db: Session, alarm: Alarm) -> bool:
-        """Process a single alarm trigger."""
+    def process_alarm(
+        db: Session, alarm: Alarm, recipient: Optional[Recipient] = None, now: Optional[datetime] = None
+    ) -> bool:
+        """Process a single alarm trigger.
+        
+        `recipient` is the memo owner's delivery target when the caller
+        resolved it already; otherwise it is looked up.
+        `now` is the trigger time to record (default: the current time).
+        """
         try:
             # Get memo and user info
             memo = alarm.memo
@@ -45,7 +81,7 @@ class AlarmSchedulerService:
                 logger.warning(f"Memo not found for alarm {alarm.id}")
                 return False
             
-            user = memo.user
+            user = recipient or UserService.get_recipients(db, [memo.user_id]).get(memo.user_id)
             if not user:
                 logger.warning(f"User not found for memo {memo.id}")
                 return False
@@ -79,20 +115,37 @@ class AlarmSchedulerService:
                 error_message = "User has not linked Telegram account"
             
             # Record in alarm history
+            triggered_at = now or datetime.now(timezone.utc)
             history = AlarmHistory(
                 alarm_id=alarm.id,
-                triggered_at=datetime.now(timezone.utc),
+                user_id=memo.user_id,
+                triggered_at=triggered_at,
                 delivery_status=delivery_status,
                 error_message=error_message,
                 retry_count=0
             )
             db.add(history)
+            alarm.last_delivery_status = delivery_status
+            UserService.bump_data_version(db, memo.user_id)
             
             # Update alarm's next trigger time
-            AlarmService.update_alarm_after_trigger(db, alarm.id)
+            AlarmService.update_alarm_after_trigger(db, alarm.id, triggered_at)
             
+            # Built before the commit expires the alarm and memo (reading them
+            # afterwards would reload each)
+            user_id = memo.user_id
+            event = {
+                "type": "alarm.delivery",
+                "alarm_id": alarm.id,
+                "memo_id": memo.id,
+                "delivery_status": delivery_status,
+                "error_message": error_message,
+                "triggered_at": triggered_at,
+                "next_trigger_time": alarm.next_trigger_time,
+            }
             db.commit()
-            logger.info(f"Alarm {alarm.id} processed: {delivery_status}")
+            publish(user_id, event)
+            logger.info("Alarm %s processed: %s", event["alarm_id"], delivery_status)
             return delivery_status == "sent"
         
         except Exception as e:
@@ -120,5 +173,5 @@ class AlarmSchedulerService:
                     db.commit()
                     retry_count += 1
         
-        logger.info(f"Retried {retry_count} failed deliveries")
+        logger.info("Retried %s failed deliveries", retry_count)
         return retry_count
@@ -0,0 +1,144 @@
+"""Service for full-text memo search."""
+
+from sqlalchemy import column, delete, func, insert, literal_column, select, table, text
+from sqlalchemy.orm import Session
+from src.models import Memo
+from typing import Iterable, List, Optional, Tuple
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# SQLite: standalone FTS5 table keyed by memo id (rowid). `owner` holds a
+# per-user token so a search intersects with that user's postings only.
+memos_fts = table("memos_fts", column("rowid"), column("title"), column("description"), column("owner"))
+
+# PostgreSQL: generated tsvector column on memos, GIN-indexed
+search_vector = literal_column("memos.search_vector")
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5(title, description, owner, tokenize='unicode61')",
+]
+
+POSTGRES_DDL = [
+    "ALTER TABLE memos ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS idx_memo_search_vector ON memos USING GIN (search_vector)",
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _owner_token(user_id: int) -> str:
+    return f"u{user_id}"
+
+
+def _fts5_query(user_id: int, q: str) -> str:
+    """Build an FTS5 query for all terms within one user's memos (no operator injection)."""
+    terms = " ".join(f'"{token}"' for token in _TOKEN_RE.findall(q))
+    if not terms:
+        return ""
+    return f'owner : "{_owner_token(user_id)}" AND {{title description}} : ({terms})'
+
+
+class MemoSearchService:
+    """Service for the memo full-text index.
+
+    SQLite keeps a separate FTS5 table that MemoService updates on create,
+    update and delete. PostgreSQL uses a generated `search_vector` column,
+    so the database keeps it in sync and the index hooks are no-ops.
+    """
+
+    @staticmethod
+    def _dialect(db: Session) -> str:
+        return db.get_bind().dialect.name
+
+    @staticmethod
+    def ensure_index(db: Session) -> None:
+        """Create the full-text index if missing, building it from existing memos."""
+        if MemoSearchService._dialect(db) == "postgresql":
+            for ddl in POSTGRES_DDL:
+                db.execute(text(ddl))
+            db.commit()
+            return
+
+        exists = db.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memos_fts'"
+        )).first()
+        for ddl in SQLITE_DDL:
+            db.execute(text(ddl))
+        if not exists:
+            db.execute(text(
+                "INSERT INTO memos_fts (rowid, title, description, owner) "
+                "SELECT id, title, coalesce(description, ''), 'u' || user_id FROM memos"
+            ))
+            logger.info("Built memos_fts index")
+        db.commit()
+
+    @staticmethod
+    def index_memos(db: Session, memos: Iterable[Memo]) -> None:
+        """Add or replace memos in the index (caller commits)."""
+        if MemoSearchService._dialect(db) == "postgresql":
+            return
+        rows = [
+            {
+                "rowid": memo.id,
+                "title": memo.title,
+                "description": memo.description or "",
+                "owner": _owner_token(memo.user_id),
+            }
+            for memo in memos
+        ]
+        if not rows:
+            return
+        db.execute(delete(memos_fts).where(memos_fts.c.rowid.in_([r["rowid"] for r in rows])))
+        db.execute(insert(memos_fts), rows)
+
+    @staticmethod
+    def index_memo(db: Session, memo: Memo) -> None:
+        """Add or replace one memo in the index (caller commits)."""
+        MemoSearchService.index_memos(db, [memo])
+
+    @staticmethod
+    def remove_memos(db: Session, memo_ids: List[int]) -> None:
+        """Remove memos from the index (caller commits)."""
+        if MemoSearchService._dialect(db) == "postgresql" or not memo_ids:
+            return
+        db.execute(delete(memos_fts).where(memos_fts.c.rowid.in_(memo_ids)))
+
+    @staticmethod
+    def remove_memo(db: Session, memo_id: int) -> None:
+        """Remove one memo from the index (caller commits)."""
+        MemoSearchService.remove_memos(db, [memo_id])
+
+    @staticmethod
+    def search(
+        db: Session, user_id: int, q: str, skip: int = 0, limit: int = 20
+    ) -> Tuple[List[Memo], Optional[int]]:
+        """Search a user's memos, best match first.
+
+        Title matches rank above description matches. Returns the page and
+        the `skip` value for the next page (None on the last page).
+        """
+        if MemoSearchService._dialect(db) == "postgresql":
+            query = func.websearch_to_tsquery("simple", q)
+            stmt = select(Memo).where(
+                Memo.user_id == user_id,
+                search_vector.op("@@")(query)
+            ).order_by(func.ts_rank(search_vector, query).desc(), Memo.id.desc())
+        else:
+            match = _fts5_query(user_id, q)
+            if not match:
+                return [], None
+            stmt = select(Memo).join(memos_fts, memos_fts.c.rowid == Memo.id).where(
+                text("memos_fts MATCH :match").bindparams(match=match),
+                Memo.user_id == user_id
+            ).order_by(text("bm25(memos_fts, 10.0, 1.0, 0.0)"), Memo.id.desc())
+
+        rows = db.execute(stmt.offset(skip).limit(limit + 1)).scalars().all()
+        if len(rows) <= limit:
+            return rows, None
+        return rows[:limit], skip + limit
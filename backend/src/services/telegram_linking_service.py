@@ -0,0 +1,97 @@
+"""Service for linking Telegram chats to user accounts."""
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.orm import Session
+from src.models import TelegramLinkingCode, User
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import logging
+import secrets
+
+logger = logging.getLogger(__name__)
+
+LINKING_CODE_TTL = timedelta(minutes=10)
+
+
+class TelegramLinkingService:
+    """Service for one-time linking codes (`/start <code>` in the bot)."""
+
+    @staticmethod
+    def create_code(db: Session, user_id: int) -> TelegramLinkingCode:
+        """Issue a new linking code, replacing the user's unused ones."""
+        db.execute(
+            delete(TelegramLinkingCode)
+            .where(TelegramLinkingCode.user_id == user_id, TelegramLinkingCode.used == False)
+            .execution_options(synchronize_session=False)
+        )
+        linking_code = TelegramLinkingCode(
+            code=secrets.token_urlsafe(32),
+            user_id=user_id,
+            expires_at=datetime.now(timezone.utc) + LINKING_CODE_TTL
+        )
+        db.add(linking_code)
+        db.commit()
+        db.refresh(linking_code)
+        return linking_code
+
+    @staticmethod
+    def redeem_code(db: Session, code: str, chat_id: str, now: Optional[datetime] = None) -> Optional[int]:
+        """Link `chat_id` to the owner of a valid code; returns the user id.
+
+        The code is claimed with one compare-and-set UPDATE on its primary
+        key, so concurrent or replayed redemptions link at most once. On
+        PostgreSQL the claim and the user update run as a single statement
+        (data-modifying CTE). Returns None for unknown, used or expired codes.
+        """
+        now = now or datetime.now(timezone.utc)
+        claim = (
+            update(TelegramLinkingCode)
+            .where(
+                TelegramLinkingCode.code == code,
+                TelegramLinkingCode.used == False,
+                TelegramLinkingCode.expires_at > now
+            )
+            .values(used=True)
+            .returning(TelegramLinkingCode.user_id)
+        )
+
+        if db.get_bind().dialect.name == "postgresql":
+            claimed = claim.cte("claimed")
+            user_id = db.execute(
+                update(User)
+                .where(User.id == claimed.c.user_id)
+                .values(telegram_chat_id=chat_id)
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
+            ).scalar()
+        else:
+            user_id = db.execute(claim.execution_options(synchronize_session=False)).scalar()
+            if user_id is not None:
+                db.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(telegram_chat_id=chat_id)
+                    .execution_options(synchronize_session=False)
+                )
+
+        if user_id is None:
+            db.rollback()
+            return None
+
+        db.commit()
+        logger.info("Telegram chat %s linked to user %s", chat_id, user_id)
+        return user_id
+
+    @staticmethod
+    def sweep_codes(db: Session, now: Optional[datetime] = None) -> int:
+        """Delete expired and used codes in one statement; returns the count."""
+        now = now or datetime.now(timezone.utc)
+        result = db.execute(
+            delete(TelegramLinkingCode)
+            .where(or_(TelegramLinkingCode.expires_at <= now, TelegramLinkingCode.used == True))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount:
+            logger.info("Swept %s expired or used Telegram linking codes", result.rowcount)
+        return result.rowcount
@@ -2,16 +2,14 @@
 
 from src.models import Memo, Alarm
 from src.config import settings
+import importlib.util
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
-try:
-    from telegram import Bot
-    TELEGRAM_AVAILABLE = True
-except ImportError:
-    TELEGRAM_AVAILABLE = False
+# python-telegram-bot is imported on first send; only check it is installed here
+TELEGRAM_AVAILABLE = importlib.util.find_spec("telegram") is not None
 
 
 class TelegramNotificationService:
@@ -20,6 +18,12 @@ class TelegramNotificationService:
     @staticmethod
     async def send_telegram_message(chat_id: str, memo_title: str, memo_description: str) -> tuple[bool, str]:
         """Send a Telegram message for a memo."""
+        message = TelegramNotificationService.format_memo_message(memo_title, memo_description)
+        return await TelegramNotificationService.send_text(chat_id, message)
+    
+    @staticmethod
+    async def send_text(chat_id: str, text: str) -> tuple[bool, str]:
+        """Send a plain text message to a chat."""
         if not TELEGRAM_AVAILABLE:
             logger.warning("python-telegram-bot not installed")
             return False, "Telegram library not available"
@@ -29,11 +33,11 @@ class TelegramNotificationService:
             return False, "Telegram bot token not configured"
         
         try:
-            bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
-            message = TelegramNotificationService.format_memo_message(memo_title, memo_description)
-            
-            await bot.send_message(chat_id=chat_id, text=message)
-            logger.info(f"Telegram message sent to {chat_id}")
+            from telegram import Bot
+
+            bot = Bot(token=settings.TELEGRAM_BOT_TOKEN, base_url=f"{settings.TELEGRAM_API_URL}/bot")
+            await bot.send_message(chat_id=chat_id, text=text)
+            logger.info("Telegram message sent to %s", chat_id)
             return True, ""
         
         except Exception as e:
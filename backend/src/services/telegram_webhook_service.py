@@ -0,0 +1,138 @@
+"""Queued processing of Telegram webhook updates."""
+
+from collections import OrderedDict
+from src.services.telegram_linking_service import TelegramLinkingService
+from src.services.telegram_service import TelegramNotificationService
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of TelegramUpdateQueue.offer
+QUEUED = "queued"
+DUPLICATE = "duplicate"
+FULL = "full"
+
+LINKED_REPLY = "✅ Your Telegram account is linked. Memo alarms will be delivered here."
+INVALID_CODE_REPLY = "This linking code is invalid or expired. Generate a new one in the app."
+START_REPLY = "Open the app and use \"Link Telegram\" to connect this chat."
+RETRY_REPLY = "Something went wrong while linking. Please send the same /start message again."
+
+
+def _start_chat_id(update: dict) -> Optional[str]:
+    """Chat id of a `/start` message, or None for any other update."""
+    message = update.get("message") or {}
+    chat_id = (message.get("chat") or {}).get("id")
+    if chat_id is None or not (message.get("text") or "").strip().startswith("/start"):
+        return None
+    return str(chat_id)
+
+
+def process_updates(updates: List[dict]) -> List[Tuple[str, str]]:
+    """Apply a batch of updates in one session; returns (chat_id, text) replies to send."""
+    from src.database import SessionLocal
+
+    replies = []
+    db = SessionLocal()
+    try:
+        for update in updates:
+            chat_id = _start_chat_id(update)
+            if chat_id is None:
+                continue
+
+            parts = update["message"]["text"].split(maxsplit=1)
+            if len(parts) < 2:
+                replies.append((chat_id, START_REPLY))
+                continue
+            try:
+                user_id = TelegramLinkingService.redeem_code(db, parts[1], chat_id)
+            except Exception as e:
+                db.rollback()
+                logger.error("Failed to process Telegram update %s: %s", update.get("update_id"), e, exc_info=True)
+                # The update was acknowledged and Telegram will not redeliver
+                # it; ask the user to resend instead of failing silently
+                replies.append((chat_id, RETRY_REPLY))
+                continue
+            replies.append((chat_id, LINKED_REPLY if user_id else INVALID_CODE_REPLY))
+    finally:
+        db.close()
+    return replies
+
+
+class TelegramUpdateQueue:
+    """Bounded in-process queue between the webhook and the update workers.
+
+    The webhook only validates and enqueues, so Telegram gets its 200
+    right away. Workers drain the queue in batches and run the database
+    work in a thread. Updates are deduplicated by `update_id` over the
+    last `dedup_window` ids (Telegram redelivers until it sees a 2xx).
+    An update that fails after it was acknowledged is answered with a
+    reply asking the user to send it again.
+    When the queue is full the update is refused, so the webhook can
+    answer 503 and Telegram retries later.
+    """
+
+    def __init__(self, maxsize: int = 10000, dedup_window: int = 100000, workers: int = 1, batch_size: int = 100):
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize)
+        self.dedup_window = dedup_window
+        self.workers = workers
+        self.batch_size = batch_size
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {"queued": 0, "duplicates": 0, "rejected": 0, "processed": 0}
+
+    def offer(self, update: dict) -> str:
+        """Enqueue an update unless it is a duplicate or the queue is full."""
+        update_id = update["update_id"]
+        if update_id in self._seen:
+            self.stats["duplicates"] += 1
+            return DUPLICATE
+        try:
+            self.queue.put_nowait(update)
+        except asyncio.QueueFull:
+            # Not remembered, so Telegram's redelivery is accepted later
+            self.stats["rejected"] += 1
+            return FULL
+        self._seen[update_id] = None
+        while len(self._seen) > self.dedup_window:
+            self._seen.popitem(last=False)
+        self.stats["queued"] += 1
+        return QUEUED
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = 5) -> None:
+        """Finish queued updates (up to `timeout` seconds), then stop the workers."""
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %s unprocessed Telegram updates on shutdown", self.queue.qsize())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def info(self) -> Dict[str, int]:
+        return {**self.stats, "pending": self.queue.qsize()}
+
+    async def _work(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                replies = await asyncio.to_thread(process_updates, batch)
+            except Exception as e:
+                logger.error("Telegram update batch failed: %s", e, exc_info=True)
+                replies = [(chat_id, RETRY_REPLY) for chat_id in map(_start_chat_id, batch) if chat_id]
+            try:
+                for chat_id, text in replies:
+                    await TelegramNotificationService.send_text(chat_id, text)
+            except Exception as e:
+                logger.error("Telegram update replies failed: %s", e, exc_info=True)
+            finally:
+                self.stats["processed"] += len(batch)
+                for _ in batch:
+                    self.queue.task_done()
@@ -0,0 +1,296 @@
+"""Service for per-user bookkeeping."""
+
+from collections import OrderedDict
+from datetime import datetime
+from sqlalchemy import Select, event, select, update
+from sqlalchemy.orm import Session
+from src.database import SessionLocal, record_user_write
+from src.models import Memo, User
+from src.utils.cache import get_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ALL_USERS = "all"
+
+
+class UserProfile(NamedTuple):
+    """Immutable snapshot of the user fields read on hot paths.
+
+    Credentials and the Telegram chat id are deliberately left out: the
+    cache is per process, and a password change or an unlink must take
+    effect on every worker at once.
+    """
+    id: int
+    email: str
+    timezone: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserProfile":
+        return cls(*(getattr(user, field) for field in cls._fields))
+
+
+PROFILE_COLUMNS = [getattr(User, field) for field in UserProfile._fields]
+
+
+class Recipient(NamedTuple):
+    """Where a user's alarms are delivered; always read from the database."""
+    id: int
+    telegram_chat_id: Optional[str]
+
+
+class UserProfileCache:
+    """Per-process LRU of user profiles by id, with an email index.
+
+    Entries expire after `ttl_seconds`, which bounds staleness across
+    worker processes; within a process, writes to the cached fields
+    invalidate explicitly (see UserService.invalidate_profile). A lookup
+    that started before an invalidation does not store its result.
+    """
+
+    def __init__(self, max_entries: int = 50000, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, UserProfile]]" = OrderedDict()
+        self._by_email: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._epoch = 0
+
+    @property
+    def epoch(self) -> int:
+        """Changes on every invalidation; pass it back to `put`."""
+        return self._epoch
+
+    def get(self, user_id: int) -> Optional[UserProfile]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(user_id)
+                return None
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+    def get_by_email(self, email: str) -> Optional[UserProfile]:
+        user_id = self._by_email.get(email)
+        profile = self.get(user_id) if user_id is not None else None
+        return profile if profile is not None and profile.email == email else None
+
+    def put(self, profiles: Iterable[UserProfile], epoch: int) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            for profile in profiles:
+                if profile.id in self._entries:
+                    self._remove(profile.id)
+                self._entries[profile.id] = (expires_at, profile)
+                self._by_email[profile.email] = profile.id
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._epoch += 1
+            for user_id in user_ids:
+                if user_id in self._entries:
+                    self._remove(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_email.clear()
+
+    def _remove(self, user_id: int) -> None:
+        _, profile = self._entries.pop(user_id)
+        if self._by_email.get(profile.email) == user_id:
+            del self._by_email[profile.email]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_profiles: Optional[UserProfileCache] = None
+_profiles_lock = threading.Lock()
+
+
+def get_profile_cache() -> UserProfileCache:
+    """Process-wide profile cache configured from settings, created on first use."""
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                from src.config import settings
+                _profiles = UserProfileCache(settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
+    return _profiles
+
+
+def _mark_changed(db: Session, user_ids: Iterable) -> None:
+    """Queue users whose cached reads must be invalidated when `db` commits."""
+    db.info.setdefault("changed_users", set()).update(user_ids)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_changed_users(session):
+    profiles = session.info.pop("changed_profiles", None)
+    if profiles:
+        get_profile_cache().invalidate(profiles)
+
+    changed = session.info.pop("changed_users", None)
+    if not changed:
+        return
+    # Keep these users' reads on the primary until a replica has caught up,
+    # so a lagging replica read cannot be cached under the new generation
+    for user_id in changed:
+        if user_id != ALL_USERS:
+            record_user_write(user_id)
+    try:
+        if ALL_USERS in changed:
+            get_cache().invalidate_all()
+        else:
+            get_cache().invalidate_users(changed)
+    except Exception as e:
+        logger.error("Cache invalidation failed for users %s: %s", changed, e)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_changed_users(session):
+    session.info.pop("changed_users", None)
+    session.info.pop("changed_profiles", None)
+
+
+class UserService:
+    """Service for user-level counters and cached profiles.
+
+    `data_version` is bumped in the same transaction as every write to a
+    user's memos, alarms or alarm history, so it identifies a snapshot of
+    that data and serves as the ETag for reads. The same writes invalidate
+    the user's read cache once the transaction commits.
+
+    Profiles (email, timezone) are served from UserProfileCache. Code that
+    changes those columns must call `invalidate_profile` in the same
+    transaction. Password hashes and Telegram chat ids are never cached
+    (see `get_user_by_email` and `get_recipients`).
+    """
+
+    @staticmethod
+    def adjust_memo_count(db: Session, user_id: int, delta: int) -> None:
+        """Atomically add `delta` to the user's memo counter and bump the data version (caller commits)."""
+        db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(memo_count=User.memo_count + delta, data_version=User.data_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        _mark_changed(db, [user_id])
+
+    @staticmethod
+    def bump_data_version(db: Session, user_id: Optional[int] = None) -> None:
+        """Mark the user's data as changed; every user's when `user_id` is None (caller commits)."""
+        stmt = update(User).values(data_version=User.data_version + 1)
+        if user_id is not None:
+            stmt = stmt.where(User.id == user_id)
+        db.execute(stmt.execution_options(synchronize_session=False))
+        _mark_changed(db, [user_id if user_id is not None else ALL_USERS])
+
+    @staticmethod
+    def bump_data_version_for_memos(db: Session, memo_ids: Union[Sequence[int], Select]) -> None:
+        """Bump the data version of the owners of these memos (ids or a select of ids), in one statement (caller commits)."""
+        user_ids = db.execute(
+            update(User)
+            .where(User.id.in_(select(Memo.user_id).where(Memo.id.in_(memo_ids))))
+            .values(data_version=User.data_version + 1)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        _mark_changed(db, user_ids)
+
+    @staticmethod
+    def get_data_version(db: Session, user_id: int) -> int:
+        """Get the user's data version (primary key lookup)."""
+        version = db.execute(select(User.data_version).where(User.id == user_id)).scalar()
+        return version or 0
+
+    @staticmethod
+    def get_version_and_count(db: Session, user_id: int) -> Tuple[int, int]:
+        """Get the user's data version and memo total with one primary key lookup."""
+        row = db.execute(select(User.data_version, User.memo_count).where(User.id == user_id)).first()
+        return (row.data_version or 0, row.memo_count or 0) if row else (0, 0)
+
+    @staticmethod
+    def get_memo_count(db: Session, user_id: int) -> int:
+        """Get the user's memo total from the maintained counter (no COUNT(*))."""
+        count = db.execute(select(User.memo_count).where(User.id == user_id)).scalar()
+        return count or 0
+
+    @staticmethod
+    def invalidate_profile(db: Session, user_id: int) -> None:
+        """Drop the user's cached profile once `db` commits (caller commits)."""
+        db.info.setdefault("changed_profiles", set()).add(user_id)
+
+    @staticmethod
+    def get_profile(db: Session, user_id: int) -> Optional[UserProfile]:
+        """Get a user's profile, from the cache when possible."""
+        return UserService.get_profiles(db, [user_id]).get(user_id)
+
+    @staticmethod
+    def get_profiles(db: Session, user_ids: Iterable[int]) -> Dict[int, UserProfile]:
+        """Get profiles for many users; cache misses are loaded with one query."""
+        cache = get_profile_cache()
+        profiles = {}
+        missing = set()
+        for user_id in set(user_ids):
+            profile = cache.get(user_id)
+            if profile is None:
+                missing.add(user_id)
+            else:
+                profiles[user_id] = profile
+
+        if missing:
+            epoch = cache.epoch
+            loaded = [
+                UserProfile(*row)
+                for row in db.execute(select(*PROFILE_COLUMNS).where(User.id.in_(missing)))
+            ]
+            cache.put(loaded, epoch)
+            profiles.update((profile.id, profile) for profile in loaded)
+        return profiles
+
+    @staticmethod
+    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+        """Get a user by email from the database (never cached; login checks its password hash)."""
+        return db.scalars(select(User).where(User.email == email)).first()
+
+    @staticmethod
+    def get_recipients(db: Session, user_ids: Iterable[int]) -> Dict[int, Recipient]:
+        """Get the delivery targets of many users with one query (never cached)."""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return {}
+        rows = db.execute(select(User.id, User.telegram_chat_id).where(User.id.in_(user_ids)))
+        return {row.id: Recipient(*row) for row in rows}
+
+    @staticmethod
+    def get_profile_by_email(db: Session, email: str) -> Optional[UserProfile]:
+        """Get a user's profile by email, from the cache when possible."""
+        cache = get_profile_cache()
+        profile = cache.get_by_email(email)
+        if profile is not None:
+            return profile
+
+        epoch = cache.epoch
+        row = db.execute(select(*PROFILE_COLUMNS).where(User.email == email)).first()
+        if row is None:
+            return None
+        profile = UserProfile(*row)
+        cache.put([profile], epoch)
+        return profile
@@ -0,0 +1,264 @@
+"""Read cache with per-user invalidation.
+
+Values are stored as JSON bytes under keys that embed a per-user
+generation number. Invalidating a user bumps their generation, so all of
+their old entries become unreachable at once and age out through LRU or
+TTL eviction; no key scan is needed. A global generation invalidates
+every user.
+
+Backends:
+
+* ``memory``: in-process LRU with a TTL and entry/byte limits (default).
+  Invalidation reaches only the process that committed the write, so with
+  several workers the others keep serving their entries until the TTL
+  expires; use ``redis`` there.
+* ``redis``: shared across workers; needs the ``redis`` package and
+  ``CACHE_URL``. Without them the in-process LRU stands in, with a warning.
+* ``none``: caching disabled.
+"""
+
+from collections import OrderedDict
+from src.utils.serialization import dumps, loads
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import importlib.util
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters (per process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class CacheBackend:
+    """Interface shared by the cache backends."""
+
+    name = "none"
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    def generation(self, user_id: int) -> str:
+        """Current cache generation for a user (changes on invalidation)."""
+        return "0"
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        pass
+
+    def invalidate_all(self) -> None:
+        pass
+
+    def info(self) -> Dict[str, Any]:
+        return {"backend": self.name, **self.stats.snapshot()}
+
+
+class LRUCache(CacheBackend):
+    """In-process LRU cache with TTL and entry count / byte size limits."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 60):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Kept apart from the entries so eviction can never reset a generation
+        self._generations: Dict[int, int] = {}
+        self._global_generation = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.incr("evictions")
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def generation(self, user_id: int) -> str:
+        with self._lock:
+            return f"{self._global_generation}.{self._generations.get(user_id, 0)}"
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+                self.stats.incr("invalidations")
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._global_generation += 1
+            self.stats.incr("invalidations")
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            size = {"entries": len(self._entries), "bytes": self._bytes}
+        return {**super().info(), **size}
+
+
+class RedisCache(CacheBackend):
+    """Cache shared by all workers through Redis (entries expire by TTL)."""
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: float = 60, prefix: str = "memo-cache"):
+        super().__init__()
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}:{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(f"{self.prefix}:{key}", value, px=self.ttl_ms)
+
+    def generation(self, user_id: int) -> str:
+        global_gen, user_gen = self.client.mget(f"{self.prefix}:gen", f"{self.prefix}:gen:{user_id}")
+        return f"{int(global_gen or 0)}.{int(user_gen or 0)}"
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        count = 0
+        for user_id in user_ids:
+            pipe.incr(f"{self.prefix}:gen:{user_id}")
+            count += 1
+        pipe.execute()
+        self.stats.incr("invalidations", count)
+
+    def invalidate_all(self) -> None:
+        self.client.incr(f"{self.prefix}:gen")
+        self.stats.incr("invalidations")
+
+
+_cache: Optional[CacheBackend] = None
+_cache_lock = threading.Lock()
+
+
+def create_cache(backend: str, url: str = "", ttl_seconds: float = 60,
+                 max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024) -> CacheBackend:
+    """Build a cache backend by name."""
+    if backend == "none":
+        return CacheBackend()
+    if backend == "redis":
+        if REDIS_AVAILABLE and url:
+            return RedisCache(url, ttl_seconds)
+        logger.warning("Redis cache requested but redis is not installed or CACHE_URL is empty; using in-process cache")
+    return LRUCache(max_entries, max_bytes, ttl_seconds)
+
+
+def get_cache() -> CacheBackend:
+    """Process-wide cache configured from settings, created on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from src.config import settings
+                _cache = create_cache(
+                    settings.CACHE_BACKEND,
+                    settings.CACHE_URL,
+                    settings.CACHE_TTL_SECONDS,
+                    settings.CACHE_MAX_ENTRIES,
+                    settings.CACHE_MAX_BYTES,
+                )
+                if _cache.name == "memory" and settings.WEB_CONCURRENCY > 1:
+                    logger.warning(
+                        f"In-process read cache with {settings.WEB_CONCURRENCY} workers: other workers "
+                        f"may serve entries up to {settings.CACHE_TTL_SECONDS:g}s stale; set CACHE_BACKEND=redis"
+                    )
+    return _cache
+
+
+def cached_json(user_id: int, key: str, loader: Callable[[], Any]) -> Any:
+    """Return the JSON-serializable value for a user's key, calling `loader` on a miss.
+
+    None results are not cached.
+
+    The generation is read before `loader` runs, so a value loaded while a
+    write commits is stored under the old generation and never served.
+    (A load from a replica that has not replayed the write yet would be
+    stored under the new one; committing invalidations therefore also keep
+    the user's reads on the primary for the read-your-writes window.)
+    Backend errors fall back to `loader`.
+    """
+    cache = get_cache()
+    try:
+        full_key = f"{user_id}:{cache.generation(user_id)}:{key}"
+        raw = cache.get(full_key)
+    except Exception as e:
+        logger.warning("Cache read failed: %s", e)
+        return loader()
+
+    if raw is not None:
+        cache.stats.incr("hits")
+        return loads(raw)
+
+    cache.stats.incr("misses")
+    value = loader()
+    if value is None:
+        return value
+    try:
+        cache.set(full_key, dumps(value))
+    except Exception as e:
+        logger.warning("Cache write failed: %s", e)
+    return value
@@ -0,0 +1,233 @@
+"""Per-user event fan-out for the live event stream (GET /api/v1/events).
+
+Publishers call `publish(user_id, event)` from any thread (the alarm
+dispatcher runs on the scheduler's thread). Each event is encoded once and
+handed to the event loop with `call_soon_threadsafe`, which puts the same
+bytes on the bounded queue of every stream the user has open. A stream
+whose queue is full loses its pending events and gets a single "resync"
+event instead, telling the client to reload.
+
+Backends:
+
+* ``memory``: subscribers in this process only (default; one worker).
+* ``redis``: events go through a Redis channel, so streams on every worker
+  receive them, and stream tickets are single-use across workers; needs
+  the ``redis`` package and ``EVENTS_URL``. Without them the in-process
+  broker stands in, with a warning.
+"""
+
+from src.utils.serialization import dumps
+from typing import Any, Dict, Optional, Set
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+
+RESYNC = dumps({"type": "resync"})
+
+
+class Subscription:
+    """One open stream: a bounded queue of encoded events (None ends the stream)."""
+
+    __slots__ = ("user_id", "queue")
+
+    def __init__(self, user_id: int, queue_size: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+
+
+class EventBroker:
+    """In-process broker; subscribe and unsubscribe run on the event loop."""
+
+    name = "memory"
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._used_tickets: Dict[str, float] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Deliver events on `loop` (the server's)."""
+        self._loop = loop
+
+    def stop(self) -> None:
+        """End every open stream."""
+        with self._lock:
+            subscriptions = [s for subs in self._subscribers.values() for s in subs]
+        for subscription in subscriptions:
+            self._put(subscription, None)
+
+    def subscribe(self, user_id: int) -> Subscription:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        subscription = Subscription(user_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(subscription.user_id)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscribers[subscription.user_id]
+
+    def claim_ticket(self, ticket_id: str, ttl: float) -> bool:
+        """Mark a stream ticket as used; False if it already was."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._used_tickets) > 10000:
+                self._used_tickets = {t: at for t, at in self._used_tickets.items() if at > now}
+            expires_at = self._used_tickets.get(ticket_id)
+            if expires_at is not None and expires_at > now:
+                return False
+            self._used_tickets[ticket_id] = now + ttl
+        return True
+
+    def publish(self, user_id: int, event: Dict[str, Any]) -> None:
+        """Send an event to the user's open streams (thread-safe, never blocks on them)."""
+        self.published += 1
+        # Nothing to encode for users without open streams
+        if user_id in self._subscribers:
+            self._dispatch(user_id, dumps(event))
+
+    def _dispatch(self, user_id: int, data: bytes) -> None:
+        """Hand encoded data to this process's subscribers."""
+        with self._lock:
+            if user_id not in self._subscribers or self._loop is None:
+                return
+            loop = self._loop
+        try:
+            loop.call_soon_threadsafe(self._deliver, user_id, data)
+        except RuntimeError:
+            # Loop already closed (shutdown)
+            pass
+
+    def _deliver(self, user_id: int, data: bytes) -> None:
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            self._put(subscription, data)
+
+    def _put(self, subscription: Subscription, data: Optional[bytes]) -> None:
+        queue = subscription.queue
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # Slow reader: replace its backlog with one resync (or the end marker)
+            self.dropped += queue.qsize()
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC if data is not None else None)
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            streams = sum(len(subs) for subs in self._subscribers.values())
+            users = len(self._subscribers)
+        return {
+            "backend": self.name,
+            "streams": streams,
+            "users": users,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+class RedisEventBroker(EventBroker):
+    """Broker that relays events between workers through a Redis channel."""
+
+    name = "redis"
+
+    def __init__(self, url: str, queue_size: int = 100, channel: str = "memo-events"):
+        super().__init__(queue_size)
+        import redis
+
+        self.url = url
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self.channel = channel
+        self._pubsub = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        import redis
+
+        super().start(loop)
+        # Separate connection without a read timeout: the listener waits indefinitely
+        self._pubsub = redis.Redis.from_url(self.url).pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        threading.Thread(target=self._listen, name="event-listener", daemon=True).start()
+
+    def stop(self) -> None:
+        super().stop()
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+    def claim_ticket(self, ticket_id: str, ttl: float) -> bool:
+        """Claim through Redis, so a ticket is single-use across workers."""
+        try:
+            return bool(self.client.set(f"{self.channel}:ticket:{ticket_id}", 1, nx=True, ex=max(1, int(ttl))))
+        except Exception as e:
+            logger.warning("Ticket claim through Redis failed: %s", e)
+            return super().claim_ticket(ticket_id, ttl)
+
+    def publish(self, user_id: int, event: Dict[str, Any]) -> None:
+        self.published += 1
+        data = dumps(event)
+        try:
+            self.client.publish(self.channel, b"%d\n%s" % (user_id, data))
+        except Exception as e:
+            # Streams on this worker still get it
+            logger.warning("Event publish through Redis failed: %s", e)
+            self._dispatch(user_id, data)
+
+    def _listen(self) -> None:
+        pubsub = self._pubsub
+        try:
+            for message in pubsub.listen():
+                user_id, data = message["data"].split(b"\n", 1)
+                self._dispatch(int(user_id), data)
+        except Exception as e:
+            if self._pubsub is not None:
+                logger.error("Event listener stopped: %s", e)
+
+
+_broker: Optional[EventBroker] = None
+_broker_lock = threading.Lock()
+
+
+def create_broker(backend: str, url: str = "", queue_size: int = 100) -> EventBroker:
+    """Build an event broker by name."""
+    if backend == "redis":
+        if REDIS_AVAILABLE and url:
+            return RedisEventBroker(url, queue_size)
+        logger.warning("Redis events requested but redis is not installed or EVENTS_URL is empty; using in-process events")
+    return EventBroker(queue_size)
+
+
+def get_broker() -> EventBroker:
+    """Process-wide broker configured from settings, created on first use."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                from src.config import settings
+                _broker = create_broker(settings.EVENTS_BACKEND, settings.EVENTS_URL, settings.EVENTS_QUEUE_SIZE)
+    return _broker
+
+
+def publish(user_id: int, event: Dict[str, Any]) -> None:
+    """Publish an event to a user's live streams; errors are logged, never raised."""
+    try:
+        get_broker().publish(user_id, event)
+    except Exception as e:
+        logger.error("Event publish failed for user %s: %s", user_id, e)
@@ -0,0 +1,45 @@
+"""Application-wide outbound HTTP client.
+
+One pooled httpx.AsyncClient is created in the app's lifespan and shared
+by every request, so connections (and their TLS sessions) to GitHub are
+reused across logins. HTTP/2 is used when the `h2` package is installed.
+Timeouts are strict, so a slow upstream fails the request instead of
+holding it open.
+"""
+
+from fastapi import Request
+from src.config import settings
+from typing import TYPE_CHECKING
+import importlib.util
+import logging
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> "httpx.AsyncClient":
+    """Build the shared client from settings (close it with `aclose`)."""
+    # Imported here to keep application import cheap (see create_app)
+    import httpx
+
+    timeout = httpx.Timeout(
+        settings.HTTP_READ_TIMEOUT_SECONDS,
+        connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+        pool=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+    )
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=60,
+    )
+    logger.info("Outbound HTTP client: http2=%s, max %s connections", HTTP2_AVAILABLE, settings.HTTP_MAX_CONNECTIONS)
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=timeout, limits=limits)
+
+
+def get_http_client(request: Request) -> "httpx.AsyncClient":
+    """Dependency: the client created in the app's lifespan."""
+    return request.app.state.http_client
@@ -1,40 +1,212 @@
-"""Logging configuration with rotating file handlers."""
+"""Logging configuration: a queue in front of rotating file and console handlers.
 
+Application code only puts records on a bounded queue; a background
+QueueListener thread formats them and does the file/console I/O. Records
+can be written as text or as JSON lines, debug/info records of chatty
+loggers can be sampled, and a full queue either drops records (counting
+them) or blocks the caller.
+"""
+
+import atexit
+import copy
 import logging
 import logging.handlers
-import os
+import queue
+import random
+import threading
 from pathlib import Path
+from typing import Dict, Optional
 
-# Create logs directory if it doesn't exist
-# Use absolute path relative to this file's location
+# Logs directory, resolved relative to this file's location.
+# Created by configure_logging() rather than at import time.
 logs_dir = Path(__file__).parent.parent.parent / "logs"
-logs_dir.mkdir(parents=True, exist_ok=True)
 
-# Configure root logger
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Standard LogRecord attributes; anything else came from `extra=` and is
+# included in JSON output
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_configured = False
+_configure_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, including fields passed with `extra=`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        from src.utils.serialization import dumps
+
+        entry = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.lineno}",
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_FIELDS)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return dumps(entry).decode()
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG/INFO records from the configured loggers.
+
+    `rates` maps logger name prefixes to the fraction kept (0..1); the
+    longest matching prefix wins. Warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._by_logger: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._by_logger.get(name)
+        if rate is None:
+            matches = [p for p in self.rates if name == p or name.startswith(p + ".")]
+            rate = self.rates[max(matches, key=len)] if matches else 1.0
+            self._by_logger[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler with an overflow policy for a bounded queue.
+
+    `overflow="drop"` discards records while the queue is full and reports
+    how many were lost once there is room again; `"block"` waits for room.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop"):
+        super().__init__(log_queue)
+        self.block = overflow == "block"
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback now (they may not be safe to
+        # use from the listener thread), but leave the formatting of the
+        # line itself to the listener's handlers. Works on a copy, like
+        # QueueHandler.prepare: other handlers still see the caller's record
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.message = message
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+        if self.dropped:
+            with self._lock:
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                notice = logging.LogRecord(
+                    __name__, logging.WARNING, __file__, 0,
+                    f"Log queue full: dropped {dropped} records", None, None
+                )
+                try:
+                    self.queue.put_nowait(notice)
+                except queue.Full:
+                    with self._lock:
+                        self.dropped += dropped
+
+
+def parse_sampling(spec: str) -> Dict[str, float]:
+    """Parse "logger=rate,logger=rate" (e.g. "src.services.scheduler_service=0.1")."""
+    rates = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, rate = item.split("=", 1)
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+
+def configure_logging(
+    level: str = "INFO",
+    fmt: str = "text",
+    sampling: str = "",
+    queue_size: int = 10000,
+    overflow: str = "drop",
+) -> None:
+    """Route the root logger through a queue to file and console handlers (idempotent)."""
+    global _configured, _listener
+    if _configured:
+        return
+
+    with _configure_lock:
+        if _configured:
+            return
+
+        # Create logs directory if it doesn't exist
+        logs_dir.mkdir(parents=True, exist_ok=True)
+
+        # File handler with rotation
+        file_handler = logging.handlers.RotatingFileHandler(
+            logs_dir / "app.log",
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5
+        )
+
+        # Console handler
+        console_handler = logging.StreamHandler()
+
+        # Formatter
+        if fmt == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
 
-# File handler with rotation
-file_handler = logging.handlers.RotatingFileHandler(
-    logs_dir / "app.log",
-    maxBytes=10 * 1024 * 1024,  # 10MB
-    backupCount=5
-)
+        # Callers only enqueue; the listener thread does the I/O
+        queue_handler = BoundedQueueHandler(queue.Queue(queue_size), overflow)
+        rates = parse_sampling(sampling)
+        if rates:
+            queue_handler.addFilter(SamplingFilter(rates))
+        _listener = logging.handlers.QueueListener(
+            queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
 
-# Console handler
-console_handler = logging.StreamHandler()
+        # Configure root logger
+        logger = logging.getLogger()
+        logger.setLevel(level.upper())
+        logger.addHandler(queue_handler)
 
-# Formatter
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+        _configured = True
 
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
 
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
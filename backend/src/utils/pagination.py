@@ -0,0 +1,49 @@
+"""Keyset (cursor) pagination helpers."""
+
+from datetime import datetime
+from sqlalchemy import tuple_
+from typing import Tuple
+import base64
+import binascii
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Encode the (timestamp, id) position of the last row on a page."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        sort_value, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def apply_keyset(query, sort_column, id_column, cursor, limit: int):
+    """Order newest first on (sort_column, id_column) and seek past the cursor.
+
+    Fetches one extra row so the caller can tell whether another page exists;
+    pass the result to split_page().
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows: list, limit: int, sort_attr: str):
+    """Trim the look-ahead row and build the next cursor (None on the last page)."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_attr), last.id)
@@ -0,0 +1,114 @@
+"""Bounded worker pool for password hashing and verification.
+
+bcrypt is slow on purpose (about 250 ms per call at the default cost), so
+running it on the event loop stalls every other request on the worker.
+Calls go to a small pool instead. Calls beyond the queue limit fail fast
+with PasswordPoolBusy, which the API turns into 429 responses, so a login
+burst sheds load instead of piling up behind the workers.
+
+The pool uses threads by default: bcrypt releases the GIL while hashing.
+Set PASSWORD_HASH_EXECUTOR=process to use worker processes instead.
+"""
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from src.utils.security import hash_password, verify_password
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordPoolBusy(Exception):
+    """Raised when the password pool's queue is full."""
+
+
+class BoundedExecutor:
+    """Executor wrapper that rejects work once `max_pending` calls are queued or running."""
+
+    def __init__(self, executor: Executor, max_pending: int):
+        self.executor = executor
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordPoolBusy(f"{self.max_pending} password operations already pending")
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Optional[Future]) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pool: Optional[BoundedExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def create_password_pool(kind: str, workers: int, max_pending: int) -> BoundedExecutor:
+    """Build the pool: `kind` is "thread" or "process"."""
+    if kind == "process":
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+    return BoundedExecutor(executor, max(max_pending, workers))
+
+
+def get_password_pool() -> BoundedExecutor:
+    """Process-wide pool configured from settings, created on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from src.config import settings
+                _pool = create_password_pool(
+                    settings.PASSWORD_HASH_EXECUTOR,
+                    settings.PASSWORD_HASH_WORKERS,
+                    settings.PASSWORD_HASH_MAX_PENDING,
+                )
+                logger.info(
+                    f"Password pool: {settings.PASSWORD_HASH_EXECUTOR}, "
+                    f"{settings.PASSWORD_HASH_WORKERS} workers, {_pool.max_pending} max pending"
+                )
+    return _pool
+
+
+def shutdown_password_pool() -> None:
+    """Stop the pool's workers (application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password off the event loop. Raises PasswordPoolBusy when saturated."""
+    return await asyncio.wrap_future(get_password_pool().submit(hash_password, password))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password off the event loop. Raises PasswordPoolBusy when saturated."""
+    return await asyncio.wrap_future(get_password_pool().submit(verify_password, plain_password, hashed_password))
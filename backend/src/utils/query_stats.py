@@ -0,0 +1,107 @@
+"""SQL statement counting, slow-query logging and query budgets.
+
+`instrument_engine` hooks the engine's cursor events. Every statement is
+added to the counters opened with `track_queries()` in the current context
+(the request middleware and each scheduler tick open one; work run in the
+threadpool inherits it), and statements slower than the threshold are
+logged with the shape of their bound parameters, never the values.
+
+`query_budget(n)` fails a block that runs more than `n` statements, which
+keeps N+1 patterns from creeping back (see benchmarks/query_budgets.py).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from typing import Iterator, List, Optional, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+_counters: ContextVar[Tuple["QueryCounter", ...]] = ContextVar("query_counters", default=())
+
+
+class QueryCounter:
+    """Number of statements and time spent executing them."""
+
+    def __init__(self, record_statements: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Optional[List[str]] = [] if record_statements else None
+
+    def add(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if self.statements is not None:
+            self.statements.append(statement)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A block ran more statements than its budget allows."""
+
+    def __init__(self, budget: int, statements: List[str]):
+        listing = "\n".join(f"  {i}. {_compact(s)}" for i, s in enumerate(statements, 1))
+        super().__init__(f"{len(statements)} queries, budget is {budget}:\n{listing}")
+        self.budget = budget
+        self.statements = statements
+
+
+@contextmanager
+def track_queries(record_statements: bool = False) -> Iterator[QueryCounter]:
+    """Count the statements executed in this context (nested counters all count)."""
+    counter = QueryCounter(record_statements)
+    token = _counters.set(_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _counters.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryCounter]:
+    """Raise QueryBudgetExceeded if the block runs more than `max_queries` statements."""
+    with track_queries(record_statements=True) as counter:
+        yield counter
+    if counter.count > max_queries:
+        raise QueryBudgetExceeded(max_queries, counter.statements)
+
+
+def _compact(statement: str, limit: int = 500) -> str:
+    text = " ".join(statement.split())
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _shape(params) -> str:
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in params.items()) + "}"
+    if isinstance(params, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in params) + ")"
+    return type(params).__name__
+
+
+def parameter_shape(parameters, executemany: bool) -> str:
+    """Types of the bound parameters, e.g. "(int, str)" or "250 x {id: int}"."""
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {_shape(rows[0])}" if rows else "0 rows"
+    return _shape(parameters)
+
+
+def instrument_engine(engine, slow_query_ms: float = 0) -> None:
+    """Count the engine's statements and log those slower than `slow_query_ms` (0 disables)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - context._query_start
+        for counter in _counters.get():
+            counter.add(statement, seconds)
+        if slow_query_ms and seconds * 1000 >= slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms): %s; parameters: %s",
+                seconds * 1000, _compact(statement), parameter_shape(parameters, executemany)
+            )
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 import json
 
 
@@ -45,7 +45,8 @@ def calculate_next_trigger_time(
     scheduled_time: str,
     recurrence_type: str,
     recurrence_days: Optional[str],
-    user_timezone: str
+    user_timezone: str,
+    now: Optional[datetime] = None
 ) -> datetime:
     """Calculate next trigger time based on recurrence pattern."""
     
@@ -55,7 +56,7 @@ def calculate_next_trigger_time(
     hours, minutes = map(int, scheduled_time.split(":"))
     
     # Get current time in user's timezone
-    now_utc = datetime.now(ZoneInfo("UTC"))
+    now_utc = now or datetime.now(ZoneInfo("UTC"))
     user_tz = ZoneInfo(user_timezone)
     now_local = now_utc.astimezone(user_tz)
     
@@ -75,6 +76,27 @@ def calculate_next_trigger_time(
     return _calculate_next_daily(hours, minutes, now_local, user_tz)
 
 
+def calculate_next_trigger_times(
+    patterns: Iterable[Tuple[str, str, Optional[str], str]],
+    now: Optional[datetime] = None
+) -> List[datetime]:
+    """Calculate next trigger times for many alarms at once.
+
+    Each pattern is (scheduled_time, recurrence_type, recurrence_days,
+    user_timezone). All patterns share one `now`, and each distinct pattern
+    is computed only once.
+    """
+    now = now or datetime.now(ZoneInfo("UTC"))
+    computed = {}
+    results = []
+    for pattern in patterns:
+        key = tuple(json.dumps(p) if isinstance(p, list) else p for p in pattern)
+        if key not in computed:
+            computed[key] = calculate_next_trigger_time(*pattern, now=now)
+        results.append(computed[key])
+    return results
+
+
 def _calculate_next_daily(hours: int, minutes: int, now_local: datetime, user_tz: ZoneInfo) -> datetime:
     """Calculate next trigger for daily recurrence."""
     next_local = now_local.replace(hour=hours, minute=minutes, second=0, microsecond=0)
@@ -1,21 +1,32 @@
 """Security utilities for password hashing and JWT token management."""
 
+from collections import OrderedDict
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
-from typing import Optional
+from typing import Optional, Tuple
+import hashlib
 import os
+import secrets
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; hashes made with other costs still verify
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 # JWT settings
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Verified tokens remembered per process (0 disables the cache)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+# Event stream tickets: single-use and only accepted by GET /api/v1/events
+STREAM_TICKET_TYPE = "stream"
+STREAM_TICKET_SECONDS = 30
 
 
 def hash_password(password: str) -> str:
@@ -43,10 +54,89 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[dict]:
-    """Verify and decode a JWT token."""
+def create_stream_ticket(user_id: int, until: Optional[float] = None) -> str:
+    """Create a short-lived, single-use ticket for opening the event stream.
+
+    The ticket goes in the stream URL instead of the access token, so what
+    proxies and access logs record expires within seconds and cannot call
+    the API. `until` is the access token's expiry; the stream ends then.
+    """
+    payload = {
+        "typ": STREAM_TICKET_TYPE,
+        "user_id": user_id,
+        "jti": secrets.token_urlsafe(16),
+        "until": until,
+        "exp": datetime.now(timezone.utc) + timedelta(seconds=STREAM_TICKET_SECONDS),
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+
+class VerifiedTokenCache:
+    """LRU cache of verified token payloads, keyed by the token's SHA-256.
+
+    Entries expire at the token's `exp`. Only successfully verified tokens
+    are stored, so invalid tokens are always checked in full.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(payload)
+
+    def set(self, token: str, payload: dict) -> None:
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = VerifiedTokenCache(TOKEN_CACHE_SIZE)
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """Verify and decode a JWT token (signature and expiry), without caching."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         return None
+
+
+def verify_token(token: str) -> Optional[dict]:
+    """Verify and decode a JWT token, reusing earlier verifications of the same token."""
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+    payload = decode_token(token)
+    if payload is not None:
+        token_cache.set(token, payload)
+    return payload
@@ -0,0 +1,99 @@
+"""Fast response encoding: orjson JSON and optional MessagePack.
+
+Both libraries are optional. Without orjson, JSON falls back to the
+standard library with the same output format. MessagePack is only offered
+when msgpack is installed.
+"""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from src.middleware.timing import phase
+from datetime import date, datetime, timedelta
+from typing import Any, Mapping, Optional
+import enum
+import importlib.util
+import json
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def _isoformat(value):
+    """ISO 8601 like pydantic's JSON mode ('Z' for UTC)."""
+    text = value.isoformat()
+    if isinstance(value, datetime) and value.utcoffset() == timedelta(0):
+        text = text[:-6] + "Z"
+    return text
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return _isoformat(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(raw: bytes) -> Any:
+    """Decode JSON bytes."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def msgpack_dumps(content: Any) -> bytes:
+    """Encode to MessagePack; datetimes become ISO strings as in JSON."""
+    import msgpack
+
+    if ORJSON_AVAILABLE:
+        # Normalizing through orjson converts datetimes in C, which beats
+        # calling `_default` for every timestamp
+        content = orjson.loads(dumps(content))
+    return msgpack.packb(content, default=_default, use_bin_type=True)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        with phase("serialize"):
+            return dumps(content)
+
+
+class MsgPackResponse(Response):
+    """MessagePack response."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        with phase("serialize"):
+            return msgpack_dumps(content)
+
+
+def wants_msgpack(request: Request) -> bool:
+    """Whether the client asked for MessagePack (and we can produce it)."""
+    return MSGPACK_AVAILABLE and MSGPACK_MEDIA_TYPE in request.headers.get("Accept", "")
+
+
+def fast_response(
+    request: Request, content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Encode already-serialized content, negotiating JSON or MessagePack.
+
+    Returning this from a route bypasses response_model validation, so the
+    content must already match the documented schema (see src.schemas.serializers).
+    """
+    response_class = MsgPackResponse if wants_msgpack(request) else FastJSONResponse
+    response = response_class(content, status_code=status_code, headers=dict(headers or {}))
+    response.headers["Vary"] = "Accept"
+    return response
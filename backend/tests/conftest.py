@@ -0,0 +1,35 @@
+"""Shared test setup: a throwaway SQLite database for the session.
+
+DATABASE_URL is read when src.database is imported, so it is set here,
+before any test module imports the application.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp.name}/test.db"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+
+@pytest.fixture(scope="module")
+def client():
+    """API client over the app, with its lifespan (tables, scheduler) running."""
+    from fastapi.testclient import TestClient
+    from src.main import create_app
+
+    with TestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def auth_headers(client):
+    """Returns a function that registers a user and gives their Authorization header."""
+    def login(email: str) -> dict:
+        credentials = {"email": email, "password": "password1"}
+        client.post("/api/v1/auth/register", json=credentials)
+        response = client.post("/api/v1/auth/login", json=credentials)
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return login
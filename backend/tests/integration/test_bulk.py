@@ -0,0 +1,131 @@
+"""Bulk memo and alarm endpoints: valid items apply, invalid ones are reported per item."""
+
+import pytest
+
+ALARM = {"scheduled_time": "09:00", "recurrence_type": "daily", "user_timezone": "UTC"}
+
+
+@pytest.fixture(scope="module")
+def owner(auth_headers):
+    return auth_headers("bulk-owner@example.com")
+
+
+@pytest.fixture(scope="module")
+def other(auth_headers):
+    return auth_headers("bulk-other@example.com")
+
+
+def create_memo(client, headers, title="memo"):
+    response = client.post("/api/v1/memos", json={"title": title}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def create_alarm(client, headers, memo_id):
+    response = client.post("/api/v1/alarms", json={"memo_id": memo_id, **ALARM}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def alarms_of(client, headers):
+    memos = client.get("/api/v1/memos", params={"include": "alarms", "limit": 100}, headers=headers).json()["items"]
+    return {alarm["id"]: alarm for memo in memos for alarm in memo["alarms"]}
+
+
+def failed(result):
+    return {error["index"]: error["detail"] for error in result["failed"]}
+
+
+def test_bulk_create_memos_reports_invalid_alarms(client, owner):
+    response = client.post("/api/v1/memos/bulk", json={"items": [
+        {"title": "ok", "alarms": [ALARM]},
+        {"title": "bad time", "alarms": [{**ALARM, "scheduled_time": "24:00"}]},
+        {"title": "bad zone", "alarms": [{**ALARM, "user_timezone": "Mars/Olympus"}]},
+    ]}, headers=owner)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result["succeeded"]) == 1
+    assert failed(result) == {1: "Invalid scheduled_time: 24:00", 2: "Invalid timezone: Mars/Olympus"}
+
+
+def test_bulk_update_and_delete_memos(client, owner, other):
+    mine = create_memo(client, owner)
+    theirs = create_memo(client, other, "theirs")
+
+    response = client.patch("/api/v1/memos/bulk", json={"items": [
+        {"id": mine, "title": "renamed"},
+        {"id": theirs, "title": "stolen"},
+    ]}, headers=owner)
+    assert response.json()["succeeded"] == [mine]
+    assert failed(response.json()) == {1: "Memo not found"}
+    assert client.get(f"/api/v1/memos/{theirs}", headers=other).json()["title"] == "theirs"
+
+    response = client.post("/api/v1/memos/bulk-delete", json={"ids": [mine, theirs, mine]}, headers=owner)
+    assert response.json()["succeeded"] == [mine]
+    assert failed(response.json()) == {1: "Memo not found", 2: "Duplicate id"}
+    assert client.get(f"/api/v1/memos/{theirs}", headers=other).status_code == 200
+
+
+def test_bulk_create_alarms(client, owner, other):
+    mine = create_memo(client, owner)
+    theirs = create_memo(client, other)
+
+    response = client.post("/api/v1/alarms/bulk", json={"items": [
+        {"memo_id": mine, **ALARM},
+        {"memo_id": theirs, **ALARM},
+        {"memo_id": mine, **ALARM, "scheduled_time": "12:60"},
+        {"memo_id": mine, **ALARM, "user_timezone": "Not/AZone"},
+    ]}, headers=owner)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result["succeeded"]) == 1
+    assert failed(result) == {
+        1: "Memo not found",
+        2: "Invalid scheduled_time: 12:60",
+        3: "Invalid timezone: Not/AZone",
+    }
+
+
+def test_bulk_update_alarms(client, owner, other):
+    memo_id = create_memo(client, owner)
+    first, second = create_alarm(client, owner, memo_id), create_alarm(client, owner, memo_id)
+    theirs = create_alarm(client, other, create_memo(client, other))
+
+    response = client.patch("/api/v1/alarms/bulk", json={"items": [
+        {"id": first, "scheduled_time": "10:30"},
+        {"id": second, "scheduled_time": "25:99"},
+        {"id": theirs, "enabled": False},
+        {"id": first, "enabled": False},
+    ]}, headers=owner)
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["succeeded"] == [first]
+    assert failed(result) == {1: "Invalid scheduled_time: 25:99", 2: "Alarm not found", 3: "Duplicate id"}
+    alarms = alarms_of(client, owner)
+    assert alarms[first]["scheduled_time"] == "10:30"
+    assert alarms[second]["scheduled_time"] == "09:00"
+    assert alarms_of(client, other)[theirs]["enabled"] is True
+
+
+def test_update_alarm_rejects_invalid_time(client, owner):
+    alarm_id = create_alarm(client, owner, create_memo(client, owner))
+
+    response = client.patch(f"/api/v1/alarms/{alarm_id}", json={"scheduled_time": "25:00"}, headers=owner)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid scheduled_time: 25:00"
+
+
+def test_bulk_delete_alarms(client, owner, other):
+    mine = create_alarm(client, owner, create_memo(client, owner))
+    theirs = create_alarm(client, other, create_memo(client, other))
+
+    response = client.post("/api/v1/alarms/bulk-delete", json={"ids": [theirs, mine, 10 ** 9]}, headers=owner)
+
+    assert response.json()["succeeded"] == [mine]
+    assert failed(response.json()) == {0: "Alarm not found", 2: "Alarm not found"}
+    assert mine not in alarms_of(client, owner)
+    assert theirs in alarms_of(client, other)
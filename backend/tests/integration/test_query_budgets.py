@@ -0,0 +1,35 @@
+"""Query budgets for the hot service paths (cases from benchmarks.query_budgets).
+
+Each path runs once with cold caches against a seeded database. The
+scheduler tick is checked at two sizes, so a per-alarm reload shows up as
+a budget failure rather than a slower tick.
+"""
+
+import pytest
+from benchmarks.query_budgets import cases, seed
+from src.database import Base, SessionLocal, get_engine
+from src.services.user_service import get_profile_cache
+from src.utils.cache import get_cache
+from src.utils.query_stats import query_budget
+
+DUE_ALARMS = (10, 40)
+
+
+@pytest.fixture(params=DUE_ALARMS, scope="module")
+def due_alarms(request):
+    Base.metadata.drop_all(get_engine())
+    seed(memos=60, due_alarms=request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("index", range(len(cases(0))), ids=[name for name, _, _ in cases(0)])
+def test_query_budget(due_alarms, index):
+    name, budget, fn = cases(due_alarms)[index]
+    get_cache().invalidate_all()
+    get_profile_cache().clear()
+    db = SessionLocal()
+    try:
+        with query_budget(budget):
+            fn(db)
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+"""Tests for statement counting and query budgets."""
+
+import pytest
+from sqlalchemy import text
+from src.database import SessionLocal
+from src.utils.query_stats import QueryBudgetExceeded, query_budget, track_queries
+
+
+def test_track_queries_counts_statements():
+    db = SessionLocal()
+    try:
+        with track_queries(record_statements=True) as queries:
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+    finally:
+        db.close()
+    assert queries.count == 2
+    assert queries.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_query_budget_fails_with_the_statements():
+    db = SessionLocal()
+    try:
+        with pytest.raises(QueryBudgetExceeded, match="SELECT 2"):
+            with query_budget(1):
+                db.execute(text("SELECT 1"))
+                db.execute(text("SELECT 2"))
+    finally:
+        db.close()
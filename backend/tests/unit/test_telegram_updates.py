@@ -0,0 +1,24 @@
+"""Telegram update processing: acknowledged updates that fail still get a reply."""
+
+from src.services import telegram_webhook_service as webhook
+from src.services.telegram_linking_service import TelegramLinkingService
+
+
+def start_update(update_id, text, chat_id=42):
+    return {"update_id": update_id, "message": {"text": text, "chat": {"id": chat_id}}}
+
+
+def test_failed_redemption_asks_the_user_to_resend(monkeypatch):
+    def redeem_code(db, code, chat_id):
+        if code == "broken":
+            raise RuntimeError("database is locked")
+        return 1
+    monkeypatch.setattr(TelegramLinkingService, "redeem_code", staticmethod(redeem_code))
+
+    replies = webhook.process_updates([
+        start_update(1, "/start broken"),
+        start_update(2, "/start good", chat_id=43),
+        start_update(3, "hello"),
+    ])
+
+    assert replies == [("42", webhook.RETRY_REPLY), ("43", webhook.LINKED_REPLY)]
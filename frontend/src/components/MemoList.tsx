@@ -46,7 +46,7 @@ const MemoList: React.FC<MemoListProps> = ({
     setError("");
 
     try {
-      const response = await apiClient.get("/memos?skip=0&limit=50");
+      const response = await apiClient.get("/memos?limit=50&include=alarms");
       const data = response.data;
       const memoItems = Array.isArray(data) ? data : data?.items || [];
       const totalCount = Array.isArray(data)
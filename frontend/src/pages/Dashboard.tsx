@@ -2,7 +2,7 @@
  * Dashboard page - with UpcomingAlarms summary and enhanced UX
  */
 
-import React, { useState } from "react";
+import React, { useEffect, useState } from "react";
 import MemoForm from "../components/MemoForm";
 import MemoList from "../components/MemoList";
 import Header from "../components/Header";
@@ -10,6 +10,7 @@ import UpcomingAlarms from "../components/UpcomingAlarms";
 import Toast from "../components/Toast";
 import { detectUserTimezone } from "../utils/timezone";
 import { useAuth } from "../context/AuthContext";
+import { subscribeToEvents } from "../services/events";
 
 interface Memo {
   id: string;
@@ -25,6 +26,16 @@ const Dashboard: React.FC = () => {
   const [loadedMemos, setLoadedMemos] = useState<Memo[]>([]);
   const userTimezone = detectUserTimezone();
 
+  // Refresh when an alarm is delivered (or events were missed)
+  useEffect(() => {
+    return subscribeToEvents((event) => {
+      if (event.type === 'alarm.delivery' && event.delivery_status === 'failed') {
+        setToast({ message: 'Alarm delivery failed', type: 'error' });
+      }
+      setRefreshTrigger((prev) => prev + 1);
+    });
+  }, [user]);
+
   const handleMemoCreated = () => {
     setToast({ message: 'Saved!', type: 'success' });
     setRefreshTrigger((prev) => prev + 1);
@@ -0,0 +1,92 @@
+/**
+ * Live event stream (Server-Sent Events) from GET /events
+ */
+
+import api from './api';
+
+const API_BASE_URL =
+  import.meta.env.VITE_API_BASE_URL || "http://localhost:8000/api/v1";
+
+export interface AlarmDeliveryEvent {
+  type: 'alarm.delivery';
+  alarm_id: number;
+  memo_id: number;
+  delivery_status: string;
+  error_message: string | null;
+  triggered_at: string;
+  next_trigger_time: string | null;
+}
+
+export type LiveEvent = AlarmDeliveryEvent | { type: 'resync' };
+
+// Reconnect delay after the stream drops, doubled up to the maximum
+const RETRY_MIN_MS = 5000;
+const RETRY_MAX_MS = 60000;
+
+/**
+ * Subscribe to the current user's events; returns a function that closes the stream.
+ * EventSource cannot send headers, so each connection opens with a single-use
+ * ticket from POST /events/ticket. When the stream drops (or ends with the access
+ * token) it reconnects with a new ticket and emits `resync`, since events may have
+ * been missed meanwhile.
+ */
+export const subscribeToEvents = (onEvent: (event: LiveEvent) => void): (() => void) => {
+  if (!localStorage.getItem('access_token')) {
+    return () => {};
+  }
+
+  let source: EventSource | null = null;
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  let closed = false;
+  let connected = false;
+  let delay = RETRY_MIN_MS;
+
+  const reconnect = () => {
+    if (closed) return;
+    timer = setTimeout(connect, delay);
+    delay = Math.min(delay * 2, RETRY_MAX_MS);
+  };
+
+  const connect = async () => {
+    let ticket: string;
+    try {
+      // A 401 here logs the user out (see the api interceptor)
+      const response = await api.post<{ ticket: string }>('/events/ticket');
+      ticket = response.data.ticket;
+    } catch (error) {
+      reconnect();
+      return;
+    }
+    if (closed) return;
+
+    source = new EventSource(`${API_BASE_URL}/events?ticket=${encodeURIComponent(ticket)}`);
+    source.onopen = () => {
+      delay = RETRY_MIN_MS;
+      if (connected) {
+        onEvent({ type: 'resync' });
+      }
+      connected = true;
+    };
+    source.onmessage = (message) => {
+      try {
+        onEvent(JSON.parse(message.data));
+      } catch (error) {
+        console.error('Invalid event:', error);
+      }
+    };
+    // The browser's own retry would reuse the spent ticket
+    source.onerror = () => {
+      source?.close();
+      source = null;
+      reconnect();
+    };
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(timer);
+    source?.close();
+  };
+};